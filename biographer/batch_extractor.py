@@ -41,6 +41,13 @@ COSTS = {
 
 BUDGET_LIMIT = 50.0  # Maximum spend
 
+# Patterns used per line while splitting sources, and to recover the JSON
+# response - compiled once
+TIMESTAMP_LINE_RE = re.compile(r'^\d{1,2}:\d{2}$')
+WEEKDAY_LINE_RE = re.compile(r'^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)')
+JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
 
 @dataclass
 class SourceDocument:
@@ -167,7 +174,7 @@ class BatchExtractor:
                 continue
 
             # Check if we've hit a timestamp (video transcript starting)
-            if re.match(r'^\d{1,2}:\d{2}$', stripped):
+            if TIMESTAMP_LINE_RE.match(stripped):
                 # End of Bill's prompt, video transcript starting
                 if current_prompt:
                     bill_messages.append('\n'.join(current_prompt))
@@ -216,7 +223,7 @@ class BatchExtractor:
             stripped = line.strip()
 
             # Timestamp line pattern
-            if re.match(r'^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)', stripped):
+            if WEEKDAY_LINE_RE.match(stripped):
                 if current_message and in_bill_message:
                     bill_messages.append('\n'.join(current_message))
                 current_message = []
@@ -455,11 +462,11 @@ Type: {doc.source_type}
         # Parse response
         text = response.content[0].text
         try:
-            json_match = re.search(r'\{[\s\S]*\}', text)
+            json_match = JSON_OBJECT_RE.search(text)
             if json_match:
                 json_str = json_match.group()
                 # Fix common JSON issues
-                json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
+                json_str = TRAILING_COMMA_RE.sub(r'\1', json_str)
                 result = json.loads(json_str)
                 return result
         except Exception as e:
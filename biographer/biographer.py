@@ -1,6 +1,7 @@
 """Biographer brain - Claude-powered interviewer for Bill's life story."""
 
 import os
+import re
 import sqlite3
 import json
 from pathlib import Path
@@ -21,6 +22,18 @@ try:
 except ImportError:
     LOGGING_AVAILABLE = False
 
+try:
+    from .db import open_connection
+except ImportError:
+    from db import open_connection  # Run directly as a script
+
+# Extraction response recovery patterns, compiled once
+JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+FACTUAL_ARRAY_RE = re.compile(r'"factual_extractions"\s*:\s*\[([\s\S]*?)\](?=\s*,\s*"|\s*})')
+INFERENTIAL_ARRAY_RE = re.compile(r'"inferential_extractions"\s*:\s*\[([\s\S]*?)\](?=\s*,\s*"|\s*})')
+RAW_TRANSCRIPTION_RE = re.compile(r'"raw_transcription"\s*:\s*"([\s\S]*?)"(?=\s*,\s*"|\s*})')
+
 
 class Biographer:
     """The AI interviewer that conducts biographical conversations with Bill."""
@@ -105,7 +118,7 @@ class Biographer:
     def _analyze_gaps(self):
         """Analyze the database to identify underrepresented categories."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = open_connection(self.db_path, readonly=True)
             cursor = conn.cursor()
 
             # Categories we care about and their friendly names
@@ -375,7 +388,7 @@ If appropriate, you might gently explore something with more depth.
         context_parts = []
 
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = open_connection(self.db_path, readonly=True)
             cursor = conn.cursor()
 
             # Get self_knowledge entries
@@ -585,7 +598,7 @@ Generate a warm, brief opening that introduces yourself as his biographer and pr
         try:
             from .multi_pass_extraction import MultiPassExtractor
             extractor = MultiPassExtractor()
-            result = extractor.extract_all(conv_text)
+            result = extractor.extract_all_sync(conv_text)
             result['raw_transcription'] = conv_text
             return result
         except Exception as e:
@@ -619,10 +632,8 @@ Generate a warm, brief opening that introduces yourself as his biographer and pr
 
         # Find JSON block and try to parse it
         try:
-            import re
-
             # Try to find and parse JSON
-            json_match = re.search(r'\{[\s\S]*\}', text)
+            json_match = JSON_OBJECT_RE.search(text)
             if json_match:
                 json_str = json_match.group()
 
@@ -632,7 +643,7 @@ Generate a warm, brief opening that introduces yourself as his biographer and pr
                 except json.JSONDecodeError:
                     # Try fixing common JSON issues
                     # Remove trailing commas before } or ]
-                    json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
+                    json_str = TRAILING_COMMA_RE.sub(r'\1', json_str)
                     # Try again
                     try:
                         result = json.loads(json_str)
@@ -682,11 +693,10 @@ Generate a warm, brief opening that introduces yourself as his biographer and pr
 
     def _extract_partial_json(self, text: str) -> Dict[str, Any]:
         """Try to extract partial JSON data when full parsing fails."""
-        import re
         result = {}
 
         # Try to find factual_extractions array
-        factual_match = re.search(r'"factual_extractions"\s*:\s*\[([\s\S]*?)\](?=\s*,\s*"|\s*})', text)
+        factual_match = FACTUAL_ARRAY_RE.search(text)
         if factual_match:
             try:
                 result['factual_extractions'] = json.loads('[' + factual_match.group(1) + ']')
@@ -694,7 +704,7 @@ Generate a warm, brief opening that introduces yourself as his biographer and pr
                 result['factual_extractions'] = []
 
         # Try to find inferential_extractions array
-        inferential_match = re.search(r'"inferential_extractions"\s*:\s*\[([\s\S]*?)\](?=\s*,\s*"|\s*})', text)
+        inferential_match = INFERENTIAL_ARRAY_RE.search(text)
         if inferential_match:
             try:
                 result['inferential_extractions'] = json.loads('[' + inferential_match.group(1) + ']')
@@ -702,7 +712,7 @@ Generate a warm, brief opening that introduces yourself as his biographer and pr
                 result['inferential_extractions'] = []
 
         # Try to find raw_transcription
-        transcription_match = re.search(r'"raw_transcription"\s*:\s*"([\s\S]*?)"(?=\s*,\s*"|\s*})', text)
+        transcription_match = RAW_TRANSCRIPTION_RE.search(text)
         if transcription_match:
             result['raw_transcription'] = transcription_match.group(1)
 
@@ -724,8 +734,7 @@ Generate a warm, brief opening that introduces yourself as his biographer and pr
             )
 
             text = response.content[0].text
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', text)
+            json_match = JSON_OBJECT_RE.search(text)
             if json_match:
                 result = json.loads(json_match.group())
                 result['raw_transcription'] = conv_text
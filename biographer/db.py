@@ -0,0 +1,46 @@
+"""
+Opening connections to the knowledge base.
+
+The app's everyday connections (the enricher, the interviewer's context
+reads, setup_database and the db_pool connections) go through
+open_connection so each gets the same settings from its first query,
+instead of each call site remembering (or forgetting) its own PRAGMAs.
+The schema upgrade scripts, manual_extraction (autocommit with an
+in-memory staging database) and batch_extractor's one-off read still
+open their own connections.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Optional, Union
+
+# Per-connection settings: WAL with NORMAL sync needs one fsync per
+# commit (none per statement), a 64 MB page cache and 256 MB of the file
+# memory-mapped, and temp structures stay in RAM
+CONNECTION_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "foreign_keys=ON",
+    "cache_size=-65536",
+    "mmap_size=268435456",
+    "temp_store=MEMORY",
+)
+
+
+def open_connection(path: Union[str, Path], readonly: bool = False,
+                    page_size: Optional[int] = None) -> sqlite3.Connection:
+    """Connect to path with CONNECTION_PRAGMAS applied.
+
+    page_size only takes effect on a new database, and only before it is
+    switched to WAL, so it is set first. Read-only connections refuse
+    writes (PRAGMA query_only).
+    """
+    # Connections may be handed to worker threads (see db_pool)
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    if page_size:
+        conn.execute(f"PRAGMA page_size={page_size}")
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    if readonly:
+        conn.execute("PRAGMA query_only=ON")
+    return conn
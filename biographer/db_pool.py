@@ -0,0 +1,106 @@
+"""
+Shared SQLite connections for the GUI and visualizations.
+
+Opening a connection per query throws away SQLite's page cache each
+time. A pool keeps a few read-only connections open so the vector store
+sync and repeated chart generations reuse warm caches. Writes go through
+the enricher's own connections.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Union
+
+try:
+    from .db import open_connection
+except ImportError:
+    from db import open_connection  # Run directly as a script
+
+# Read connections kept per database
+DEFAULT_READERS = min(4, os.cpu_count() or 1)
+
+
+class SQLitePool:
+    """Up to `readers` read-only connections to one database."""
+
+    def __init__(self, db_path: Union[str, Path], readers: int = DEFAULT_READERS):
+        self.db_path = str(db_path)
+        self.readers = readers
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._open_lock = threading.Lock()
+        self._closed = False
+
+    def _get_reader(self) -> sqlite3.Connection:
+        """Pop the most recently used idle reader, opening one if allowed."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed pool.")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._open_lock:
+            if self._opened < self.readers:
+                self._opened += 1
+                return open_connection(self.db_path, readonly=True)
+        return self._idle.get()
+
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read connection for the duration of a with block."""
+        conn = self._get_reader()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._release(conn)
+
+    def _release(self, conn: sqlite3.Connection):
+        """Return a borrowed reader, closing it if the pool has shut down."""
+        with self._open_lock:
+            if not self._closed:
+                self._idle.put(conn)
+                return
+            self._opened -= 1
+        conn.close()
+
+    def close(self):
+        """Close every idle connection. Borrowed ones close when returned."""
+        with self._open_lock:
+            self._closed = True
+            idle = []
+            while True:
+                try:
+                    idle.append(self._idle.get_nowait())
+                except queue.Empty:
+                    break
+            self._opened -= len(idle)
+        for conn in idle:
+            conn.close()
+
+
+_pools: Dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Union[str, Path]) -> SQLitePool:
+    """The shared pool for db_path, created on first use."""
+    key = str(Path(db_path).resolve())
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = SQLitePool(key)
+        return _pools[key]
+
+
+def close_pools():
+    """Close every shared pool (on application shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -6,12 +6,19 @@ Enables querying memories by meaning rather than keywords.
 
 import os
 import sqlite3
+import hashlib
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import json
 
 import chromadb
 from chromadb.config import Settings
+
+try:
+    from .db_pool import get_pool
+except ImportError:
+    from db_pool import get_pool  # Run directly as a script
 from sentence_transformers import SentenceTransformer
 import numpy as np
 
@@ -20,6 +27,11 @@ SOUL_DIR = Path(__file__).parent.parent
 VECTOR_DB_PATH = SOUL_DIR / "vector_db"
 SQLITE_DB_PATH = SOUL_DIR / "bill_knowledge_base.db"
 
+# Persistent embedding cache, keyed by sha256(model + text)
+EMBEDDING_CACHE_PATH = VECTOR_DB_PATH / "embedding_cache.db"
+EMBEDDING_CACHE_SIZE = 10000  # vectors kept in memory
+EMBED_BATCH_SIZE = 128  # texts per encode/upsert during sync
+
 # Tables to embed (all 27+ cognitive architecture tables)
 EMBEDDABLE_TABLES = [
     # Original core tables
@@ -106,11 +118,22 @@ class VectorStore:
         print(f"Loading embedding model: {model_name}...")
 
         # Load embedding model
+        self.model_name = model_name
         self.model = SentenceTransformer(model_name, trust_remote_code=True)
 
         # Ensure vector DB directory exists
         VECTOR_DB_PATH.mkdir(parents=True, exist_ok=True)
 
+        # Embedding cache: in-memory LRU over a write-through sqlite table
+        self.cache_conn = sqlite3.connect(EMBEDDING_CACHE_PATH, check_same_thread=False)
+        self.cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache (hash TEXT PRIMARY KEY, vector BLOB)"
+        )
+        self.embedding_cache = OrderedDict(self.cache_conn.execute(
+            "SELECT hash, vector FROM embedding_cache ORDER BY rowid DESC LIMIT ?",
+            (EMBEDDING_CACHE_SIZE,)
+        ).fetchall()[::-1])
+
         # Initialize ChromaDB with persistent storage
         self.chroma_client = chromadb.PersistentClient(
             path=str(VECTOR_DB_PATH),
@@ -123,20 +146,85 @@ class VectorStore:
             metadata={"description": "Bill Cornelius cognitive substrate embeddings"}
         )
 
-        print(f"Vector store ready. Collection has {self.collection.count()} entries.")
+        # Entry count, cached until this store writes to the collection
+        self._entry_count: Optional[int] = None
+
+        print(f"Vector store ready. Collection has {self.get_entry_count()} entries.")
+
+    def cache_key(self, prefixed_text: str) -> str:
+        """Hash the model name and text into an embedding cache key."""
+        return hashlib.sha256(f"{self.model_name}\0{prefixed_text}".encode('utf-8')).hexdigest()
+
+    def get_cached(self, key: str) -> Optional[np.ndarray]:
+        """Look up a vector in memory, then on disk. None on a miss."""
+        blob = self.embedding_cache.get(key)
+        if blob is not None:
+            self.embedding_cache.move_to_end(key)
+        else:
+            row = self.cache_conn.execute(
+                "SELECT vector FROM embedding_cache WHERE hash = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            blob = row[0]
+            self.remember(key, blob)
+        return np.frombuffer(blob, dtype=np.float32)
+
+    def remember(self, key: str, blob: bytes) -> None:
+        """Add a vector to the in-memory LRU, evicting the oldest."""
+        self.embedding_cache[key] = blob
+        self.embedding_cache.move_to_end(key)
+        while len(self.embedding_cache) > EMBEDDING_CACHE_SIZE:
+            self.embedding_cache.popitem(last=False)
+
+    def encode_cached_batch(self, prefixed_texts: List[str]) -> List[List[float]]:
+        """Encode many texts at once, only running the model on cache misses."""
+        keys = [self.cache_key(t) for t in prefixed_texts]
+        embeddings = [self.get_cached(k) for k in keys]
+
+        missing = [i for i, e in enumerate(embeddings) if e is None]
+        if missing:
+            encoded = self.model.encode(
+                [prefixed_texts[i] for i in missing],
+                batch_size=EMBED_BATCH_SIZE,
+                convert_to_numpy=True
+            ).astype(np.float32)
+            rows = []
+            for i, embedding in zip(missing, encoded):
+                blob = embedding.tobytes()
+                rows.append((keys[i], blob))
+                self.remember(keys[i], blob)
+                embeddings[i] = embedding
+            self.cache_conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (hash, vector) VALUES (?, ?)", rows
+            )
+            self.cache_conn.commit()
+
+        return [e.tolist() for e in embeddings]
+
+    def encode_cached(self, prefixed_text: str) -> List[float]:
+        """Encode text, reusing a cached vector when the text was seen before."""
+        key = self.cache_key(prefixed_text)
+        embedding = self.get_cached(key)
+        if embedding is None:
+            embedding = self.model.encode(prefixed_text, convert_to_numpy=True).astype(np.float32)
+            blob = embedding.tobytes()
+            self.cache_conn.execute(
+                "INSERT OR REPLACE INTO embedding_cache (hash, vector) VALUES (?, ?)",
+                (key, blob)
+            )
+            self.cache_conn.commit()
+            self.remember(key, blob)
+        return embedding.tolist()
 
     def embed_text(self, text: str) -> List[float]:
         """Convert text to a 768-dimensional embedding vector."""
         # nomic-embed-text requires a task prefix for best results
-        prefixed_text = f"search_document: {text}"
-        embedding = self.model.encode(prefixed_text, convert_to_numpy=True)
-        return embedding.tolist()
+        return self.encode_cached(f"search_document: {text}")
 
     def embed_query(self, query: str) -> List[float]:
         """Embed a search query (uses different prefix for queries)."""
-        prefixed_query = f"search_query: {query}"
-        embedding = self.model.encode(prefixed_query, convert_to_numpy=True)
-        return embedding.tolist()
+        return self.encode_cached(f"search_query: {query}")
 
     def add_entry(self, entry_id: str, text: str, metadata: Dict[str, Any]) -> None:
         """Add a single entry to the vector database."""
@@ -154,6 +242,22 @@ class VectorStore:
             documents=[text],
             metadatas=[clean_metadata]
         )
+        self._entry_count = None
+
+    def add_entries(self, entries: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+        """Add a batch of (entry_id, text, metadata) with one encode and one upsert."""
+        embeddings = self.encode_cached_batch([f"search_document: {text}" for _, text, _ in entries])
+
+        self.collection.upsert(
+            ids=[entry_id for entry_id, _, _ in entries],
+            embeddings=embeddings,
+            documents=[text for _, text, _ in entries],
+            metadatas=[
+                {k: str(v) if v is not None else "" for k, v in metadata.items()}
+                for _, _, metadata in entries
+            ]
+        )
+        self._entry_count = None
 
     def query(
         self,
@@ -216,7 +320,9 @@ class VectorStore:
 
     def get_entry_count(self) -> int:
         """Get the number of entries in the vector database."""
-        return self.collection.count()
+        if self._entry_count is None:
+            self._entry_count = self.collection.count()
+        return self._entry_count
 
     def sync_from_sqlite(self, progress_callback=None) -> int:
         """
@@ -231,9 +337,17 @@ class VectorStore:
         if not SQLITE_DB_PATH.exists():
             raise FileNotFoundError(f"SQLite database not found: {SQLITE_DB_PATH}")
 
-        conn = sqlite3.connect(SQLITE_DB_PATH)
-        conn.row_factory = sqlite3.Row
+        with get_pool(SQLITE_DB_PATH).acquire() as conn:
+            total_synced = self._sync_tables(conn, progress_callback)
+
+        print(f"Sync complete. {total_synced} entries in vector database.")
+        return total_synced
+
+    def _sync_tables(self, conn: sqlite3.Connection, progress_callback=None) -> int:
+        """Embed every row of EMBEDDABLE_TABLES read through conn."""
+        # Row access by name for this cursor only; conn is a shared pooled connection
         cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
         total_synced = 0
         total_entries = 0
@@ -261,6 +375,7 @@ class VectorStore:
 
             print(f"  Processing {table}: {len(rows)} entries...")
 
+            pending = []
             for row in rows:
                 row_dict = dict(row)
 
@@ -286,7 +401,7 @@ class VectorStore:
                 text = "\n".join(text_parts)
 
                 # Create unique ID
-                entry_id = f"{table}_{row_dict.get('id', current)}"
+                entry_id = f"{table}_{row_dict.get('id', current + len(pending))}"
 
                 # Metadata
                 metadata = {
@@ -295,33 +410,40 @@ class VectorStore:
                     'category': str(row_dict.get('category', row_dict.get('aspect', ''))),
                 }
 
+                pending.append((entry_id, text, metadata))
+
+            # Embed and upsert in batches instead of one row at a time
+            for start in range(0, len(pending), EMBED_BATCH_SIZE):
+                batch = pending[start:start + EMBED_BATCH_SIZE]
                 try:
-                    self.add_entry(entry_id, text, metadata)
-                    total_synced += 1
+                    self.add_entries(batch)
+                    total_synced += len(batch)
                 except Exception as e:
-                    print(f"    Error adding {entry_id}: {e}")
+                    print(f"    Error adding {batch[0][0]}..{batch[-1][0]}: {e}")
 
-                current += 1
+                current += len(batch)
                 if progress_callback:
                     progress_callback(current, total_entries)
 
-        conn.close()
-        print(f"Sync complete. {total_synced} entries in vector database.")
         return total_synced
 
-    def cluster(self, n_clusters: int = 10) -> List[Dict[str, Any]]:
+    def cluster(self, n_clusters: int = 10, all_data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Group all memories into semantic clusters.
 
+        all_data is an already-loaded collection.get() result (embeddings,
+        documents, metadatas); it is fetched when not given.
+
         Returns list of clusters with representative samples.
         """
         # Get all embeddings
-        all_data = self.collection.get(include=['embeddings', 'documents', 'metadatas'])
+        if all_data is None:
+            all_data = self.collection.get(include=['embeddings', 'documents', 'metadatas'])
 
         if all_data['embeddings'] is None or len(all_data['embeddings']) == 0:
             return []
 
-        embeddings = np.array(all_data['embeddings'])
+        embeddings = np.asarray(all_data['embeddings'])
 
         # Use K-means clustering
         from sklearn.cluster import KMeans
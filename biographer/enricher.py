@@ -3,14 +3,12 @@
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple, TYPE_CHECKING
 
-# Optional imports for vector sync
-try:
+# Only needed for the type hint; importing embeddings loads chromadb and
+# sentence-transformers, which the enricher itself never uses
+if TYPE_CHECKING:
     from .embeddings import VectorStore
-    VECTOR_AVAILABLE = True
-except ImportError:
-    VECTOR_AVAILABLE = False
 
 try:
     from .logger import SessionLogger, system_log
@@ -18,6 +16,27 @@ try:
 except ImportError:
     LOGGING_AVAILABLE = False
 
+try:
+    from .db import open_connection
+    from .setup_database import SIGNIFICANCE_RANGE, YEAR_RANGE
+except ImportError:
+    from db import open_connection  # Run directly as a script
+    from setup_database import SIGNIFICANCE_RANGE, YEAR_RANGE
+
+
+def _bounded_int(value: Any, bounds: Tuple[int, int], default: Optional[int] = None) -> Optional[int]:
+    """value as an int inside bounds (the schema's CHECK range), else default.
+
+    Extracted values like "1970s" or 11 would otherwise make the insert
+    fail and the whole entry be lost.
+    """
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return default
+    low, high = bounds
+    return number if low <= number <= high else default
+
 
 class DatabaseEnricher:
     """Handles adding new information from conversations to the knowledge database."""
@@ -53,7 +72,7 @@ class DatabaseEnricher:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection."""
-        return sqlite3.connect(self.db_path)
+        return open_connection(self.db_path)
 
     def _sync_to_vector_db(self, table: str, entry_id: int, text: str) -> bool:
         """Immediately sync a new entry to the vector database."""
@@ -309,7 +328,7 @@ class DatabaseEnricher:
                 ext.get('analysis', ''),
                 ext.get('what_it_reveals', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -334,7 +353,7 @@ class DatabaseEnricher:
                 ext.get('analysis', ''),
                 ext.get('sub_category', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -429,7 +448,7 @@ class DatabaseEnricher:
                 ext.get('sub_category', ''),
                 ext.get('insight', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -524,7 +543,7 @@ class DatabaseEnricher:
                 ext.get('sub_category', ''),
                 ext.get('insight', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -649,7 +668,7 @@ class DatabaseEnricher:
                 ext.get('impact', ''),
                 ext.get('analysis', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -676,7 +695,7 @@ class DatabaseEnricher:
                 ext.get('analysis', ''),
                 ext.get('healing_status', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -703,7 +722,7 @@ class DatabaseEnricher:
                 ext.get('impact', ''),
                 ext.get('analysis', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -729,7 +748,7 @@ class DatabaseEnricher:
                 ext.get('time_period', ''),
                 ext.get('analysis', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -755,7 +774,7 @@ class DatabaseEnricher:
                 ext.get('analysis', ''),
                 ext.get('time_period', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -782,7 +801,7 @@ class DatabaseEnricher:
                 ext.get('time_period', ''),
                 ext.get('current_status', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -808,7 +827,7 @@ class DatabaseEnricher:
                 ext.get('sub_category', ''),
                 ext.get('related_to', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -833,7 +852,7 @@ class DatabaseEnricher:
                 ext.get('analysis', ''),
                 ext.get('sub_category', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -858,7 +877,7 @@ class DatabaseEnricher:
                 ext.get('sub_category', ''),
                 ext.get('analysis', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -884,7 +903,7 @@ class DatabaseEnricher:
                 ext.get('sub_category', ''),
                 ext.get('time_period', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat()
             ))
             conn.commit()
@@ -910,12 +929,12 @@ class DatabaseEnricher:
                 ext.get('insight', ''),
                 ext.get('analysis', ''),
                 ext.get('evidence', ''),
-                ext.get('significance', 5),
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5),
                 datetime.now().isoformat(),
                 ext.get('source_quote', ''),
                 ext.get('evidence_type', ''),
                 ext.get('life_period', ''),
-                ext.get('approximate_year'),
+                _bounded_int(ext.get('approximate_year'), YEAR_RANGE),
                 ext.get('prompt_version', '')
             ))
             conn.commit()
@@ -947,7 +966,7 @@ class DatabaseEnricher:
                 ext.get('source_quote', ''),
                 ext.get('evidence_type', ''),
                 ext.get('life_period', ''),
-                ext.get('approximate_year'),
+                _bounded_int(ext.get('approximate_year'), YEAR_RANGE),
                 ext.get('prompt_version', ''),
                 datetime.now().isoformat()
             ))
@@ -979,7 +998,7 @@ class DatabaseEnricher:
                 ext.get('source_quote', ''),
                 ext.get('evidence_type', ''),
                 ext.get('life_period', ''),
-                ext.get('approximate_year'),
+                _bounded_int(ext.get('approximate_year'), YEAR_RANGE),
                 ext.get('prompt_version', ''),
                 datetime.now().isoformat()
             ))
@@ -1010,7 +1029,7 @@ class DatabaseEnricher:
                 ext.get('source_quote', ''),
                 ext.get('evidence_type', ''),
                 ext.get('life_period', ''),
-                ext.get('approximate_year'),
+                _bounded_int(ext.get('approximate_year'), YEAR_RANGE),
                 ext.get('prompt_version', ''),
                 datetime.now().isoformat()
             ))
@@ -1042,7 +1061,7 @@ class DatabaseEnricher:
                 ext.get('source_quote', ''),
                 ext.get('evidence_type', ''),
                 ext.get('life_period', ''),
-                ext.get('approximate_year'),
+                _bounded_int(ext.get('approximate_year'), YEAR_RANGE),
                 ext.get('prompt_version', ''),
                 datetime.now().isoformat()
             ))
@@ -1064,7 +1083,7 @@ class DatabaseEnricher:
             conn = self._get_connection()
             cursor = conn.cursor()
             cursor.execute("""
-                INSERT INTO entry_connections (entry_1_table, entry_1_title,
+                INSERT OR IGNORE INTO entry_connections (entry_1_table, entry_1_title,
                     entry_2_table, entry_2_title, connection_type, description,
                     source_pass, date_recorded)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
@@ -1152,7 +1171,7 @@ class DatabaseEnricher:
                 ext.get('insight', ''),
                 ext.get('time_period', ''),
                 ','.join(ext.get('related_topics', [])),
-                ext.get('significance', 5)
+                _bounded_int(ext.get('significance'), SIGNIFICANCE_RANGE, 5)
             ),
             'philosophies': lambda ext: self.add_self_knowledge(
                 'philosophy', ext.get('insight', ''), ext.get('evidence', '')
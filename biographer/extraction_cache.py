@@ -0,0 +1,56 @@
+"""
+Content-addressable cache of parsed extraction results.
+
+Keys are a SHA-256 over (model, prompt version, prompt/transcript text), so
+re-running an extraction on an unchanged session with unchanged prompts
+returns the stored entries instead of calling Claude again. Bumping the
+prompt version or switching model naturally misses.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+# One JSON file per key
+CACHE_DIR = Path(__file__).parent / "logs" / "extraction_cache"
+
+
+def make_key(*parts: str) -> str:
+    """Hash the parts into a cache key.
+
+    Each part is prefixed with its 8-byte length so different splits of the
+    same text ("ab" + "c" vs "a" + "bc") can never collide.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode('utf-8')
+        digest.update(len(data).to_bytes(8, 'big'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def get(key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached payload for key, or None on a miss."""
+    path = CACHE_DIR / f"{key}.json"
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def put(key: str, payload: Dict[str, Any]):
+    """Store payload under key, stamped with the time it was written."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    payload = dict(payload, timestamp=datetime.now().isoformat())
+
+    # Write then rename so a crash never leaves a half-written entry
+    path = CACHE_DIR / f"{key}.json"
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False)
+    tmp_path.replace(path)
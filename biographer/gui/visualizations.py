@@ -4,7 +4,10 @@ Interactive visualizations for exploring Bill's memories and life patterns.
 Uses Plotly for rich, interactive charts.
 """
 
+import hashlib
 import json
+import threading
+from concurrent.futures import Future
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import webbrowser
@@ -21,7 +24,6 @@ except ImportError:
 
 try:
     from sklearn.manifold import TSNE
-    from sklearn.cluster import KMeans
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
@@ -91,6 +93,72 @@ class MemoryVisualizer:
         self.output_dir = Path(tempfile.gettempdir()) / "cognitive_substrate_viz"
         self.output_dir.mkdir(exist_ok=True)
 
+        # Every entry's embedding, document and metadata, loaded once and
+        # shared by the charts (optionally in the background, see prefetch)
+        self._data: Optional[Dict[str, Any]] = None
+        self._prefetch: Optional[Future] = None
+
+    def _load_data(self) -> Dict[str, Any]:
+        """Read all entries from the vector store, embeddings as one float32 matrix."""
+        all_data = self.vector_store.collection.get(include=['embeddings', 'documents', 'metadatas'])
+
+        # Safely check for embeddings (handles None, empty list, and numpy arrays)
+        embeddings_data = all_data.get('embeddings')
+        if embeddings_data is None:
+            embeddings_data = []
+        return {
+            'embeddings': np.asarray(embeddings_data, dtype=np.float32),
+            'documents': all_data.get('documents') or [],
+            'metadatas': all_data.get('metadatas') or [],
+        }
+
+    def prefetch(self):
+        """Start loading entry data on a worker thread, e.g. while a menu is shown.
+
+        The thread is a daemon, so quitting never waits for the load.
+        """
+        if not PLOTLY_AVAILABLE or not self.vector_store or self._prefetch is not None:
+            return
+        future = Future()
+
+        def load():
+            try:
+                future.set_result(self._load_data())
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=load, daemon=True).start()
+        self._prefetch = future
+
+    def _get_data(self) -> Dict[str, Any]:
+        """Entry data, reused until the collection's size changes."""
+        if self._prefetch is not None:
+            future, self._prefetch = self._prefetch, None
+            self._data = future.result()
+        if self._data is None or len(self._data['documents']) != self.vector_store.collection.count():
+            self._data = self._load_data()
+        return self._data
+
+    def _project_2d(self, embeddings: 'np.ndarray') -> 'np.ndarray':
+        """t-SNE projection of embeddings, cached on disk by their content.
+
+        Re-opening the map over an unchanged collection (even in a later
+        run) loads the saved coordinates instead of re-running t-SNE.
+        """
+        perplexity = min(30, len(embeddings) - 1)
+        digest = hashlib.sha256(np.ascontiguousarray(embeddings).tobytes())
+        digest.update(f"{embeddings.shape}:{perplexity}".encode())
+        cache_path = self.output_dir / "projections" / f"{digest.hexdigest()}.npy"
+        if cache_path.exists():
+            return np.load(cache_path)
+
+        tsne = TSNE(n_components=2, random_state=42, perplexity=perplexity)
+        coords = tsne.fit_transform(embeddings)
+
+        cache_path.parent.mkdir(exist_ok=True)
+        np.save(cache_path, coords)
+        return coords
+
     def create_constellation_map(self, show: bool = True) -> Optional[str]:
         """
         Create a 2D map of all memories clustered by semantic similarity.
@@ -108,42 +176,23 @@ class MemoryVisualizer:
             print("No vector store provided")
             return None
 
-        # Get all data from ChromaDB
+        # Get all data from ChromaDB (already loaded if prefetched)
         print("Loading embeddings...")
-        collection = self.vector_store.collection
-        all_data = collection.get(include=['embeddings', 'documents', 'metadatas'])
-
-        # Safely check for embeddings (handles None, empty list, and numpy arrays)
-        embeddings_data = all_data.get('embeddings')
-        if embeddings_data is None:
-            print("No embeddings found")
-            return None
-
-        embeddings = np.array(embeddings_data)
+        data = self._get_data()
+        embeddings = data['embeddings']
         if embeddings.size == 0:
             print("No embeddings found")
             return None
-        documents = all_data['documents']
-        metadatas = all_data['metadatas']
+        documents = data['documents']
+        metadatas = data['metadatas']
 
         print(f"Reducing {len(embeddings)} embeddings to 2D...")
 
         # Use t-SNE for dimensionality reduction
-        tsne = TSNE(n_components=2, random_state=42, perplexity=min(30, len(embeddings)-1))
-        coords = tsne.fit_transform(embeddings)
-
-        # Cluster for coloring
-        n_clusters = min(10, len(embeddings) // 10)
-        if n_clusters > 1:
-            kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-            clusters = kmeans.fit_predict(embeddings)
-        else:
-            clusters = [0] * len(embeddings)
+        coords = self._project_2d(embeddings)
 
-        # Prepare data for plotting
+        # Prepare data for plotting (points are colored by table)
         tables = [m.get('source_table', 'unknown') for m in metadatas]
-        colors = [get_table_color(t) for t in tables]
-        texts = [d[:100] + '...' if len(d) > 100 else d for d in documents]
 
         # Create hover text
         hover_texts = []
@@ -222,12 +271,8 @@ class MemoryVisualizer:
             return None
 
         # Get table counts
-        collection = self.vector_store.collection
-        all_data = collection.get(include=['metadatas'])
-
-        # Safely check for metadatas
-        metadatas = all_data.get('metadatas')
-        if metadatas is None or len(metadatas) == 0:
+        metadatas = self._get_data()['metadatas']
+        if len(metadatas) == 0:
             return None
 
         # Count entries by table
@@ -286,8 +331,8 @@ class MemoryVisualizer:
         if not self.vector_store:
             return None
 
-        # Get clusters from vector store
-        clusters = self.vector_store.cluster(n_clusters=n_clusters)
+        # Get clusters from vector store, reusing the loaded embeddings
+        clusters = self.vector_store.cluster(n_clusters=n_clusters, all_data=self._get_data())
 
         if not clusters:
             return None
@@ -412,6 +457,18 @@ class MemoryVisualizer:
 
         return str(output_path)
 
+    def create_all(self, show: bool = True) -> Dict[str, Optional[str]]:
+        """
+        Create the constellation map, cluster view, heatmap and gap radar.
+        The entries are read once and t-SNE runs at most once for all four.
+        """
+        return {
+            'constellation': self.create_constellation_map(show=show),
+            'clusters': self.create_cluster_view(show=show),
+            'heatmap': self.create_theme_heatmap(show=show),
+            'gap_radar': self.create_gap_radar(show=show),
+        }
+
     def create_session_growth_chart(self, session_data: List[Dict], show: bool = True) -> Optional[str]:
         """
         Create a chart showing knowledge base growth over sessions.
@@ -468,14 +525,13 @@ class MemoryVisualizer:
             return None
 
         import sqlite3
+        from ..db_pool import get_pool
 
         # Default database path
         if db_path is None:
             db_path = Path(__file__).parent.parent.parent / "bill_knowledge_base.db"
 
         try:
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
 
             # Categories to track with target counts
             # Target represents "well-covered" for a comprehensive biography
@@ -497,16 +553,16 @@ class MemoryVisualizer:
                 'questions': {'target': 10, 'color': '#06b6d4', 'label': 'Questions'},
             }
 
-            # Get current counts
+            # Get current counts on a pooled connection (warm cache on repeat charts)
             current_counts = {}
-            for table in categories_info.keys():
-                try:
-                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                    current_counts[table] = cursor.fetchone()[0]
-                except sqlite3.Error:
-                    current_counts[table] = 0
-
-            conn.close()
+            with get_pool(db_path).acquire() as conn:
+                cursor = conn.cursor()
+                for table in categories_info.keys():
+                    try:
+                        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                        current_counts[table] = cursor.fetchone()[0]
+                    except sqlite3.Error:
+                        current_counts[table] = 0
 
             # Prepare data for radar chart
             categories = list(categories_info.keys())
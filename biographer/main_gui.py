@@ -22,6 +22,7 @@ from biographer.session import Session as SessionManager
 from biographer.voice_input import VoiceInput
 from biographer.voice_output import VoiceOutput
 from biographer.embeddings import VectorStore
+from biographer.db_pool import close_pools
 from biographer.logger import SessionLogger, system_log
 
 
@@ -593,6 +594,7 @@ class BiographerApp:
         self.running = True
         system_log.info("Starting Cognitive Substrate GUI")
         self.window.mainloop()
+        close_pools()
         system_log.info("GUI closed")
 
 
@@ -9,16 +9,28 @@ Version 2.0 improvements:
 - Experiential anchoring for emotional content
 - New categories: sensory_memories, creative_works, skills_competencies, aspirations
 
-Three passes:
+Three passes (run concurrently - they share only the transcript):
 1. FACTUAL PASS - People, events, stories, skills, creative works (40-80 entries)
 2. EMOTIONAL PASS - Joys, sorrows, wounds, fears, loves, sensory memories (20-40 entries)
 3. ANALYTICAL PASS - Patterns, wisdom, decisions, values, mortality (25-50 entries)
+
+With multipass=False (the CLI default; pass --multipass for the above) all
+three passes' categories go to Opus in one unified call instead.
 """
 
+import asyncio
+import hashlib
 import json
 import re
 import os
-from typing import List, Dict, Any, Optional, Tuple
+import sys
+import atexit
+import logging
+import queue
+import copy
+from logging.handlers import QueueHandler, QueueListener
+from collections import Counter, OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
@@ -26,112 +38,116 @@ from dotenv import load_dotenv
 # Load environment variables (API key)
 load_dotenv()
 
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 
-# Current prompt version - tag all extractions
-PROMPT_VERSION = "v2.0"
+try:
+    from . import extraction_cache, session_io
+except ImportError:
+    import extraction_cache, session_io  # Run directly as a script
 
+# Optional compiled validator for parsed entries
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
 
-class MultiPassExtractor:
-    """Extracts data from transcripts using multiple focused passes."""
+# Current prompt version - tag all extractions
+PROMPT_VERSION = "v2.3"
+
+# Per-pass checkpoints for the run in progress, so a crash in one pass
+# doesn't throw away the others. Removed once all three passes succeed.
+PARTIAL_DIR = Path(__file__).parent / ".extraction_partial"
+
+# Response clean-up and recovery patterns, compiled once
+FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$')
+TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+ENTRIES_START_RE = re.compile(r'"entries"\s*:\s*\[')
+OBJECT_RE = re.compile(r'\{[\s\S]*"entries"[\s\S]*\}')
+ARRAY_RE = re.compile(r'\[[\s\S]*\]')
+WORD_RE = re.compile(r'\S+')
+# Pure hesitation sounds. Words like "like" or "you know" are left alone
+# since they are often meaningful, as are [pause]/[laughs] markers, which
+# the emotional pass reads as behavioral evidence.
+FILLER_RE = re.compile(r'\b(?:um+|uh+|erm|hmm+)\b,?\s*', re.IGNORECASE)
+# Interviewer turns as labelled by Biographer.extract_insights ("BIOGRAPHER: ...")
+INTERVIEWER_PREFIX = "BIOGRAPHER:"
+# v2.0 entries with source_quote, then the simpler v1.0 shape
+ENTRY_RE = re.compile(r'\{\s*"category"\s*:\s*"([^"]+)"[^}]*"title"\s*:\s*"([^"]+)"[^}]*"insight"\s*:\s*"((?:[^"\\]|\\.)*)"[^}]*"source_quote"\s*:\s*"((?:[^"\\]|\\.)*)?"')
+SIMPLE_ENTRY_RE = re.compile(r'"category"\s*:\s*"([^"]+)"[^}]*"title"\s*:\s*"([^"]+)"[^}]*"insight"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Minimum shape an entry needs to be stored. Downstream code indexes these
+# fields directly, so anything missing them is dropped at parse time.
+ENTRY_SCHEMA = {
+    "type": "object",
+    "required": ["category", "title", "insight"],
+    "properties": {
+        "category": {"type": "string", "minLength": 1},
+        "title": {"type": "string", "minLength": 1},
+        "insight": {"type": "string"},
+        "source_quote": {"type": ["string", "null"]},
+    },
+}
+
+if FASTJSONSCHEMA_AVAILABLE:
+    ENTRY_VALIDATOR = fastjsonschema.compile(ENTRY_SCHEMA)
+
+
+def is_valid_entry(entry: Any) -> bool:
+    """Check an entry against ENTRY_SCHEMA."""
+    if FASTJSONSCHEMA_AVAILABLE:
+        try:
+            ENTRY_VALIDATOR(entry)
+            return True
+        except fastjsonschema.JsonSchemaException:
+            return False
 
-    # Hybrid model configuration (optimized based on comparative testing):
-    # - Opus excels at exhaustive factual extraction (68% more entries than Sonnet)
-    # - Sonnet matches or exceeds Opus on emotional and analytical passes
-    # - This hybrid saves ~53% on extraction costs while maintaining quality
-    OPUS_MODEL = "claude-opus-4-20250514"    # For Pass 1 (Factual) - exhaustive people/events
-    SONNET_MODEL = "claude-sonnet-4-20250514"  # For Pass 2 & 3 (Emotional, Analytical)
+    if not isinstance(entry, dict):
+        return False
+    for field in ('category', 'title'):
+        if not isinstance(entry.get(field), str) or not entry[field]:
+            return False
+    return (isinstance(entry.get('insight'), str)
+            and isinstance(entry.get('source_quote', ''), (str, type(None))))
 
-    def __init__(self):
-        self.client = Anthropic()
-        self.all_extractions = []
-        self.all_connections = []
 
-    def extract_all(self, transcript: str) -> Dict[str, Any]:
-        """Run all extraction passes on the transcript."""
-        self.all_extractions = []
-        self.all_connections = []
+def sha256_hex(text: str) -> str:
+    """Hex SHA-256 of a string, for cache and checkpoint keys."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
 
-        print("=" * 60)
-        print("MULTI-PASS EXTRACTION v2.0 (Hybrid: Opus+Sonnet)")
-        print("=" * 60)
-
-        # Pass 1: Factual extraction (people, events, stories, skills, works)
-        print(f"\n--- PASS 1: FACTUAL [Opus] (people, events, stories, skills, works) ---")
-        factual_entries, factual_connections = self._run_factual_pass(transcript)
-        self.all_extractions.extend(factual_entries)
-        self.all_connections.extend(factual_connections)
-        print(f"    Extracted: {len(factual_entries)} entries, {len(factual_connections)} connections")
-
-        # Pass 2: Emotional extraction
-        print(f"\n--- PASS 2: EMOTIONAL [Sonnet] (joys, sorrows, wounds, fears, loves, sensory) ---")
-        emotional_entries, emotional_connections = self._run_emotional_pass(transcript)
-        self.all_extractions.extend(emotional_entries)
-        self.all_connections.extend(emotional_connections)
-        print(f"    Extracted: {len(emotional_entries)} entries, {len(emotional_connections)} connections")
-
-        # Pass 3: Analytical extraction
-        print(f"\n--- PASS 3: ANALYTICAL [Sonnet] (patterns, wisdom, decisions, values, mortality) ---")
-        analytical_entries, analytical_connections = self._run_analytical_pass(transcript)
-        self.all_extractions.extend(analytical_entries)
-        self.all_connections.extend(analytical_connections)
-        print(f"    Extracted: {len(analytical_entries)} entries, {len(analytical_connections)} connections")
-
-        # Tag all entries with prompt version
-        for entry in self.all_extractions:
-            entry['prompt_version'] = PROMPT_VERSION
-            entry['action'] = 'insert'
 
-        # Summary
-        print("\n" + "=" * 60)
-        print(f"TOTAL: {len(self.all_extractions)} entries, {len(self.all_connections)} connections")
-
-        # Count by category
-        category_counts = {}
-        for ext in self.all_extractions:
-            cat = ext.get('category', 'unknown')
-            category_counts[cat] = category_counts.get(cat, 0) + 1
-
-        print("\nBy category:")
-        for cat, count in sorted(category_counts.items(), key=lambda x: -x[1]):
-            print(f"  {cat}: {count}")
+def read_pass_file(path: Path) -> Tuple[List[Dict], List[Dict]]:
+    """Load (entries, connections) saved by write_pass_file()."""
+    with open(path, 'rb') as f:
+        saved = session_io.loads(f.read())
+    return saved['entries'], saved['connections']
 
-        # Count entries with source_quote
-        quoted = sum(1 for e in self.all_extractions if e.get('source_quote'))
-        print(f"\nEntries with source_quote: {quoted}/{len(self.all_extractions)} ({100*quoted//max(1,len(self.all_extractions))}%)")
-        print("=" * 60)
 
-        return {
-            'extractions': self.all_extractions,
-            'connections': self.all_connections,
-            'category_counts': category_counts,
-            'raw_transcription': transcript,
-            'prompt_version': PROMPT_VERSION
-        }
+def write_pass_file(path: Path, entries: List[Dict], connections: List[Dict]):
+    """Save a pass's entries and connections as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'entries': entries, 'connections': connections}, f, ensure_ascii=False)
 
-    def _run_factual_pass(self, transcript: str) -> Tuple[List[Dict], List[Dict]]:
-        """Extract all factual data: people, events, stories, skills, creative works."""
 
-        prompt = f"""You are extracting FACTUAL AND NARRATIVE data from a biographical interview
-transcript. This is part of a cognitive substrate project — a comprehensive
-digital representation of the speaker's identity, memories, and personhood,
-designed to be rich enough that a future AI system could embody his perspective.
+# Shared by all three passes: who the speaker is, the output format and the
+# entry schema. Sent as its own cached system block ahead of the
+# pass instructions so the passes share one prefix (static first, dynamic last).
+SHARED_SCHEMA_BLOCK = """You are extracting data from a biographical interview transcript. This is
+part of a cognitive substrate project — a comprehensive digital
+representation of the speaker's identity, memories, and personhood,
+designed to be rich enough that a future AI system could embody his
+perspective. The speaker is Bill, age 61.
 
-The speaker is Bill, age 61. Other extraction passes will handle emotional
-content (Pass 2) and analytical/reflective content (Pass 3). Your job is to
-capture the FACTS, EVENTS, PEOPLE, STORIES, and CONCRETE KNOWLEDGE.
-
-OUTPUT FORMAT: Return ONLY a JSON object. No markdown. No explanations.
-{{
-  "entries": [ ...array of entry objects... ],
-  "connections": [ ...array of connection objects... ]
-}}
+Extraction runs in three passes (factual, emotional, analytical). Record
+every entry with the record_extraction tool. The entry schema below applies
+to every pass; the instructions for this pass follow it.
 
 ─────────────────────────────────────────────
 ENTRY SCHEMA (every entry MUST include ALL fields):
 ─────────────────────────────────────────────
-{{
-  "category": "one of the categories below",
+{
+  "category": "one of the categories for this pass",
   "title": "Brief, specific, descriptive (not generic)",
   "insight": "Detailed description with ALL specifics: names, places, dates,
               context, outcomes. Minimum 2-3 sentences for significant items.",
@@ -142,7 +158,7 @@ ENTRY SCHEMA (every entry MUST include ALL fields):
   "life_period": "childhood | adolescence | young_adult | early_career |
                   mid_life | later_life | recent | ongoing | unknown",
   "approximate_year": null or integer
-}}
+}
 
 EVIDENCE_TYPE definitions:
 - direct_statement: Bill explicitly said this in these or very similar words
@@ -151,6 +167,109 @@ EVIDENCE_TYPE definitions:
   it directly. You MUST explain your reasoning in the insight field.
 - behavioral_observation: Something about Bill's behavior during the session
   (animation, deflection, laughter, voice change, long pause)
+"""
+
+# Connections are found in a separate, small call per pass that only sees
+# the pass's entry titles; the focus line tells it what kind of logic to
+# look for.
+CONNECTIONS_SYSTEM_PROMPT = """You are linking entries extracted from a biographical interview with Bill,
+age 61, as part of a cognitive substrate project. You will be given the
+entries from one extraction pass as a JSON list of titles and categories.
+
+Identify 5-10 connections between these entries and record them with the
+record_connections tool. Use titles exactly as given.
+"""
+
+CONNECTION_FOCUS = {
+    'factual': """Focus on connections that reveal NARRATIVE LOGIC — why one event led to
+another, how a relationship shaped a decision, how a place recurs across
+different life periods.""",
+    'emotional': """Focus on EMOTIONAL LOGIC — how one loss connects to
+a fear, how a wound and a healing form a pair, how a joy and a longing
+reveal the same underlying need from different directions.""",
+    'analytical': """Focus on ANALYTICAL LOGIC — how a decision connects
+to a value, how a bias produced a mistake, how a wound catalyzed growth,
+how a philosophy shaped a life choice. These connections ARE the cognitive
+architecture.""",
+    'unified': """Focus on connections ACROSS kinds of content — how an event
+shaped a feeling, how a wound led to a decision or a value, how the same
+person recurs across stories, fears and beliefs.""",
+}
+
+# Tools the model is forced to call, so responses arrive as schema-shaped
+# tool input instead of free text that has to be cleaned up and parsed.
+EXTRACTION_TOOL = {
+    "name": "record_extraction",
+    "description": "Record the entries extracted from the transcript in this pass.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "entries": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "category": {"type": "string"},
+                        "title": {"type": "string"},
+                        "insight": {"type": "string"},
+                        "source_quote": {"type": "string"},
+                        "evidence_type": {
+                            "type": "string",
+                            "enum": ["direct_statement", "paraphrase", "inference",
+                                     "behavioral_observation"],
+                        },
+                        "time_period": {"type": "string"},
+                        "life_period": {
+                            "type": "string",
+                            "enum": ["childhood", "adolescence", "young_adult", "early_career",
+                                     "mid_life", "later_life", "recent", "ongoing", "unknown"],
+                        },
+                        "approximate_year": {"type": ["integer", "null"]},
+                    },
+                    "required": ["category", "title", "insight", "source_quote", "evidence_type",
+                                 "time_period", "life_period", "approximate_year"],
+                },
+            },
+        },
+        "required": ["entries"],
+    },
+}
+
+CONNECTIONS_TOOL = {
+    "name": "record_connections",
+    "description": "Record connections between the listed entries.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "connections": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "entry_1_title": {"type": "string"},
+                        "entry_2_title": {"type": "string"},
+                        "connection_type": {
+                            "type": "string",
+                            "enum": ["caused_by", "led_to", "contradicts", "reinforces",
+                                     "transforms", "co_occurred", "same_theme",
+                                     "involves_same_person", "involves_same_place"],
+                        },
+                        "description": {"type": "string"},
+                    },
+                    "required": ["entry_1_title", "entry_2_title", "connection_type", "description"],
+                },
+            },
+        },
+        "required": ["connections"],
+    },
+}
+
+# Pass 1 (factual) instructions.
+FACTUAL_SYSTEM_PROMPT = """PASS 1: FACTUAL AND NARRATIVE DATA
+
+Other extraction passes will handle emotional content (Pass 2) and
+analytical/reflective content (Pass 3). Your job is to capture the FACTS,
+EVENTS, PEOPLE, STORIES, and CONCRETE KNOWLEDGE.
 
 ─────────────────────────────────────────────
 CATEGORIES
@@ -218,47 +337,16 @@ EXTRACTION PRINCIPLES
 - If approximate_year can be calculated from context (Bill's age at the time,
   references to historical events, etc.), calculate it.
 
-─────────────────────────────────────────────
-CONNECTIONS (5-10 per pass)
-─────────────────────────────────────────────
-
-After all entries, identify connections between entries extracted in THIS pass.
-
-{{
-  "entry_1_title": "Matches a title from your entries above",
-  "entry_2_title": "Matches a title from your entries above",
-  "connection_type": "caused_by | led_to | contradicts | reinforces |
-                     transforms | co_occurred | same_theme |
-                     involves_same_person | involves_same_place",
-  "description": "Brief explanation of the relationship"
-}}
-
-Focus on connections that reveal NARRATIVE LOGIC — why one event led to
-another, how a relationship shaped a decision, how a place recurs across
-different life periods.
-
 ─────────────────────────────────────────────
 
 Extract comprehensively. Each entry must be substantive and source-anchored.
 Do not sacrifice quality for quantity, but do not leave significant content
-unextracted. A full session typically yields 40-80+ entries from this pass.
-
-=== TRANSCRIPT ===
-{transcript}"""
-
-        return self._call_extraction(prompt, "Pass 1 (Factual)", model=self.OPUS_MODEL)
+unextracted. A full session typically yields 40-80+ entries from this pass."""
 
-    def _run_emotional_pass(self, transcript: str) -> Tuple[List[Dict], List[Dict]]:
-        """Extract emotional content: joys, sorrows, wounds, fears, loves, sensory."""
-
-        prompt = f"""You are extracting EMOTIONAL AND EXPERIENTIAL content from a biographical
-interview transcript. This is part of a cognitive substrate project — a
-comprehensive digital representation of the speaker's identity, memories,
-and personhood, designed to be rich enough that a future AI system could
-embody his perspective.
+# Pass 2 (emotional) instructions.
+EMOTIONAL_SYSTEM_PROMPT = """PASS 2: EMOTIONAL AND EXPERIENTIAL CONTENT
 
-The speaker is Bill, age 61. Pass 1 has already extracted factual content
-(events, people, stories). Your job is to capture the EMOTIONAL LANDSCAPE:
+Pass 1 has already extracted factual content (events, people, stories). Your job is to capture the EMOTIONAL LANDSCAPE:
 what Bill felt, feels, fears, loves, mourns, and yearns for.
 
 ════════════════════════════════════════════════
@@ -288,18 +376,6 @@ emotion abstractly ("I have a fear of failure"), PROBE for the anchor in
 the transcript: is there a story or moment attached? If not, extract it
 but note in the insight that the experiential anchor is missing.
 
-OUTPUT FORMAT: Return ONLY a JSON object. No markdown. No explanations.
-{{
-  "entries": [ ...array of entry objects... ],
-  "connections": [ ...array of connection objects... ]
-}}
-
-ENTRY SCHEMA: Same as Pass 1.
-{{
-  "category", "title", "insight", "source_quote", "evidence_type",
-  "time_period", "life_period", "approximate_year"
-}}
-
 ─────────────────────────────────────────────
 CATEGORIES
 ─────────────────────────────────────────────
@@ -397,34 +473,15 @@ EXTRACTION PRINCIPLES
   biography, being recorded), capture it. His relationship to the act of
   self-documentation is itself identity data.
 
-─────────────────────────────────────────────
-CONNECTIONS (5-10 per pass)
-─────────────────────────────────────────────
-
-Same schema as Pass 1. Focus on EMOTIONAL LOGIC — how one loss connects to
-a fear, how a wound and a healing form a pair, how a joy and a longing
-reveal the same underlying need from different directions.
-
 ─────────────────────────────────────────────
 
 Extract comprehensively. Prioritize depth and experiential richness over
-raw count. A full session typically yields 20-40+ entries from this pass.
-
-=== TRANSCRIPT ===
-{transcript}"""
+raw count. A full session typically yields 20-40+ entries from this pass."""
 
-        return self._call_extraction(prompt, "Pass 2 (Emotional)", model=self.SONNET_MODEL)
+# Pass 3 (analytical) instructions.
+ANALYTICAL_SYSTEM_PROMPT = """PASS 3: ANALYTICAL AND REFLECTIVE CONTENT
 
-    def _run_analytical_pass(self, transcript: str) -> Tuple[List[Dict], List[Dict]]:
-        """Extract analytical/cognitive content: patterns, wisdom, decisions, values."""
-
-        prompt = f"""You are extracting ANALYTICAL AND REFLECTIVE content from a biographical
-interview transcript. This is part of a cognitive substrate project — a
-comprehensive digital representation of the speaker's identity, memories,
-and personhood, designed to be rich enough that a future AI system could
-embody his perspective.
-
-The speaker is Bill, age 61. Pass 1 extracted facts and narratives. Pass 2
+Pass 1 extracted facts and narratives. Pass 2
 extracted emotions and experiences. Your job is to capture HOW BILL THINKS:
 his decision patterns, hard-won wisdom, cognitive tendencies, values,
 contradictions, and the philosophical framework he has built from 61 years
@@ -446,18 +503,6 @@ self_knowledge (Pass 1). "Bill's account of spending three years rebuilding
 a relationship with his son, despite repeated setbacks, demonstrates
 remarkable persistence" is a strength (this pass). Prioritize the latter.
 
-OUTPUT FORMAT: Return ONLY a JSON object. No markdown. No explanations.
-{{
-  "entries": [ ...array of entry objects... ],
-  "connections": [ ...array of connection objects... ]
-}}
-
-ENTRY SCHEMA: Same as Pass 1.
-{{
-  "category", "title", "insight", "source_quote", "evidence_type",
-  "time_period", "life_period", "approximate_year"
-}}
-
 ─────────────────────────────────────────────
 CATEGORIES — grouped by domain
 ─────────────────────────────────────────────
@@ -599,51 +644,721 @@ EXTRACTION PRINCIPLES
   genuine self-assessment. An ironic observation may encode a worldview.
   Extract the analytical payload, and note that it was delivered through humor.
 
-─────────────────────────────────────────────
-CONNECTIONS (5-10 per pass)
-─────────────────────────────────────────────
-
-Same schema as Pass 1. Focus on ANALYTICAL LOGIC — how a decision connects
-to a value, how a bias produced a mistake, how a wound catalyzed growth,
-how a philosophy shaped a life choice. These connections ARE the cognitive
-architecture.
-
 ─────────────────────────────────────────────
 
 Extract comprehensively. This pass covers 16 categories — many will have
 zero entries in a given session, which is expected. Do not force entries
 into categories where the transcript offers no evidence. A full session
-typically yields 25-50+ entries from this pass.
+typically yields 25-50+ entries from this pass."""
+
+# Single-call alternative to the three passes: one Opus request carrying
+# every pass's categories, so the transcript is only sent (and billed) once.
+# Each pass prompt is reused minus its "other passes handle..." intro.
+UNIFIED_SYSTEM_PROMPT = "\n\n".join([
+    """SINGLE PASS: FACTUAL, EMOTIONAL AND ANALYTICAL CONTENT
+
+This run covers all three passes in one call. Work through the three parts
+below in order and record the entries from all of them in a single
+record_extraction call. Entries from different parts may describe the same
+moment from different angles — that is expected.""",
+    "PART 1: FACTUAL AND NARRATIVE DATA\n\n" + FACTUAL_SYSTEM_PROMPT.split("\n\n", 2)[2],
+    "PART 2: EMOTIONAL AND EXPERIENTIAL CONTENT\n\n" + EMOTIONAL_SYSTEM_PROMPT.split("\n\n", 2)[2],
+    "PART 3: ANALYTICAL AND REFLECTIVE CONTENT\n\n" + ANALYTICAL_SYSTEM_PROMPT.split("\n\n", 2)[2],
+]).replace("this pass", "this part")
+
+# Progress output goes through a queue so concurrent passes never block on
+# stdout; a listener thread does the formatting and writing.
+log = logging.getLogger("multi_pass_extraction")
+log_listener = None
+
+
+def setup_logging():
+    """Attach the queued stdout handler to the module logger (once)."""
+    global log_listener
+    if log_listener is not None:
+        return
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    log_listener = QueueListener(log_queue, stream_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    log.addHandler(QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+
+class ExtractionCallError(Exception):
+    """An extraction call failed, so its pass is incomplete.
+
+    entries holds whatever the pass did get (other chunks of a chunked
+    transcript), so the result can still use them.
+    """
 
-=== TRANSCRIPT ===
-{transcript}"""
+    def __init__(self, message: str, entries: Optional[List[Dict]] = None):
+        super().__init__(message)
+        self.entries = entries or []
 
-        return self._call_extraction(prompt, "Pass 3 (Analytical)", model=self.SONNET_MODEL)
 
-    def _call_extraction(self, prompt: str, pass_name: str, model: str = None) -> Tuple[List[Dict], List[Dict]]:
-        """Make an extraction API call and parse results."""
+class StreamingEntryParser:
+    """Pulls complete objects out of the "entries" array of a partial response.
+
+    Fed the streamed text chunk by chunk; each entry is returned as soon as
+    its closing brace arrives, without waiting for the rest of the JSON.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.pos = None  # Index just past the last entry consumed
+        self.done = False
+        self.decoder = json.JSONDecoder()
+
+    def feed(self, text: str) -> List[Dict]:
+        """Add a chunk of text and return any entries it completed."""
+        self.buffer += text
+        if self.done or (self.pos is not None and '}' not in text):
+            return []
+
+        if self.pos is None:
+            match = ENTRIES_START_RE.search(self.buffer)
+            if not match:
+                return []
+            self.pos = match.end()
+
+        entries = []
+        while True:
+            i = self.pos
+            while i < len(self.buffer) and self.buffer[i] in ' \t\r\n,':
+                i += 1
+            if i >= len(self.buffer):
+                break
+            if self.buffer[i] == ']':
+                self.done = True
+                break
+            try:
+                obj, self.pos = self.decoder.raw_decode(self.buffer, i)
+            except json.JSONDecodeError:
+                break  # Entry still incomplete - wait for more text
+            if isinstance(obj, dict):
+                entries.append(obj)
+        return entries
+
+
+class MultiPassExtractor:
+    """Extracts data from transcripts using multiple focused passes."""
+
+    # Hybrid model configuration (optimized based on comparative testing):
+    # - Opus excels at exhaustive factual extraction (68% more entries than Sonnet)
+    # - Sonnet matches or exceeds Opus on emotional and analytical passes
+    # - This hybrid saves ~53% on extraction costs while maintaining quality
+    OPUS_MODEL = "claude-opus-4-20250514"    # For Pass 1 (Factual) - exhaustive people/events
+    SONNET_MODEL = "claude-sonnet-4-20250514"  # For Pass 2 & 3 (Emotional, Analytical)
+    HAIKU_MODEL = "claude-haiku-4-5-20251001"  # For linking each pass's entries
+
+    # Long transcripts are split into overlapping windows for the factual pass
+    # so Opus decodes several shorter extractions in parallel (and recalls
+    # more from each) instead of one very long one.
+    CHUNK_THRESHOLD_WORDS = 6000
+    CHUNK_TARGET_TOKENS = 5000
+    CHUNK_OVERLAP_TOKENS = 400
+    WORDS_PER_TOKEN = 0.75
+    MAX_CONCURRENT_CHUNKS = 4
+
+    # Output ceilings sized to each pass's expected entry count (40-80
+    # factual, 20-40 emotional, 25-50 analytical). A response that hits its
+    # ceiling is retried once with double the budget.
+    FACTUAL_MAX_TOKENS = 12000
+    EMOTIONAL_MAX_TOKENS = 8000
+    ANALYTICAL_MAX_TOKENS = 8000
+    CONNECTIONS_MAX_TOKENS = 2000
+    UNIFIED_MAX_TOKENS = 24000
+    MAX_OUTPUT_TOKENS = 32000  # Opus 4 output limit; retries never go past it
+
+    # In-process results of recent live runs, keyed by transcript hash and
+    # shared across instances, so repeat calls in one process skip the API.
+    MEMORY_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    MEMORY_CACHE_SIZE = 32
+
+    def __init__(
+        self,
+        on_entry: Optional[Callable[[Dict], None]] = None,
+        use_cache: Optional[bool] = None,
+        multipass: bool = True
+    ):
+        """on_entry, if given, is called with each entry as soon as it has
+        streamed in, so callers can start work before a pass finishes.
+
+        use_cache turns on the on-disk extraction cache. It defaults to the
+        EXTRACTION_CACHE=1 environment flag, so interactive sessions always
+        hit the API unless asked otherwise.
+
+        multipass=False replaces the three passes with one unified Opus call
+        (UNIFIED_SYSTEM_PROMPT) that reads the transcript once.
+        """
+        setup_logging()
+        self._client = None
+        self.on_entry = on_entry
+        self.all_extractions = []
+        self.all_connections = []
+        if use_cache is None:
+            use_cache = os.getenv("EXTRACTION_CACHE") == "1"
+        self.cache_enabled = use_cache
+        self.multipass = multipass
+
+    @property
+    def client(self) -> AsyncAnthropic:
+        """The API client, created on first use so cache hits never build one."""
+        if self._client is None:
+            self._client = AsyncAnthropic()
+        return self._client
+
+    def extract_all_sync(self, transcript: str, batch_mode: bool = False) -> Dict[str, Any]:
+        """Blocking wrapper around extract_all() for non-async callers."""
+        return asyncio.run(self.extract_all(transcript, batch_mode=batch_mode))
+
+    async def extract_all(self, transcript: str, batch_mode: bool = False) -> Dict[str, Any]:
+        """Run all extraction passes on the transcript.
+
+        The passes have no data dependency on each other, so they are sent
+        concurrently and wall time is the slowest pass rather than the sum.
+
+        With batch_mode=True the passes go through the Message Batches API
+        instead (half price, results within 24h) and this call waits for
+        the batch to finish.
+        """
+        if batch_mode:
+            batch_id = await self.extract_all_batch([transcript])
+            return (await self.collect_batch(batch_id, [transcript]))[0]
+
+        # Hashing and file I/O run in worker threads so they don't stall the
+        # event loop while other passes are streaming
+        transcript_hash = await asyncio.to_thread(sha256_hex, transcript)
+        memory_key = f"{'multi' if self.multipass else 'unified'}-{transcript_hash}"
+        if memory_key in self.MEMORY_CACHE:
+            self.MEMORY_CACHE.move_to_end(memory_key)
+            log.info("Multi-pass extraction: using in-process result for this transcript")
+            result = copy.deepcopy(self.MEMORY_CACHE[memory_key])
+            self.all_extractions = result['extractions']
+            self.all_connections = result['connections']
+            return result
+
+        if self.multipass:
+            log.info("\n".join([
+                "=" * 60,
+                f"MULTI-PASS EXTRACTION {PROMPT_VERSION} (Hybrid: Opus+Sonnet)",
+                "=" * 60,
+                "\nRunning passes 1-3 concurrently...",
+            ]))
+
+            # Pass 1 keeps the verbatim transcript for source_quote fidelity
+            compact = self._compact_transcript(transcript)
+            checkpoints = [
+                PARTIAL_DIR / f"{PROMPT_VERSION}-{transcript_hash}.pass{n}.json"
+                for n in (1, 2, 3)
+            ]
+            outcomes = await asyncio.gather(
+                self._run_checkpointed(checkpoints[0], self._run_factual_pass, transcript),
+                self._run_checkpointed(checkpoints[1], self._run_emotional_pass, compact),
+                self._run_checkpointed(checkpoints[2], self._run_analytical_pass, compact),
+            )
+        else:
+            log.info("\n".join([
+                "=" * 60,
+                f"SINGLE-PASS EXTRACTION {PROMPT_VERSION} (Unified: Opus)",
+                "=" * 60,
+            ]))
+            checkpoints = [PARTIAL_DIR / f"{PROMPT_VERSION}-{transcript_hash}.unified.json"]
+            outcomes = [
+                await self._run_checkpointed(checkpoints[0], self._unified_extract, transcript)
+            ]
+        pass_results = [(entries, connections) for entries, connections, _ in outcomes]
+        result = self._summarize(transcript, pass_results)
+
+        # If a pass failed, keep the other checkpoints for the retry and
+        # don't pin the result in memory (a pass may legitimately find nothing)
+        if all(completed for _, _, completed in outcomes):
+            for checkpoint in checkpoints:
+                checkpoint.unlink(missing_ok=True)
+            self.MEMORY_CACHE[memory_key] = copy.deepcopy(result)
+            if len(self.MEMORY_CACHE) > self.MEMORY_CACHE_SIZE:
+                self.MEMORY_CACHE.popitem(last=False)
+        return result
+
+    async def _run_checkpointed(
+        self,
+        checkpoint: Path,
+        run_pass: Callable,
+        transcript: str
+    ) -> Tuple[List[Dict], List[Dict], bool]:
+        """Run a pass, reusing its checkpoint from an earlier failed run.
+
+        Returns (entries, connections, completed). A pass whose API call
+        failed is not checkpointed, so the next run retries it.
+        """
+        if checkpoint.exists():
+            log.info(f"    Resuming from checkpoint {checkpoint.name}")
+            entries, connections = await asyncio.to_thread(read_pass_file, checkpoint)
+            return entries, connections, True
+
+        try:
+            entries, connections = await run_pass(transcript)
+        except ExtractionCallError as e:
+            log.info(f"    {e}")
+            return e.entries, [], False
+        await asyncio.to_thread(write_pass_file, checkpoint, entries, connections)
+        return entries, connections, True
+
+    def _pass_specs(self) -> List[Tuple[str, str, str, int]]:
+        """(key, system prompt, model, max_tokens) for each pass, in pass order."""
+        if not self.multipass:
+            return [('unified', UNIFIED_SYSTEM_PROMPT, self.OPUS_MODEL, self.UNIFIED_MAX_TOKENS)]
+        return [
+            ('factual', FACTUAL_SYSTEM_PROMPT, self.OPUS_MODEL, self.FACTUAL_MAX_TOKENS),
+            ('emotional', EMOTIONAL_SYSTEM_PROMPT, self.SONNET_MODEL, self.EMOTIONAL_MAX_TOKENS),
+            ('analytical', ANALYTICAL_SYSTEM_PROMPT, self.SONNET_MODEL, self.ANALYTICAL_MAX_TOKENS),
+        ]
+
+    def _request_params(
+        self,
+        system_prompt: str,
+        transcript: str,
+        model: str,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """Messages API parameters shared by live and batch extraction calls."""
+        return {
+            'model': model,
+            'max_tokens': max_tokens,
+            'system': [
+                {
+                    "type": "text",
+                    "text": SHARED_SCHEMA_BLOCK,
+                    "cache_control": {"type": "ephemeral"}
+                },
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                },
+            ],
+            'tools': [EXTRACTION_TOOL],
+            'tool_choice': {"type": "tool", "name": EXTRACTION_TOOL['name']},
+            # Cached too, so a max_tokens retry re-reads the transcript at
+            # the cache price instead of paying for it again
+            'messages': [{
+                "role": "user",
+                "content": [{
+                    "type": "text",
+                    "text": f"=== TRANSCRIPT ===\n{transcript}",
+                    "cache_control": {"type": "ephemeral"}
+                }],
+            }],
+        }
+
+    async def extract_all_batch(self, transcripts: List[str]) -> str:
+        """Submit every pass for every transcript as one Message Batch.
+
+        For offline substrate builds where latency does not matter: batch
+        requests are billed at half the normal token price. Returns the
+        batch id to hand to collect_batch(). Pass 1 (or the unified pass)
+        is not chunked here.
+        """
+        requests = [
+            {
+                'custom_id': f"t{index}-{key}",
+                'params': self._request_params(
+                    system_prompt,
+                    self._compact_transcript(transcript) if key in ('emotional', 'analytical') else transcript,
+                    model, max_tokens
+                ),
+            }
+            for index, transcript in enumerate(transcripts)
+            for key, system_prompt, model, max_tokens in self._pass_specs()
+        ]
+        batch = await self.client.messages.batches.create(requests=requests)
+        log.info(f"Submitted extraction batch {batch.id} ({len(requests)} requests)")
+        return batch.id
+
+    async def collect_batch(
+        self,
+        batch_id: str,
+        transcripts: List[str],
+        poll_interval: float = 60.0
+    ) -> List[Dict[str, Any]]:
+        """Wait for a batch from extract_all_batch() and assemble its results.
+
+        Returns one extract_all()-style result dict per transcript, in the
+        order the transcripts were submitted.
+        """
+        while True:
+            batch = await self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == 'ended':
+                break
+            log.info(f"Batch {batch_id}: {batch.processing_status}, waiting...")
+            await asyncio.sleep(poll_interval)
+
+        pass_keys = [spec[0] for spec in self._pass_specs()]
+        by_custom_id: Dict[str, List[Dict]] = {}
+        async for item in await self.client.messages.batches.results(batch_id):
+            if item.result.type != 'succeeded':
+                log.info(f"    {item.custom_id}: batch request {item.result.type}")
+                continue
+            entries = self._read_tool_output(
+                item.result.message, EXTRACTION_TOOL, 'entries', item.custom_id
+            )
+            by_custom_id[item.custom_id] = self._validate_entries(entries, item.custom_id)
+
+        # Connections are a small live call per pass, run after the batch
+        results = []
+        for index, transcript in enumerate(transcripts):
+            pass_entries = [by_custom_id.get(f"t{index}-{key}", []) for key in pass_keys]
+            pass_connections = await asyncio.gather(*(
+                self._extract_connections(entries, key, f"t{index}-{key}")
+                for key, entries in zip(pass_keys, pass_entries)
+            ))
+            results.append(self._summarize(transcript, list(zip(pass_entries, pass_connections))))
+        return results
+
+    def _summarize(
+        self,
+        transcript: str,
+        pass_results: List[Tuple[List[Dict], List[Dict]]]
+    ) -> Dict[str, Any]:
+        """Merge the passes' results, tag entries and log the summary."""
+        self.all_extractions = []
+        self.all_connections = []
+        lines = []
+
+        if self.multipass:
+            labels = [
+                "PASS 1: FACTUAL [Opus] (people, events, stories, skills, works)",
+                "PASS 2: EMOTIONAL [Sonnet] (joys, sorrows, wounds, fears, loves, sensory)",
+                "PASS 3: ANALYTICAL [Sonnet] (patterns, wisdom, decisions, values, mortality)",
+            ]
+        else:
+            labels = ["SINGLE PASS [Opus] (all categories)"]
+
+        for label, (entries, connections) in zip(labels, pass_results):
+            lines.append(f"\n--- {label} ---")
+            self.all_extractions.extend(entries)
+            self.all_connections.extend(connections)
+            lines.append(f"    Extracted: {len(entries)} entries, {len(connections)} connections")
+
+        # Tag all entries with prompt version, counting categories and
+        # source quotes in the same pass
+        category_counts = Counter()
+        quoted = 0
+        for entry in self.all_extractions:
+            entry['prompt_version'] = PROMPT_VERSION
+            entry['action'] = 'insert'
+            category_counts[entry['category']] += 1
+            quoted += bool(entry.get('source_quote'))
+
+        # Summary
+        lines.append("\n" + "=" * 60)
+        lines.append(f"TOTAL: {len(self.all_extractions)} entries, {len(self.all_connections)} connections")
+
+        lines.append("\nBy category:")
+        for cat, count in category_counts.most_common():
+            lines.append(f"  {cat}: {count}")
+
+        lines.append(f"\nEntries with source_quote: {quoted}/{len(self.all_extractions)} ({100*quoted//max(1,len(self.all_extractions))}%)")
+        lines.append("=" * 60)
+        log.info("\n".join(lines))
+
+        return {
+            'extractions': self.all_extractions,
+            'connections': self.all_connections,
+            'category_counts': dict(category_counts),
+            'raw_transcription': transcript,
+            'prompt_version': PROMPT_VERSION
+        }
+
+    async def _run_factual_pass(self, transcript: str) -> Tuple[List[Dict], List[Dict]]:
+        """Extract all factual data: people, events, stories, skills, creative works."""
+        entries = await self._run_chunked(
+            FACTUAL_SYSTEM_PROMPT, transcript, "Pass 1 (Factual)", self.FACTUAL_MAX_TOKENS
+        )
+        return entries, await self._extract_connections(entries, 'factual', "Pass 1 (Factual)")
+
+    async def _unified_extract(self, transcript: str) -> Tuple[List[Dict], List[Dict]]:
+        """Extract every category in one Opus call instead of three passes."""
+        entries = await self._run_chunked(
+            UNIFIED_SYSTEM_PROMPT, transcript, "Unified pass", self.UNIFIED_MAX_TOKENS
+        )
+        return entries, await self._extract_connections(entries, 'unified', "Unified pass")
+
+    async def _run_chunked(
+        self,
+        system_prompt: str,
+        transcript: str,
+        pass_name: str,
+        max_tokens: int
+    ) -> List[Dict]:
+        """Run an Opus extraction, splitting long transcripts into chunks."""
+        chunks = self._chunk_transcript(transcript)
+        if len(chunks) == 1:
+            entries, _ = await self._call_extraction(
+                system_prompt, transcript, pass_name,
+                model=self.OPUS_MODEL, max_tokens=max_tokens
+            )
+            return entries
+
+        log.info(f"    {pass_name}: splitting transcript into {len(chunks)} chunks")
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CHUNKS)
+
+        async def run_chunk(index: int, chunk: str) -> Tuple[List[Dict], List[Dict]]:
+            async with semaphore:
+                return await self._call_extraction(
+                    system_prompt, chunk,
+                    f"{pass_name} chunk {index}/{len(chunks)}",
+                    model=self.OPUS_MODEL, max_tokens=max_tokens
+                )
+
+        results = await asyncio.gather(
+            *(run_chunk(i, c) for i, c in enumerate(chunks, 1)), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        for error in errors:
+            if not isinstance(error, ExtractionCallError):
+                raise error
+        merged = self._merge_chunk_results([r for r in results if not isinstance(r, BaseException)])
+        if errors:
+            raise ExtractionCallError(
+                f"{pass_name}: {len(errors)} of {len(chunks)} chunks failed", merged
+            )
+        return merged
+
+    def _compact_transcript(self, transcript: str) -> str:
+        """Trim tokens that carry no content for the emotional and analytical passes.
+
+        Drops hesitation fillers and short interviewer back-channel lines
+        ("BIOGRAPHER: Mm-hm, go on.") that are not questions. Session
+        transcripts hold only Bill's speeches, so there only fillers go.
+        """
+        lines = []
+        for line in transcript.splitlines():
+            stripped = line.strip()
+            if (stripped[:len(INTERVIEWER_PREFIX)].upper() == INTERVIEWER_PREFIX
+                    and len(stripped.split()) < 8
+                    and not stripped.endswith('?')):
+                continue
+            lines.append(FILLER_RE.sub('', line))
+        return "\n".join(lines)
+
+    def _chunk_transcript(self, transcript: str) -> List[str]:
+        """Split a long transcript into overlapping word windows.
+
+        Token counts are estimated from word counts. Transcripts at or under
+        CHUNK_THRESHOLD_WORDS come back as a single chunk. Windows are sliced
+        from the original text so line breaks and speech separators survive.
+        """
+        words = list(WORD_RE.finditer(transcript))
+        if len(words) <= self.CHUNK_THRESHOLD_WORDS:
+            return [transcript]
+
+        window = int(self.CHUNK_TARGET_TOKENS * self.WORDS_PER_TOKEN)
+        overlap = int(self.CHUNK_OVERLAP_TOKENS * self.WORDS_PER_TOKEN)
+        step = window - overlap
+
+        chunks = []
+        for start in range(0, len(words), step):
+            end = min(start + window, len(words))
+            chunks.append(transcript[words[start].start():words[end - 1].end()])
+            if end == len(words):
+                break
+        return chunks
+
+    def _merge_chunk_results(
+        self,
+        results: List[Tuple[List[Dict], List[Dict]]]
+    ) -> List[Dict]:
+        """Merge per-chunk extractions, de-duplicating the overlap regions.
+
+        Entries collide on (category, lower-cased title); the one with the
+        longer source_quote wins.
+        """
+        merged: Dict[Tuple[str, str], Dict] = {}
+        for entries, _ in results:
+            for entry in entries:
+                key = (entry.get('category', ''), entry.get('title', '').strip().lower())
+                existing = merged.get(key)
+                if existing is None or len(entry.get('source_quote') or '') > len(existing.get('source_quote') or ''):
+                    merged[key] = entry
+
+        return list(merged.values())
+
+    async def _run_emotional_pass(self, transcript: str) -> Tuple[List[Dict], List[Dict]]:
+        """Extract emotional content: joys, sorrows, wounds, fears, loves, sensory."""
+        entries, _ = await self._call_extraction(
+            EMOTIONAL_SYSTEM_PROMPT, transcript, "Pass 2 (Emotional)",
+            model=self.SONNET_MODEL, max_tokens=self.EMOTIONAL_MAX_TOKENS
+        )
+        return entries, await self._extract_connections(entries, 'emotional', "Pass 2 (Emotional)")
+
+    async def _run_analytical_pass(self, transcript: str) -> Tuple[List[Dict], List[Dict]]:
+        """Extract analytical/cognitive content: patterns, wisdom, decisions, values."""
+        entries, _ = await self._call_extraction(
+            ANALYTICAL_SYSTEM_PROMPT, transcript, "Pass 3 (Analytical)",
+            model=self.SONNET_MODEL, max_tokens=self.ANALYTICAL_MAX_TOKENS
+        )
+        return entries, await self._extract_connections(entries, 'analytical', "Pass 3 (Analytical)")
+
+    async def _extract_connections(
+        self,
+        entries: List[Dict],
+        focus: str,
+        pass_name: str
+    ) -> List[Dict]:
+        """Find connections between one pass's entries with a small Haiku call.
+
+        Only titles, categories and life periods are sent, so this is cheap
+        next to the extraction itself. Connections are kept only when both
+        ends name an entry from the list.
+        """
+        if len(entries) < 2:
+            return []
+
+        listing = [
+            {
+                'title': entry['title'],
+                'category': entry['category'],
+                'life_period': entry.get('life_period', 'unknown'),
+            }
+            for entry in entries
+        ]
+        try:
+            response = await self.client.messages.create(
+                model=self.HAIKU_MODEL,
+                max_tokens=self.CONNECTIONS_MAX_TOKENS,
+                system=f"{CONNECTIONS_SYSTEM_PROMPT}\n{CONNECTION_FOCUS[focus]}",
+                tools=[CONNECTIONS_TOOL],
+                tool_choice={"type": "tool", "name": CONNECTIONS_TOOL['name']},
+                messages=[{"role": "user", "content": json.dumps(listing, ensure_ascii=False)}]
+            )
+            connections = self._read_tool_output(
+                response, CONNECTIONS_TOOL, 'connections', f"{pass_name} connections"
+            )
+        except Exception as e:
+            log.info(f"    {pass_name} connections error: {e}")
+            return []
+
+        titles = {entry['title'].strip().lower() for entry in entries}
+        kept = []
+        seen = set()
+        for conn in connections:
+            if not isinstance(conn, dict):
+                continue
+            t1 = str(conn.get('entry_1_title', '')).strip().lower()
+            t2 = str(conn.get('entry_2_title', '')).strip().lower()
+            key = (t1, t2, conn.get('connection_type', ''))
+            if t1 in titles and t2 in titles and key not in seen:
+                seen.add(key)
+                kept.append(conn)
+        return kept
+
+    async def _call_extraction(
+        self,
+        system_prompt: str,
+        transcript: str,
+        pass_name: str,
+        model: str = None,
+        max_tokens: int = 16000
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """Make an extraction API call and parse results.
+
+        The static pass instructions go in a cached system block so repeat
+        calls only pay full input cost for the transcript, which is cached
+        as well for the max_tokens retry.
+        """
         # Default to Opus if no model specified (backward compatibility)
         if model is None:
             model = self.OPUS_MODEL
 
+        cache_key = None
+        if self.cache_enabled:
+            cache_key = await asyncio.to_thread(
+                extraction_cache.make_key, model, PROMPT_VERSION, system_prompt, transcript
+            )
+            cached = await asyncio.to_thread(extraction_cache.get, cache_key)
+            if cached is not None:
+                log.info(f"    {pass_name}: using cached response")
+                return cached['entries'], cached['connections']
+
         try:
-            # Use streaming
-            response_text = ""
-            with self.client.messages.stream(
-                model=model,
-                max_tokens=16000,  # Can bump to 32000 if truncation occurs
-                messages=[{"role": "user", "content": prompt}]
-            ) as stream:
-                for text in stream.text_stream:
-                    response_text += text
-
-            # Parse JSON - handles both v1.0 (array) and v2.0 (object) formats
-            entries, connections = self._parse_extraction_response(response_text, pass_name)
+            emitted = 0
+            for attempt in range(2):
+                # Use streaming; the tool input arrives as partial JSON deltas
+                streamed_entries = []
+                parser = StreamingEntryParser()
+                async with self.client.messages.stream(
+                    **self._request_params(system_prompt, transcript, model, max_tokens)
+                ) as stream:
+                    async for event in stream:
+                        if event.type != 'input_json':
+                            continue
+                        for entry in parser.feed(event.partial_json):
+                            streamed_entries.append(entry)
+                            # Don't hand the retry's repeats of entries to on_entry twice
+                            if self.on_entry is not None and len(streamed_entries) > emitted:
+                                self.on_entry(entry)
+                                emitted += 1
+                    final = await stream.get_final_message()
+                usage = final.usage
+
+                if final.stop_reason != 'max_tokens' or attempt or max_tokens >= self.MAX_OUTPUT_TOKENS:
+                    break
+                retry_tokens = min(max_tokens * 2, self.MAX_OUTPUT_TOKENS)
+                log.info(f"    {pass_name}: hit max_tokens={max_tokens}, retrying with {retry_tokens}")
+                max_tokens = retry_tokens
+
+            log.info(f"    {pass_name} prompt cache: "
+                  f"{getattr(usage, 'cache_read_input_tokens', 0) or 0} read, "
+                  f"{getattr(usage, 'cache_creation_input_tokens', 0) or 0} written")
+
+            entries = self._read_tool_output(final, EXTRACTION_TOOL, 'entries', pass_name)
+            connections = []
+
+            # A truncated response fails full parsing, but every entry that
+            # closed before the cutoff was already picked up while streaming
+            if len(streamed_entries) > len(entries):
+                log.info(f"    (recovered {len(streamed_entries)} from stream)")
+                entries = streamed_entries
+
+            entries = self._validate_entries(entries, pass_name)
+
+            if cache_key is not None and entries:
+                await asyncio.to_thread(extraction_cache.put, cache_key, {
+                    'entries': entries,
+                    'connections': connections,
+                    'model': model,
+                })
+
             return entries, connections
 
         except Exception as e:
-            print(f"    Extraction error: {e}")
-            return [], []
+            raise ExtractionCallError(f"{pass_name} extraction error: {e}") from e
+
+    def _read_tool_output(self, message: Any, tool: Dict, key: str, pass_name: str) -> List[Any]:
+        """Return the list under key from the message's call to tool.
+
+        Falls back to parsing a plain-text JSON reply if the model answered
+        without calling the tool.
+        """
+        for block in message.content:
+            if block.type == 'tool_use' and block.name == tool['name']:
+                return block.input.get(key) or []
+
+        text = "".join(block.text for block in message.content if block.type == 'text')
+        entries, connections = self._parse_extraction_response(text, pass_name)
+        return entries if key == 'entries' else connections
+
+    def _validate_entries(self, entries: List[Any], pass_name: str) -> List[Dict]:
+        """Drop entries that don't match ENTRY_SCHEMA, reporting how many."""
+        valid = [entry for entry in entries if is_valid_entry(entry)]
+        if len(valid) < len(entries):
+            log.info(f"    {pass_name}: dropped {len(entries) - len(valid)} malformed entries")
+        return valid
 
     def _parse_extraction_response(self, text: str, pass_name: str) -> Tuple[List[Dict], List[Dict]]:
         """
@@ -657,13 +1372,24 @@ typically yields 25-50+ entries from this pass.
         # Clean up markdown if present
         cleaned = text.strip()
         if cleaned.startswith('```'):
-            cleaned = re.sub(r'^```(?:json)?\s*', '', cleaned)
-            cleaned = re.sub(r'\s*```$', '', cleaned)
-
-        # Try parsing as JSON
-        try:
-            result = json.loads(cleaned)
-
+            cleaned = FENCE_RE.sub('', cleaned)
+
+        # Try parsing as JSON, then again with trailing commas removed, then
+        # as a truncated document keeping every complete value before the cutoff
+        result = None
+        for candidate in (cleaned, TRAILING_COMMA_RE.sub(r'\1', cleaned)):
+            try:
+                result = session_io.loads(candidate)
+                break
+            except ValueError:
+                pass
+        if result is None:
+            try:
+                result = session_io.loads_partial(cleaned)
+            except ValueError:
+                pass
+
+        if result is not None:
             # v2.0 format: object with entries and connections
             if isinstance(result, dict):
                 if 'entries' in result:
@@ -680,15 +1406,12 @@ typically yields 25-50+ entries from this pass.
 
             return entries, connections
 
-        except json.JSONDecodeError:
-            pass
-
         # Fallback: Find JSON object or array in text
         try:
             # Try to find object first (v2.0)
-            obj_match = re.search(r'\{[\s\S]*"entries"[\s\S]*\}', text)
+            obj_match = OBJECT_RE.search(text)
             if obj_match:
-                result = json.loads(obj_match.group())
+                result = session_io.loads(obj_match.group())
                 entries = result.get('entries', [])
                 connections = result.get('connections', [])
                 return entries, connections
@@ -697,9 +1420,9 @@ typically yields 25-50+ entries from this pass.
 
         try:
             # Try to find array (v1.0)
-            array_match = re.search(r'\[[\s\S]*\]', text)
+            array_match = ARRAY_RE.search(text)
             if array_match:
-                entries = json.loads(array_match.group())
+                entries = session_io.loads(array_match.group())
                 return entries, []
         except:
             pass
@@ -707,7 +1430,7 @@ typically yields 25-50+ entries from this pass.
         # Last resort: regex extraction for v2.0 entries
         entries = self._regex_extract_entries(text)
         if entries:
-            print(f"    (recovered {len(entries)} via regex)")
+            log.info(f"    (recovered {len(entries)} via regex)")
 
         return entries, connections
 
@@ -716,9 +1439,7 @@ typically yields 25-50+ entries from this pass.
         entries = []
 
         # Pattern for v2.0 entries with source_quote
-        pattern = r'\{\s*"category"\s*:\s*"([^"]+)"[^}]*"title"\s*:\s*"([^"]+)"[^}]*"insight"\s*:\s*"((?:[^"\\]|\\.)*)"[^}]*"source_quote"\s*:\s*"((?:[^"\\]|\\.)*)?"'
-
-        for match in re.finditer(pattern, text):
+        for match in ENTRY_RE.finditer(text):
             entries.append({
                 'category': match.group(1),
                 'title': match.group(2),
@@ -736,9 +1457,7 @@ typically yields 25-50+ entries from this pass.
             return entries
 
         # Fallback to simpler pattern (v1.0 style)
-        pattern2 = r'"category"\s*:\s*"([^"]+)"[^}]*"title"\s*:\s*"([^"]+)"[^}]*"insight"\s*:\s*"((?:[^"\\]|\\.)*)"'
-
-        for match in re.finditer(pattern2, text):
+        for match in SIMPLE_ENTRY_RE.finditer(text):
             entries.append({
                 'category': match.group(1),
                 'title': match.group(2),
@@ -755,22 +1474,19 @@ typically yields 25-50+ entries from this pass.
         return entries
 
 
-def extract_from_session(session_path: Path) -> Dict[str, Any]:
-    """Extract all data from a session file using multi-pass extraction."""
-    import json
-
-    with open(session_path, 'r', encoding='utf-8') as f:
-        session = json.load(f)
+async def extract_from_session(
+    session_path: Path,
+    use_cache: Optional[bool] = None,
+    multipass: bool = True,
+    extractor: Optional[MultiPassExtractor] = None
+) -> Dict[str, Any]:
+    """Extract all data from a session file using multi-pass extraction.
 
-    # Get unique Bill speeches
-    speeches = []
-    seen = set()
-    for event in session.get('events', []):
-        if event.get('type') == 'BILL_SPEAKS':
-            text = event.get('data', {}).get('text', '')
-            if text and len(text) > 50 and text not in seen:
-                speeches.append(text)
-                seen.add(text)
+    Pass an extractor to share it (and its API client) across sessions;
+    use_cache and multipass are then taken from it.
+    """
+    # Get unique Bill speeches (file read off the event loop)
+    speeches = await asyncio.to_thread(session_io.load_speeches, session_path)
 
     if not speeches:
         return {'extractions': [], 'connections': [], 'error': 'No speech found'}
@@ -779,15 +1495,35 @@ def extract_from_session(session_path: Path) -> Dict[str, Any]:
     full_transcript = "\n\n---\n\n".join(speeches)
 
     # Run multi-pass extraction
-    extractor = MultiPassExtractor()
-    return extractor.extract_all(full_transcript)
+    if extractor is None:
+        extractor = MultiPassExtractor(use_cache=use_cache, multipass=multipass)
+    return await extractor.extract_all(full_transcript)
+
+
+def extract_from_session_sync(
+    session_path: Path,
+    use_cache: Optional[bool] = None,
+    multipass: bool = True
+) -> Dict[str, Any]:
+    """Blocking wrapper around extract_from_session() for non-async callers."""
+    return asyncio.run(extract_from_session(session_path, use_cache=use_cache, multipass=multipass))
 
 
 def main():
-    """Test multi-pass extraction on the most recent session."""
+    """Test extraction on the most recent session.
+
+    Runs the single unified pass by default; --multipass runs the original
+    three passes for quality comparison.
+    """
     import sys
+    import argparse
     from pathlib import Path
 
+    parser = argparse.ArgumentParser(description='Extract the most recent session')
+    parser.add_argument('--multipass', action='store_true',
+                        help='Run the three separate passes instead of one unified call')
+    args = parser.parse_args()
+
     # Add parent to path
     sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -806,7 +1542,7 @@ def main():
     print(f"Processing: {latest_session.name}")
 
     # Run extraction
-    result = extract_from_session(latest_session)
+    result = extract_from_session_sync(latest_session, multipass=args.multipass)
 
     if not result.get('extractions'):
         print("No extractions found")
@@ -9,7 +9,8 @@ This script:
 5. Logs what was extracted
 
 Improvements for robustness:
-- Multiple JSON parsing attempts
+- Forced tool call, so entries arrive as structured input
+- Multiple JSON parsing attempts (for plain-text replies)
 - Regex-based fallback extraction
 - Better error handling
 """
@@ -18,9 +19,11 @@ import json
 import os
 import re
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -30,33 +33,82 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Optional faster JSON serializer for the results log
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import local modules
 from biographer.enricher import DatabaseEnricher
+from biographer import extraction_cache
+from biographer.multi_pass_extraction import is_valid_entry
+from biographer.session_io import load_speeches, loads, loads_partial, unique_speeches
+
+# Bump when load_extraction_prompt() changes so cached results are not reused
+PROMPT_VERSION = "v1.2"
+EXTRACTION_MODEL = "claude-opus-4-20250514"
+
+# Forced tool call, so the reply arrives as schema-shaped input rather than
+# prose JSON that has to be recovered with try_parse_json()
+EXTRACTION_TOOL = {
+    "name": "record_extractions",
+    "description": "Record every entry extracted from the transcript.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "extractions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "category": {"type": "string"},
+                        "title": {"type": "string"},
+                        "insight": {"type": "string"},
+                        "time_period": {"type": "string"},
+                        "significance": {"type": "integer", "minimum": 1, "maximum": 10},
+                    },
+                    "required": ["category", "title", "insight", "time_period", "significance"],
+                },
+            },
+        },
+        "required": ["extractions"],
+    },
+}
 
 # Output paths
 SESSIONS_DIR = Path(__file__).parent / "logs" / "sessions"
 REEXTRACT_LOG = Path(__file__).parent / "logs" / "reextract_log.json"
 
-
-def load_session(session_path: Path) -> Dict[str, Any]:
-    """Load a session JSON file."""
-    with open(session_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+# JSON recovery patterns, compiled once. Each markdown pattern is paired with
+# the group holding the JSON.
+JSON_BLOCK_PATTERNS = [
+    (re.compile(r'```json\s*(.*?)\s*```', re.DOTALL), 1),
+    (re.compile(r'```\s*(.*?)\s*```', re.DOTALL), 1),
+    (re.compile(r'\{[\s\S]*"extractions"[\s\S]*\}', re.DOTALL), 0),
+]
+UNESCAPED_NEWLINE_RE = re.compile(r'(?<!\\)\n(?=[^"]*"[^"]*(?:"[^"]*"[^"]*)*$)')
+ENTRY_RE = re.compile(r'\{\s*"category"\s*:\s*"([^"]+)"\s*,\s*"title"\s*:\s*"([^"]+)"\s*,\s*"insight"\s*:\s*"([^"]+)"\s*,\s*"time_period"\s*:\s*"([^"]*)"\s*,\s*"significance"\s*:\s*(\d+)\s*\}')
+
+
+def prefetch_speeches(session_files: List[Path]) -> Iterator[Tuple[Path, List[str]]]:
+    """Yield (path, speeches) in order, reading the next file in a worker
+    thread while the caller is busy with the current one."""
+    if not session_files:
+        return
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(load_speeches, session_files[0])
+        for index, session_path in enumerate(session_files):
+            speeches = future.result()
+            if index + 1 < len(session_files):
+                future = pool.submit(load_speeches, session_files[index + 1])
+            yield session_path, speeches
 
 
 def extract_bill_speech(session: Dict[str, Any]) -> List[str]:
     """Extract all of Bill's speech from a session."""
-    speeches = []
-    seen_texts = set()  # Avoid duplicates
-
-    for event in session.get('events', []):
-        if event.get('type') == 'BILL_SPEAKS':
-            text = event.get('data', {}).get('text', '')
-            # Skip very short utterances and duplicates
-            if text and len(text) > 50 and text not in seen_texts:
-                speeches.append(text)
-                seen_texts.add(text)
-    return speeches
+    return unique_speeches(session.get('events', ()))
 
 
 def load_extraction_prompt() -> str:
@@ -66,23 +118,15 @@ def load_extraction_prompt() -> str:
 CRITICAL: Extract EVERYTHING. There is NO LIMIT on number of extractions.
 A substantial transcript should yield 20-50+ entries.
 
-IMPORTANT: Output ONLY valid JSON. No markdown, no explanations.
+Record every entry with the record_extractions tool.
 
 For each piece of information, create an entry with these fields:
 - category: one of [life_events, relationships, stories, joys, sorrows, loves, fears, wounds, healings, growth, strengths, vulnerabilities, regrets, wisdom, decisions, questions, self_knowledge, preferences, reasoning_patterns, value_hierarchies]
-- title: brief title (NO quotes inside)
-- insight: the content with ALL details (escape quotes with backslash)
+- title: brief title
+- insight: the content with ALL details
 - time_period: when this happened if mentioned
 - significance: 1-10
 
-Output format - return ONLY this JSON structure:
-{
-  "extractions": [
-    {"category": "life_events", "title": "First motorcycle ride", "insight": "Bill first rode...", "time_period": "1976", "significance": 7},
-    {"category": "relationships", "title": "Dad", "insight": "Bills father was...", "time_period": "", "significance": 8}
-  ]
-}
-
 EXTRACTION RULES - MAXIMIZE CAPTURE:
 1. Create SEPARATE entries for EACH distinct event, person, insight, or detail
 2. EVERY PERSON mentioned = 1 relationships entry (even people mentioned in passing)
@@ -91,8 +135,6 @@ EXTRACTION RULES - MAXIMIZE CAPTURE:
 5. EVERY PREFERENCE or opinion = preferences or self_knowledge entry
 6. EVERY TIME/PLACE mentioned = include in time_period/insight
 7. Do NOT summarize multiple things into one entry
-8. Keep insight text clean - escape quotes, no special characters
-9. Output ONLY the JSON object, nothing else
 
 There is NO penalty for extracting too much. There IS a penalty for missing things.
 Extract EXHAUSTIVELY. Aim for 20-50+ entries per transcript."""
@@ -101,26 +143,19 @@ Extract EXHAUSTIVELY. Aim for 20-50+ entries per transcript."""
 def try_parse_json(text: str) -> Optional[Dict]:
     """Try multiple approaches to parse JSON from Claude's response."""
 
-    # Approach 1: Direct parse
+    # Approach 1: Direct parse - the common case, so no regex runs at all
     try:
-        return json.loads(text)
-    except:
+        return loads(text)
+    except ValueError:
         pass
 
     # Approach 2: Find JSON block in markdown
-    patterns = [
-        r'```json\s*(.*?)\s*```',
-        r'```\s*(.*?)\s*```',
-        r'\{[\s\S]*"extractions"[\s\S]*\}'
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.DOTALL)
+    for pattern, group in JSON_BLOCK_PATTERNS:
+        match = pattern.search(text)
         if match:
             try:
-                json_str = match.group(1) if '```' in pattern else match.group(0)
-                return json.loads(json_str)
-            except:
+                return loads(match.group(group))
+            except ValueError:
                 continue
 
     # Approach 3: Try to fix common issues
@@ -132,18 +167,28 @@ def try_parse_json(text: str) -> Optional[Dict]:
 
         # Fix common issues
         # Replace unescaped newlines in strings
-        json_str = re.sub(r'(?<!\\)\n(?=[^"]*"[^"]*(?:"[^"]*"[^"]*)*$)', '\\n', json_str)
+        json_str = UNESCAPED_NEWLINE_RE.sub('\\n', json_str)
 
         try:
             return json.loads(json_str)
-        except:
+        except ValueError:
+            pass
+
+    # Approach 3b: Truncated response - keep every complete value before the cutoff
+    if start >= 0:
+        try:
+            result = loads_partial(text[start:])
+            if isinstance(result, dict) and isinstance(result.get('extractions'), list):
+                # The entry cut off mid-object comes back with fields missing
+                valid = [ext for ext in result['extractions'] if is_valid_entry(ext)]
+                if valid:
+                    return {**result, 'extractions': valid}
+        except ValueError:
             pass
 
     # Approach 4: Extract entries using regex
     entries = []
-    entry_pattern = r'\{\s*"category"\s*:\s*"([^"]+)"\s*,\s*"title"\s*:\s*"([^"]+)"\s*,\s*"insight"\s*:\s*"([^"]+)"\s*,\s*"time_period"\s*:\s*"([^"]*)"\s*,\s*"significance"\s*:\s*(\d+)\s*\}'
-
-    for match in re.finditer(entry_pattern, text):
+    for match in ENTRY_RE.finditer(text):
         entries.append({
             'category': match.group(1),
             'title': match.group(2),
@@ -170,49 +215,75 @@ def run_extraction(client: Anthropic, transcript: str, extraction_prompt: str) -
 === TRANSCRIPT ===
 {transcript}"""
 
-    # Use streaming for Opus with high max_tokens (required for operations > 10 min)
-    response_text = ""
+    cache_key = extraction_cache.make_key(EXTRACTION_MODEL, PROMPT_VERSION, full_prompt)
+    cached = extraction_cache.get(cache_key)
+    if cached is not None:
+        return cached['result']
+
+    # Use streaming for Opus with high max_tokens (required for operations > 10 min).
+    # Nothing is shown while it runs, so let the SDK accumulate the reply.
     with client.messages.stream(
-        model="claude-opus-4-20250514",   # Use Opus for thorough extraction
+        model=EXTRACTION_MODEL,            # Use Opus for thorough extraction
         max_tokens=16000,                  # Large response for comprehensive extraction
+        tools=[EXTRACTION_TOOL],
+        tool_choice={"type": "tool", "name": EXTRACTION_TOOL['name']},
         messages=[{"role": "user", "content": full_prompt}]
     ) as stream:
-        for text in stream.text_stream:
-            response_text += text
+        message = stream.get_final_message()
+
+    result = None
+    for block in message.content:
+        if block.type == 'tool_use' and block.name == EXTRACTION_TOOL['name']:
+            result = block.input if isinstance(block.input.get('extractions'), list) else None
+            break
 
-    # Try to parse JSON
-    result = try_parse_json(response_text)
+    # Fall back to parsing a plain-text JSON reply
+    response_text = "".join(block.text for block in message.content if block.type == 'text')
+    if result is None:
+        result = try_parse_json(response_text)
 
     if result:
+        extraction_cache.put(cache_key, {'result': result, 'model': EXTRACTION_MODEL})
         return result
     else:
         return {"error": "Could not parse JSON", "raw_response": response_text[:1000]}
 
 
+# Result keys that hold entry lists, across the old and current prompt formats
+EXTRACTION_KEYS = ('factual_extractions', 'emotional_extractions', 'character_extractions',
+                   'cognitive_extractions', 'extractions')
+
+
+def normalize_extraction(ext: Dict[str, Any]) -> Dict[str, Any]:
+    """Map one extracted entry onto the fields the enricher expects."""
+    get = ext.get
+    # Fallback fields are only looked up when the primary one is missing
+    if 'insight' in ext:
+        insight = ext['insight']
+    elif 'observation' in ext:
+        insight = ext['observation']
+    else:
+        insight = get('content', '')
+    return {
+        'category': get('category', 'self_knowledge'),
+        'sub_category': get('sub_category', ''),
+        'title': get('title', ''),
+        'insight': insight,
+        'evidence': get('evidence', ''),
+        'time_period': ext['time_period'] if 'time_period' in ext else get('date', ''),
+        'analysis': get('analysis', ''),
+        'significance': get('significance', 5),
+        'action': 'insert'
+    }
+
+
 def flatten_extractions(extraction_result: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Flatten extraction result into a list of entries."""
-    entries = []
-
-    # Handle different extraction formats
-    for key in ['factual_extractions', 'emotional_extractions', 'character_extractions',
-                'cognitive_extractions', 'extractions']:
-        if key in extraction_result:
-            for ext in extraction_result[key]:
-                # Normalize the extraction format
-                normalized = {
-                    'category': ext.get('category', 'self_knowledge'),
-                    'sub_category': ext.get('sub_category', ''),
-                    'title': ext.get('title', ''),
-                    'insight': ext.get('insight', ext.get('observation', ext.get('content', ''))),
-                    'evidence': ext.get('evidence', ''),
-                    'time_period': ext.get('time_period', ext.get('date', '')),
-                    'analysis': ext.get('analysis', ''),
-                    'significance': ext.get('significance', 5),
-                    'action': 'insert'
-                }
-                entries.append(normalized)
-
-    return entries
+    return [
+        normalize_extraction(ext)
+        for key in EXTRACTION_KEYS if key in extraction_result
+        for ext in extraction_result[key]
+    ]
 
 
 def main():
@@ -221,6 +292,13 @@ def main():
     print("=" * 60)
     print()
 
+    # Find session files
+    session_files = sorted(SESSIONS_DIR.glob("session_*.json"))
+    print(f"Found {len(session_files)} session files")
+    print()
+    if not session_files:
+        return
+
     # Initialize
     client = Anthropic()
     enricher = DatabaseEnricher()
@@ -232,23 +310,15 @@ def main():
         'sessions_processed': 0,
         'transcripts_processed': 0,
         'entries_added': 0,
-        'entries_by_category': {},
+        'entries_by_category': Counter(),
         'sessions': [],
         'errors': []
     }
 
-    # Find session files
-    session_files = sorted(SESSIONS_DIR.glob("session_*.json"))
-    print(f"Found {len(session_files)} session files")
-    print()
-
-    for session_path in session_files:
+    for session_path, speeches in prefetch_speeches(session_files):
         session_id = session_path.stem
         print(f"Processing: {session_id}")
 
-        session = load_session(session_path)
-        speeches = extract_bill_speech(session)
-
         if not speeches:
             print(f"  No speech found, skipping")
             continue
@@ -257,7 +327,7 @@ def main():
             'session_id': session_id,
             'speeches_found': len(speeches),
             'entries_added': 0,
-            'categories': {}
+            'categories': Counter()
         }
 
         # Process each speech segment
@@ -282,10 +352,9 @@ def main():
                 continue
 
             # Add to database
-            for entry in entries:
-                category = entry.get('category', 'self_knowledge')
-                results['entries_by_category'][category] = results['entries_by_category'].get(category, 0) + 1
-                session_result['categories'][category] = session_result['categories'].get(category, 0) + 1
+            speech_counts = Counter(entry.get('category', 'self_knowledge') for entry in entries)
+            results['entries_by_category'].update(speech_counts)
+            session_result['categories'].update(speech_counts)
 
             # Use enricher to process
             process_result = enricher.process_extractions(entries, require_confirmation=False)
@@ -297,15 +366,20 @@ def main():
             print(f"    Added to database: {added}")
 
         results['sessions_processed'] += 1
+        session_result['categories'] = dict(session_result['categories'])
         results['sessions'].append(session_result)
         print(f"  Session complete: {session_result['entries_added']} entries added")
         print()
 
     # Save log
     results['completed_at'] = datetime.now().isoformat()
+    results['entries_by_category'] = dict(results['entries_by_category'])
 
-    with open(REEXTRACT_LOG, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2)
+    if ORJSON_AVAILABLE:
+        REEXTRACT_LOG.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(REEXTRACT_LOG, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
 
     print("=" * 60)
     print("RE-EXTRACTION COMPLETE")
@@ -7,11 +7,15 @@ This will process all session files and extract comprehensive data:
 - ANALYTICAL: patterns, wisdom, decisions, growth (20-40 entries)
 """
 
+import asyncio
+import argparse
+import hashlib
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -19,22 +23,196 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from dotenv import load_dotenv
 load_dotenv()
 
-from biographer.multi_pass_extraction import MultiPassExtractor, extract_from_session
+# Optional faster serializer for the (large) results log
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from biographer.multi_pass_extraction import MultiPassExtractor, extract_from_session, PROMPT_VERSION
 from biographer.enricher import DatabaseEnricher
-from biographer.embeddings import VectorStore
+from biographer.session_io import loads
+
+# Sessions extracted at once. Each session already runs its three passes
+# concurrently, so keep this modest to stay inside API rate limits.
+CONCURRENCY = 4
+
+LOG_PATH = Path(__file__).parent / "logs" / "multipass_reextract_all.json"
+# One session record per line, appended as each session finishes, so a run
+# that dies before writing LOG_PATH doesn't lose track of finished sessions.
+# Removed once LOG_PATH is written.
+PROGRESS_PATH = LOG_PATH.with_suffix('.progress.ndjson')
+
+
+def dumps_line(record: Dict[str, Any]) -> bytes:
+    """One NDJSON line, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+
+
+def append_progress(record: Dict[str, Any]):
+    """Append a finished session's record to PROGRESS_PATH."""
+    with open(PROGRESS_PATH, 'ab') as f:
+        f.write(dumps_line(record))
+
+
+def load_processed_sessions() -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+    """Map (session, session_hash, prompt_version) to its record from the last
+    run's log and from any interrupted run's progress file."""
+    records = []
+    if LOG_PATH.exists():
+        try:
+            with open(LOG_PATH, 'rb') as f:
+                previous = loads(f.read())
+            records.extend(previous.get('sessions', []))
+        except (OSError, ValueError):
+            pass
+    if PROGRESS_PATH.exists():
+        with open(PROGRESS_PATH, 'rb') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    pass  # Line cut short by the crash
+    return {
+        (s['session'], s.get('session_hash'), s.get('prompt_version')): s
+        for s in records
+    }
+
+
+async def process_session(
+    session_path: Path,
+    session_hash: str,
+    enricher: DatabaseEnricher,
+    extractor: MultiPassExtractor,
+    results: Dict[str, Any],
+    semaphore: asyncio.Semaphore,
+    db_lock: asyncio.Lock
+):
+    """Extract one session and save its entries, recording the outcome in results."""
+    session_name = session_path.stem
+
+    try:
+        async with semaphore:
+            print(f"\nProcessing: {session_name}")
+            # Run multi-pass extraction (cached, so unchanged sessions are free)
+            result = await extract_from_session(session_path, extractor=extractor)
+
+        if not result.get('extractions'):
+            print(f"  {session_name}: No extractions found")
+            results['errors'].append(f"{session_name}: No extractions")
+            return
+
+        extractions = result['extractions']
+        print(f"\n  {session_name}: Total extractions: {len(extractions)}")
+
+        # Add action field
+        for ext in extractions:
+            ext['action'] = 'insert'
+
+        # Save to database, one session at a time, off the event loop
+        async with db_lock:
+            save_result = await asyncio.to_thread(
+                enricher.process_extractions, extractions, require_confirmation=False
+            )
+            added = save_result.get('added', 0)
+
+            # Track results
+            results['extractions_by_category'].update(
+                ext.get('category', 'unknown') for ext in extractions
+            )
+            results['sessions_processed'] += 1
+            results['total_extractions'] += len(extractions)
+            record = {
+                'session': session_name,
+                'session_hash': session_hash,
+                'prompt_version': PROMPT_VERSION,
+                'extractions': len(extractions),
+                'added': added,
+                'categories': result.get('category_counts', {})
+            }
+            results['sessions'].append(record)
+            await asyncio.to_thread(append_progress, record)
+
+        print(f"  {session_name}: Added to database: {added}")
+
+    except Exception as e:
+        error_msg = f"{session_name}: {str(e)}"
+        print(f"  ERROR: {error_msg}")
+        results['errors'].append(error_msg)
+
+
+async def process_all_sessions(
+    session_files: List[Path],
+    session_hashes: Dict[Path, str],
+    enricher: DatabaseEnricher,
+    results: Dict[str, Any]
+):
+    """Run process_session over every file, CONCURRENCY at a time."""
+    # One extractor (and so one API client) for the whole run; cached, so
+    # unchanged sessions are free
+    extractor = MultiPassExtractor(use_cache=True)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    db_lock = asyncio.Lock()
+    await asyncio.gather(*(
+        process_session(path, session_hashes[path], enricher, extractor, results, semaphore, db_lock)
+        for path in session_files
+    ))
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Re-extract all sessions with multi-pass extraction')
+    parser.add_argument('sessions', nargs='*', type=Path,
+                        help='Session files to process (default: every file in logs/sessions)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-process sessions already extracted with the current prompt version')
+    args = parser.parse_args()
+
     print("=" * 70)
     print("MULTI-PASS RE-EXTRACTION OF ALL SESSIONS")
     print("=" * 70)
     print()
 
-    # Find all session files
-    sessions_dir = Path(__file__).parent / "logs" / "sessions"
-    session_files = sorted(sessions_dir.glob("session_*.json"))
+    # Find all session files, unless given a list. Everything named on one
+    # command line shares this run's model and client setup.
+    if args.sessions:
+        session_files = sorted(set(args.sessions))
+    else:
+        sessions_dir = Path(__file__).parent / "logs" / "sessions"
+        session_files = sorted(sessions_dir.glob("session_*.json"))
 
     print(f"Found {len(session_files)} session files")
+    if not session_files:
+        return
+
+    # Skip sessions whose content and prompt version match the last run,
+    # carrying their records forward so the next run skips them too
+    session_hashes = {
+        path: hashlib.sha256(path.read_bytes()).hexdigest() for path in session_files
+    }
+    previous = load_processed_sessions()
+    processed = {} if args.force else previous
+    carried = []
+    if args.sessions:
+        # A partial run keeps the other sessions' records in the log
+        names = {path.stem for path in session_files}
+        carried.extend({
+            record['session']: record
+            for record in previous.values() if record['session'] not in names
+        }.values())
+    skipped = len(carried)
+    pending = []
+    for path in session_files:
+        record = processed.get((path.stem, session_hashes[path], PROMPT_VERSION))
+        if record is not None:
+            carried.append(record)
+        else:
+            pending.append(path)
+    skipped = len(carried) - skipped
+    if skipped:
+        print(f"Skipping {skipped} unchanged sessions (use --force to re-process)")
     print()
 
     # Initialize enricher
@@ -44,63 +222,27 @@ def main():
     results = {
         'started_at': datetime.now().isoformat(),
         'sessions_processed': 0,
+        'sessions_skipped': skipped,
         'total_extractions': 0,
-        'extractions_by_category': {},
+        'extractions_by_category': Counter(),
         'sessions': [],
         'errors': []
     }
 
-    # Process each session
-    for session_path in session_files:
-        session_name = session_path.stem
-        print(f"\n{'=' * 60}")
-        print(f"Processing: {session_name}")
-        print("=" * 60)
-
-        try:
-            # Run multi-pass extraction
-            result = extract_from_session(session_path)
-
-            if not result.get('extractions'):
-                print("  No extractions found")
-                results['errors'].append(f"{session_name}: No extractions")
-                continue
-
-            extractions = result['extractions']
-            print(f"\n  Total extractions: {len(extractions)}")
-
-            # Add action field and save to database
-            for ext in extractions:
-                ext['action'] = 'insert'
-                cat = ext.get('category', 'unknown')
-                results['extractions_by_category'][cat] = results['extractions_by_category'].get(cat, 0) + 1
-
-            # Save to database
-            save_result = enricher.process_extractions(extractions, require_confirmation=False)
-            added = save_result.get('added', 0)
-
-            print(f"  Added to database: {added}")
-
-            # Track results
-            results['sessions_processed'] += 1
-            results['total_extractions'] += len(extractions)
-            results['sessions'].append({
-                'session': session_name,
-                'extractions': len(extractions),
-                'added': added,
-                'categories': result.get('category_counts', {})
-            })
-
-        except Exception as e:
-            error_msg = f"{session_name}: {str(e)}"
-            print(f"  ERROR: {e}")
-            results['errors'].append(error_msg)
+    # Process sessions concurrently
+    asyncio.run(process_all_sessions(pending, session_hashes, enricher, results))
+    results['sessions'].extend(carried)
+    # Completion order varies; keep the log in session order
+    results['sessions'].sort(key=lambda s: s['session'])
 
     # Sync vector database
     print("\n" + "=" * 70)
     print("SYNCING VECTOR DATABASE")
     print("=" * 70)
 
+    # Imported here: it loads the embedding model stack (torch, chromadb)
+    from biographer.embeddings import VectorStore
+
     store = VectorStore()
     store.sync_from_sqlite()
     final_count = store.get_entry_count()
@@ -109,11 +251,13 @@ def main():
     # Final summary
     results['completed_at'] = datetime.now().isoformat()
     results['final_vector_count'] = final_count
+    results['extractions_by_category'] = dict(results['extractions_by_category'])
 
     print("\n" + "=" * 70)
     print("RE-EXTRACTION COMPLETE")
     print("=" * 70)
     print(f"Sessions processed: {results['sessions_processed']}")
+    print(f"Sessions skipped (unchanged): {results['sessions_skipped']}")
     print(f"Total extractions: {results['total_extractions']}")
     print(f"Vector DB entries: {final_count}")
     print()
@@ -128,12 +272,15 @@ def main():
             print(f"  - {err}")
 
     # Save log
-    log_path = Path(__file__).parent / "logs" / "multipass_reextract_all.json"
-    with open(log_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        LOG_PATH.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(LOG_PATH, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+    PROGRESS_PATH.unlink(missing_ok=True)
 
     print()
-    print(f"Log saved to: {log_path}")
+    print(f"Log saved to: {LOG_PATH}")
 
 
 if __name__ == '__main__':
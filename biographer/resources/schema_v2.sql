@@ -0,0 +1,90 @@
+-- New tables for v2.0 extraction (schema_upgrade_v2.py)
+
+-- Sensory Memories table
+CREATE TABLE IF NOT EXISTS sensory_memories (
+    id INTEGER PRIMARY KEY,
+    title TEXT,
+    modality TEXT,  -- visual, auditory, olfactory, tactile, gustatory
+    sensory_content TEXT,
+    associated_memory TEXT,
+    emotional_charge TEXT,
+    triggers_memory INTEGER DEFAULT 0,  -- 1 if encountering sensation triggers memory
+    source_quote TEXT,
+    evidence_type TEXT,
+    life_period TEXT,
+    approximate_year INTEGER,
+    prompt_version TEXT,
+    date_recorded TEXT
+);
+
+-- Creative Works table
+CREATE TABLE IF NOT EXISTS creative_works (
+    id INTEGER PRIMARY KEY,
+    title TEXT,
+    medium TEXT,  -- music, writing, visual art, software, etc
+    description TEXT,
+    date_created TEXT,
+    motivation TEXT,
+    reception TEXT,
+    current_status TEXT,  -- completed, in_progress, abandoned
+    source_quote TEXT,
+    evidence_type TEXT,
+    life_period TEXT,
+    approximate_year INTEGER,
+    prompt_version TEXT,
+    date_recorded TEXT
+);
+
+-- Skills & Competencies table
+CREATE TABLE IF NOT EXISTS skills_competencies (
+    id INTEGER PRIMARY KEY,
+    skill_name TEXT,
+    category TEXT,  -- professional, life, physical, creative, technical
+    proficiency_level TEXT,  -- novice, competent, proficient, expert, master
+    how_acquired TEXT,
+    years_practiced INTEGER,
+    last_used TEXT,
+    source_quote TEXT,
+    evidence_type TEXT,
+    life_period TEXT,
+    approximate_year INTEGER,
+    prompt_version TEXT,
+    date_recorded TEXT
+);
+
+-- Connections table (relational graph layer)
+CREATE TABLE IF NOT EXISTS entry_connections (
+    entry_1_table TEXT NOT NULL,
+    entry_1_id INTEGER,
+    entry_1_title TEXT NOT NULL,
+    entry_2_table TEXT NOT NULL,
+    entry_2_id INTEGER,
+    entry_2_title TEXT NOT NULL,
+    connection_type TEXT NOT NULL,  -- caused_by, led_to, contradicts, reinforces, transforms, co_occurred, same_theme, involves_same_person, involves_same_place, same_source_different_facet
+    description TEXT,
+    source_pass TEXT,  -- which extraction pass identified this
+    date_recorded TEXT,
+    -- Clustered by endpoint: the extractor names entries by table and title
+    PRIMARY KEY (entry_1_table, entry_1_title, entry_2_table, entry_2_title, connection_type)
+) WITHOUT ROWID;
+
+-- Both ends are looked up when walking the graph
+CREATE INDEX IF NOT EXISTS idx_entry_conn_1 ON entry_connections(entry_1_table, entry_1_id);
+CREATE INDEX IF NOT EXISTS idx_entry_conn_2 ON entry_connections(entry_2_table, entry_2_id);
+
+-- Aspirations table (forward-looking goals)
+CREATE TABLE IF NOT EXISTS aspirations (
+    id INTEGER PRIMARY KEY,
+    title TEXT,
+    description TEXT,
+    category TEXT,  -- personal, professional, creative, relational, spiritual
+    urgency TEXT,  -- urgent, patient, wistful
+    achievability TEXT,  -- achievable, uncertain, symbolic
+    time_horizon TEXT,  -- near_term, mid_term, long_term, ongoing
+    source_quote TEXT,
+    evidence_type TEXT,
+    life_period TEXT,
+    approximate_year INTEGER,
+    prompt_version TEXT,
+    date_recorded TEXT
+);
@@ -4,201 +4,355 @@ Schema upgrade for v2.0 extraction system.
 Adds:
 - New columns to existing tables (source_quote, evidence_type, life_period, approximate_year)
 - New tables (sensory_memories, creative_works, skills_competencies, connections)
+- evidence and source_quote columns in the entries_fts full-text index
+- Prefix indexes for exact-match lookups of the same columns
 """
 
 import sqlite3
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict, List
 
+try:
+    from .setup_database import fts_source, rebuild_fts
+except ImportError:
+    from setup_database import fts_source, rebuild_fts  # Run directly as a script
 
-def upgrade_schema(db_path: Path):
-    """Upgrade the database schema for v2.0 extraction."""
+# DDL for the new tables (and their indexes)
+SCHEMA_SQL_PATH = Path(__file__).parent / "resources" / "schema_v2.sql"
+NEW_TABLES = ['sensory_memories', 'creative_works', 'skills_competencies', 'entry_connections', 'aspirations']
+
+# Stored in PRAGMA user_version once the upgrade has been applied;
+# bumped whenever this upgrade gains a step. Separate from
+# setup_database.BASE_SCHEMA_VERSION (schema_meta), the version of the
+# full schema create_schema builds; the two are bumped independently.
+UPGRADE_VERSION = 4
+
+# Tables that should receive the new columns
+# These are the cognitive architecture tables used by extraction
+TABLES_TO_UPGRADE = [
+    'life_events', 'relationships', 'stories', 'self_knowledge',
+    'preferences', 'joys', 'sorrows', 'wounds', 'fears', 'loves',
+    'losses', 'regrets', 'longings', 'healings', 'decisions',
+    'wisdom', 'reasoning_patterns', 'growth', 'strengths',
+    'vulnerabilities', 'value_hierarchies', 'contradictions',
+    'mistakes', 'cognitive_biases', 'meaning_structures',
+    'mortality_awareness', 'body_knowledge', 'philosophies',
+    'questions', 'aspirations'
+]
+
+# New columns to add
+V2_COLUMNS = [
+    ('source_quote', 'TEXT'),           # Verbatim quote from transcript
+    ('evidence_type', 'TEXT'),          # direct_statement|paraphrase|inference|behavioral_observation
+    ('life_period', 'TEXT'),            # childhood|adolescence|young_adult|etc
+    ('approximate_year', 'INTEGER'),    # Year if known
+    ('prompt_version', 'TEXT'),         # Which extraction prompt version generated this
+]
+
+# Tables whose evidence / source_quote text gets a quote lookup index
+EVIDENCE_TABLES = TABLES_TO_UPGRADE + [
+    'sensory_memories', 'creative_works', 'skills_competencies',
+    'beauties', 'inferred_patterns'
+]
+EVIDENCE_COLUMNS = ('evidence', 'source_quote')
+
+# Exact-match lookups on evidence/source_quote go through an index on
+# this many leading characters, then compare the full text
+QUOTE_KEY_CHARS = 64
+
+
+def _split_statements(script: str):
+    """Yield the complete SQL statements in a script, one at a time."""
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            yield statement.strip()
+            statement = ""
+
+
+def _columns_by_table(cursor):
+    """Every table's column names, in one query."""
+    cursor.execute(
+        "SELECT m.name, p.name FROM sqlite_master m, pragma_table_info(m.name) p "
+        "WHERE m.type='table'"
+    )
+    cols_by_table = defaultdict(set)
+    for table_name, col_name in cursor.fetchall():
+        cols_by_table[table_name].add(col_name)
+    return cols_by_table
+
+
+def _is_fresh(cursor, tables) -> bool:
+    """True if none of the existing tables has ever held a row."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_sequence'")
+    has_sequence = cursor.fetchone() is not None
+
+    for table in tables:
+        cursor.execute(f"SELECT EXISTS(SELECT 1 FROM {table})")
+        if cursor.fetchone()[0]:
+            return False
+        # An emptied AUTOINCREMENT table still remembers its ids
+        if has_sequence:
+            cursor.execute("SELECT 1 FROM sqlite_sequence WHERE name=?", (table,))
+            if cursor.fetchone() is not None:
+                return False
+    return True
+
+
+def _rebuild_with_columns(cursor, table: str, columns) -> bool:
+    """Recreate an empty table with the columns inline in its CREATE TABLE.
+
+    One DROP + CREATE instead of an ALTER per column. Returns False (with
+    nothing changed) if the stored definition can't take the columns,
+    e.g. it ends in a table constraint.
+    """
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,))
+    table_sql = cursor.fetchone()[0]
+    cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type IN ('index', 'trigger') "
+        "AND tbl_name=? AND sql IS NOT NULL",
+        (table,)
+    )
+    dependent_sqls = [row[0] for row in cursor.fetchall()]
+
+    # Insert before the closing paren, as ALTER TABLE does, leaving any
+    # trailing "-- comment" line ending where it was
+    close = table_sql.rfind(')')
+    column_defs = ", ".join(f"{name} {col_type}" for name, col_type in columns)
+    new_sql = f"{table_sql[:close]}, {column_defs}{table_sql[close:]}"
+
+    cursor.execute("SAVEPOINT rebuild")
+    try:
+        cursor.execute(f"DROP TABLE {table}")
+        cursor.execute(new_sql)
+        for dependent_sql in dependent_sqls:
+            cursor.execute(dependent_sql)
+    except sqlite3.Error:
+        cursor.execute("ROLLBACK TO rebuild")
+        return False
+    finally:
+        cursor.execute("RELEASE rebuild")
+    return True
+
+
+def _create_quote_key_indexes(cursor) -> List[str]:
+    """Index the leading QUOTE_KEY_CHARS of each evidence/source_quote column.
+
+    SQLite keeps expression indexes up to date itself, so writers don't
+    need to compute anything, and the index holds only a short key
+    instead of whole quotes.
+    """
+    cols_by_table = _columns_by_table(cursor)
+    created = []
+    for table in EVIDENCE_TABLES:
+        for col in EVIDENCE_COLUMNS:
+            if col not in cols_by_table.get(table, ()):
+                continue
+            index_name = f"idx_{table}_{col}_key"
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {index_name} "
+                f"ON {table}(substr({col}, 1, {QUOTE_KEY_CHARS}))"
+            )
+            created.append(index_name)
+    return created
+
+
+def find_quote(db_path: Path, text: str):
+    """Find entries whose evidence or source_quote is exactly text.
+
+    Returns (table_name, column, row_id) tuples. Each lookup narrows by
+    the indexed prefix before comparing the full text.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.cursor()
+        cols_by_table = _columns_by_table(cursor)
+        matches = []
+        for table in EVIDENCE_TABLES:
+            for col in EVIDENCE_COLUMNS:
+                if col not in cols_by_table.get(table, ()):
+                    continue
+                # The unary + stops SQLite propagating "col = ?" into the
+                # substr() term, which would keep it from matching the index
+                cursor.execute(
+                    f"SELECT id FROM {table} "
+                    f"WHERE substr({col}, 1, {QUOTE_KEY_CHARS}) = substr(?, 1, {QUOTE_KEY_CHARS}) "
+                    f"AND +{col} = ?",
+                    (text, text)
+                )
+                matches.extend((table, col, row[0]) for row in cursor.fetchall())
+        return matches
+    finally:
+        conn.close()
+
+
+def search_evidence(db_path: Path, query: str, limit: int = 20):
+    """Full-text search over evidence and source quotes.
+
+    query uses FTS5 syntax (words, "exact phrases", OR, prefix*).
+    Returns (table_name, row_id, rank) tuples, best match first.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT rowid, rank FROM entries_fts WHERE entries_fts MATCH ? "
+            "ORDER BY rank LIMIT ?",
+            (f"{{evidence source_quote}} : ({query})", limit)
+        )
+        return [(*fts_source(rowid), rank) for rowid, rank in cursor.fetchall()]
+    finally:
+        conn.close()
+
+
+def _quiet(*args, **kwargs):
+    pass
+
+
+def upgrade_schema(db_path: Path, verbose: bool = False) -> Dict[str, Any]:
+    """Upgrade the database schema for v2.0 extraction.
+
+    Progress is printed only when verbose. Returns what was done and
+    found, so callers can check the result without parsing output.
+    """
+    log = print if verbose else _quiet
+    result = {
+        'skipped': False,
+        'columns_added': {},
+        'fts_tables': [],
+        'quote_key_indexes': [],
+        'tables_present': {},
+        'life_events_new_columns': [],
+    }
 
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
-    print("=" * 60)
-    print("SCHEMA UPGRADE FOR V2.0 EXTRACTION")
-    print("=" * 60)
-
-    # Tables that should receive the new columns
-    # These are the cognitive architecture tables used by extraction
-    tables_to_upgrade = [
-        'life_events', 'relationships', 'stories', 'self_knowledge',
-        'preferences', 'joys', 'sorrows', 'wounds', 'fears', 'loves',
-        'losses', 'regrets', 'longings', 'healings', 'decisions',
-        'wisdom', 'reasoning_patterns', 'growth', 'strengths',
-        'vulnerabilities', 'value_hierarchies', 'contradictions',
-        'mistakes', 'cognitive_biases', 'meaning_structures',
-        'mortality_awareness', 'body_knowledge', 'philosophies',
-        'questions', 'aspirations'
-    ]
+    log("=" * 60)
+    log("SCHEMA UPGRADE FOR V2.0 EXTRACTION")
+    log("=" * 60)
 
-    # New columns to add
-    new_columns = [
-        ('source_quote', 'TEXT'),           # Verbatim quote from transcript
-        ('evidence_type', 'TEXT'),          # direct_statement|paraphrase|inference|behavioral_observation
-        ('life_period', 'TEXT'),            # childhood|adolescence|young_adult|etc
-        ('approximate_year', 'INTEGER'),    # Year if known
-        ('prompt_version', 'TEXT'),         # Which extraction prompt version generated this
-    ]
+    # Already upgraded: skip all the discovery and IF NOT EXISTS checks
+    cursor.execute("PRAGMA user_version")
+    user_version = cursor.fetchone()[0]
+    if user_version >= UPGRADE_VERSION:
+        log(f"\n  [SKIP] schema is already at version {user_version}")
+        conn.close()
+        result['skipped'] = True
+        return result
 
-    print("\n--- Adding new columns to existing tables ---")
+    # All the ALTERs and CREATEs go in one transaction: one commit (and
+    # fsync) instead of one per statement, and nothing half-applied on failure
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("BEGIN")
+    try:
+        log("\n--- Adding new columns to existing tables ---")
 
-    for table in tables_to_upgrade:
-        # Check if table exists
-        cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table}'")
-        if not cursor.fetchone():
-            print(f"  [SKIP] {table} - table does not exist")
-            continue
+        # Every table's columns in one query, instead of an existence check
+        # and a PRAGMA table_info per table
+        cols_by_table = _columns_by_table(cursor)
 
-        # Get existing columns
-        cursor.execute(f"PRAGMA table_info({table})")
-        existing_cols = {row[1] for row in cursor.fetchall()}
+        # On a new database the tables are still empty, so each one can be
+        # recreated with all its new columns at once
+        fresh = _is_fresh(cursor, [t for t in TABLES_TO_UPGRADE if t in cols_by_table])
 
-        # Add missing columns
-        added = []
-        for col_name, col_type in new_columns:
-            if col_name not in existing_cols:
+        for table in TABLES_TO_UPGRADE:
+            if table not in cols_by_table:
+                log(f"  [SKIP] {table} - table does not exist")
+                continue
+            existing_cols = cols_by_table[table]
+            missing = [(name, col_type) for name, col_type in V2_COLUMNS if name not in existing_cols]
+
+            if fresh and missing and _rebuild_with_columns(cursor, table, missing):
+                result['columns_added'][table] = [name for name, _ in missing]
+                log(f"  [OK] {table}: rebuilt with {', '.join(name for name, _ in missing)}")
+                continue
+
+            # Add missing columns
+            added = []
+            for col_name, col_type in missing:
                 try:
                     cursor.execute(f"ALTER TABLE {table} ADD COLUMN {col_name} {col_type}")
                     added.append(col_name)
                 except sqlite3.Error as e:
-                    print(f"  [ERROR] {table}.{col_name}: {e}")
-
-        if added:
-            print(f"  [OK] {table}: added {', '.join(added)}")
-        else:
-            print(f"  [SKIP] {table}: columns already exist")
-
-    # Create new tables
-    print("\n--- Creating new tables ---")
-
-    # Sensory Memories table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS sensory_memories (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            modality TEXT,  -- visual, auditory, olfactory, tactile, gustatory
-            sensory_content TEXT,
-            associated_memory TEXT,
-            emotional_charge TEXT,
-            triggers_memory INTEGER DEFAULT 0,  -- 1 if encountering sensation triggers memory
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
-    print("  [OK] sensory_memories table created/verified")
-
-    # Creative Works table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS creative_works (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            medium TEXT,  -- music, writing, visual art, software, etc
-            description TEXT,
-            date_created TEXT,
-            motivation TEXT,
-            reception TEXT,
-            current_status TEXT,  -- completed, in_progress, abandoned
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
-    print("  [OK] creative_works table created/verified")
-
-    # Skills & Competencies table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS skills_competencies (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            skill_name TEXT,
-            category TEXT,  -- professional, life, physical, creative, technical
-            proficiency_level TEXT,  -- novice, competent, proficient, expert, master
-            how_acquired TEXT,
-            years_practiced INTEGER,
-            last_used TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
-    print("  [OK] skills_competencies table created/verified")
-
-    # Connections table (relational graph layer)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS entry_connections (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            entry_1_table TEXT,
-            entry_1_id INTEGER,
-            entry_1_title TEXT,
-            entry_2_table TEXT,
-            entry_2_id INTEGER,
-            entry_2_title TEXT,
-            connection_type TEXT,  -- caused_by, led_to, contradicts, reinforces, transforms, co_occurred, same_theme, involves_same_person, involves_same_place, same_source_different_facet
-            description TEXT,
-            source_pass TEXT,  -- which extraction pass identified this
-            date_recorded TEXT
-        )
-    """)
-    print("  [OK] entry_connections table created/verified")
-
-    # Aspirations table (forward-looking goals)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS aspirations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            description TEXT,
-            category TEXT,  -- personal, professional, creative, relational, spiritual
-            urgency TEXT,  -- urgent, patient, wistful
-            achievability TEXT,  -- achievable, uncertain, symbolic
-            time_horizon TEXT,  -- near_term, mid_term, long_term, ongoing
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
-    print("  [OK] aspirations table created/verified")
+                    log(f"  [ERROR] {table}.{col_name}: {e}")
+
+            if added:
+                result['columns_added'][table] = added
+                log(f"  [OK] {table}: added {', '.join(added)}")
+            else:
+                log(f"  [SKIP] {table}: columns already exist")
+
+        # Create new tables
+        log("\n--- Creating new tables ---")
+
+        # One statement at a time: executescript would commit the
+        # transaction opened above
+        for statement in _split_statements(SCHEMA_SQL_PATH.read_text(encoding='utf-8')):
+            cursor.execute(statement)
+        for table in NEW_TABLES:
+            log(f"  [OK] {table} table created/verified")
+
+        # Re-index with the new source_quote columns, so evidence can be
+        # searched without a LIKE scan of every table
+        log("\n--- Rebuilding search index ---")
+        try:
+            result['fts_tables'] = rebuild_fts(cursor)
+            log(f"  [OK] entries_fts indexing {len(result['fts_tables'])} tables")
+        except sqlite3.OperationalError as e:
+            log(f"  [SKIP] entries_fts - FTS5 not available ({e})")
+
+        result['quote_key_indexes'] = _create_quote_key_indexes(cursor)
+        log(f"  [OK] {len(result['quote_key_indexes'])} quote lookup indexes created/verified")
+
+        cursor.execute(f"PRAGMA user_version = {UPGRADE_VERSION}")
+    except Exception:
+        conn.rollback()
+        conn.close()
+        raise
 
     # Commit changes
     conn.commit()
 
-    # Verify the upgrade
-    print("\n--- Verification ---")
+    # Verify the upgrade: the new tables and a sample table's columns, in one query
+    check_tables = NEW_TABLES + ['life_events']
+    cursor.execute(
+        "SELECT m.name, p.name FROM sqlite_master m, pragma_table_info(m.name) p "
+        f"WHERE m.type='table' AND m.name IN ({', '.join('?' * len(check_tables))})",
+        check_tables
+    )
+    found = defaultdict(set)
+    for table_name, col_name in cursor.fetchall():
+        found[table_name].add(col_name)
+    conn.close()
 
-    # Check a sample table
-    cursor.execute("PRAGMA table_info(life_events)")
-    cols = [row[1] for row in cursor.fetchall()]
-    new_cols_present = [c for c in ['source_quote', 'evidence_type', 'life_period', 'approximate_year'] if c in cols]
-    print(f"  life_events new columns: {new_cols_present}")
+    result['tables_present'] = {table: table in found for table in NEW_TABLES}
+    result['life_events_new_columns'] = [
+        c for c in ['source_quote', 'evidence_type', 'life_period', 'approximate_year']
+        if c in found['life_events']
+    ]
 
-    # Check new tables exist
-    for table in ['sensory_memories', 'creative_works', 'skills_competencies', 'entry_connections', 'aspirations']:
-        cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table}'")
-        exists = cursor.fetchone() is not None
-        print(f"  {table}: {'EXISTS' if exists else 'MISSING'}")
+    log("\n--- Verification ---")
+    log(f"  life_events new columns: {result['life_events_new_columns']}")
+    for table, exists in result['tables_present'].items():
+        log(f"  {table}: {'EXISTS' if exists else 'MISSING'}")
 
-    conn.close()
+    log("\n" + "=" * 60)
+    log("SCHEMA UPGRADE COMPLETE")
+    log("=" * 60)
 
-    print("\n" + "=" * 60)
-    print("SCHEMA UPGRADE COMPLETE")
-    print("=" * 60)
+    return result
 
 
 if __name__ == '__main__':
     db_path = Path(__file__).parent.parent / "bill_knowledge_base.db"
+    if not db_path.exists():
+        # A new database gets the full schema directly; the upgrade below
+        # then only adds the indexes and stamps the version
+        from setup_database import create_schema
+        create_schema(db_path)
     print(f"Upgrading database: {db_path}")
-    upgrade_schema(db_path)
+    upgrade_schema(db_path, verbose=True)
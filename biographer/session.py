@@ -1,10 +1,83 @@
 """Session management for maintaining conversation continuity."""
 
+import atexit
 import json
 import os
+import threading
+import time
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Deque
+
+# File locking for the session counter
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+try:
+    from .session_io import loads as _loads
+except ImportError:
+    from session_io import loads as _loads  # Run directly as a script
+
+# Optional faster JSON serializer for session files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional incremental parser, so reading insights from archived sessions
+# doesn't build every message object too
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Changes made within this many seconds of each other share one save
+SAVE_DELAY = 0.5
+
+
+def _dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes with orjson if installed, else json."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _fsync_directory(path: Path):
+    """Flush a directory entry (e.g. after a rename) to disk. No-op on Windows."""
+    if os.name == 'nt':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _lock_file(f):
+    """Take an exclusive lock on an open file (blocking)."""
+    if os.name == 'nt':
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(f):
+    """Release a lock taken by _lock_file."""
+    if os.name == 'nt':
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
 
 class Session:
@@ -16,30 +89,50 @@ class Session:
         self.session_dir = Path(session_dir)
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
+        # OneDrive can lock files mid-sync, so saves there retry the replace;
+        # anywhere else one fsync + replace is enough
+        self._is_onedrive = 'OneDrive' in str(self.session_dir.resolve())
+
         self.current_session_file = self.session_dir / "current_session.json"
+        # Messages are appended here one line each, so adding a message
+        # doesn't rewrite the whole history in current_session.json
+        self.messages_log = self.session_dir / "current_session.messages.jsonl"
+        self._messages_file = None
         self.history_dir = self.session_dir / "history"
         self.history_dir.mkdir(parents=True, exist_ok=True)
 
         # Current session state
         self.session_id: Optional[str] = None
         self.started_at: Optional[str] = None
-        self.messages: List[Dict[str, str]] = []
+        self.messages: Deque[Dict[str, str]] = deque()
         self.topics_explored: List[str] = []
         self.topics_remaining: List[str] = []
         self.insights_gathered: List[Dict[str, Any]] = []
         self.metadata: Dict[str, Any] = {}
 
+        # Number of archived sessions, kept in a counter file so it doesn't
+        # take a scan of history/ to find
+        self.counter_file = self.session_dir / ".counter"
+        self._session_count: Optional[int] = None
+
+        # Saves are coalesced on a timer; anything pending is written at exit
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        atexit.register(self._flush)
+
     def start_new_session(self) -> str:
         """Start a new session."""
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.started_at = datetime.now().isoformat()
-        self.messages = []
+        self.messages = deque()
         self.topics_explored = []
         self.insights_gathered = []
         self.metadata = {
             "session_number": self._get_session_count() + 1,
         }
-        self._save()
+        self._open_messages_log(rewrite=True)
+        self._schedule_save()
         return self.session_id
 
     def load_previous_session(self) -> bool:
@@ -48,30 +141,40 @@ class Session:
             return False
 
         try:
-            with open(self.current_session_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _loads(self.current_session_file.read_bytes())
 
             self.session_id = data.get('session_id')
             self.started_at = data.get('started_at')
-            self.messages = data.get('messages', [])
             self.topics_explored = data.get('topics_explored', [])
             self.topics_remaining = data.get('topics_remaining', [])
             self.insights_gathered = data.get('insights_gathered', [])
             self.metadata = data.get('metadata', {})
 
+            if 'messages' in data:
+                # Saved before messages moved to their own log
+                self.messages = deque(data['messages'])
+                self._open_messages_log(rewrite=True)
+            else:
+                self.messages = deque(self._read_messages_log())
+                self._open_messages_log()
+
             return True
-        except (json.JSONDecodeError, KeyError) as e:
+        except (ValueError, KeyError) as e:
             print(f"Error loading session: {e}")
             return False
 
     def add_message(self, role: str, content: str):
         """Add a message to the conversation history."""
-        self.messages.append({
+        message = {
             "role": role,
             "content": content,
             "timestamp": datetime.now().isoformat()
-        })
-        self._save()
+        }
+        self.messages.append(message)
+
+        if self._messages_file is None:
+            self._open_messages_log()
+        self._messages_file.write(_dumps(message) + b"\n")
 
     def add_topic_explored(self, topic: str):
         """Mark a topic as explored."""
@@ -79,23 +182,24 @@ class Session:
             self.topics_explored.append(topic)
             if topic in self.topics_remaining:
                 self.topics_remaining.remove(topic)
-            self._save()
+            self._schedule_save()
 
     def set_topics_remaining(self, topics: List[str]):
         """Set the list of topics to explore."""
         self.topics_remaining = [t for t in topics if t not in self.topics_explored]
-        self._save()
+        self._schedule_save()
 
     def add_insight(self, insight: Dict[str, Any]):
         """Add a gathered insight."""
         insight['gathered_at'] = datetime.now().isoformat()
         self.insights_gathered.append(insight)
-        self._save()
+        self._schedule_save()
 
     def get_conversation_context(self, max_messages: int = 20) -> List[Dict[str, str]]:
         """Get recent messages for context."""
-        # Return the most recent messages
-        recent = self.messages[-max_messages:] if len(self.messages) > max_messages else self.messages
+        # Walk back from the newest message, touching only the ones returned
+        recent = list(islice(reversed(self.messages), max_messages))
+        recent.reverse()
         # Convert to Claude format
         return [{"role": m["role"], "content": m["content"]} for m in recent]
 
@@ -127,44 +231,127 @@ Topics Remaining:
 
     def end_session(self, archive: bool = True):
         """End the current session and optionally archive it."""
+        # The archive gets the full state, and current_session.json is
+        # about to be removed, so a pending save is no longer needed
+        self._cancel_save()
+
         if archive and self.session_id:
             # Save to history
             archive_file = self.history_dir / f"session_{self.session_id}.json"
+            is_new_archive = not archive_file.exists()
             self._save_to_file(archive_file)
+            if is_new_archive:
+                self._session_count = self._update_session_counter(1)
 
         # Clear current session
+        if self._messages_file is not None:
+            self._messages_file.close()
+            self._messages_file = None
         if self.current_session_file.exists():
             self.current_session_file.unlink()
+        if self.messages_log.exists():
+            self.messages_log.unlink()
 
         self.session_id = None
-        self.messages = []
+        self.messages = deque()
         self.topics_explored = []
         self.topics_remaining = []
         self.insights_gathered = []
 
     def _save(self):
-        """Save current session to disk."""
-        self._save_to_file(self.current_session_file)
+        """Save current session to disk (messages live in messages_log)."""
+        self._save_to_file(self.current_session_file, include_messages=False)
+
+    def _schedule_save(self, delay: float = SAVE_DELAY):
+        """Mark the session changed and save it within delay seconds."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(delay, self._flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def _flush(self):
+        """Write any pending changes now."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._save()
 
-    def _save_to_file(self, filepath: Path):
-        """Save session data to a specific file."""
-        import time
+    def _cancel_save(self):
+        """Drop any pending save."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._dirty = False
+
+    def _open_messages_log(self, rewrite: bool = False):
+        """Open messages_log for appending, or rewrite it from self.messages."""
+        if self._messages_file is not None:
+            self._messages_file.close()
+        # Unbuffered, so each message reaches the file as it is added
+        self._messages_file = open(self.messages_log, 'wb' if rewrite else 'ab', buffering=0)
+        if rewrite and self.messages:
+            self._messages_file.write(b"".join(_dumps(message) + b"\n" for message in self.messages))
+
+    def _read_messages_log(self) -> List[Dict[str, str]]:
+        """Read the messages appended to messages_log."""
+        if not self.messages_log.exists():
+            return []
+
+        messages = []
+        with open(self.messages_log, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    messages.append(_loads(line))
+                except ValueError:
+                    continue  # Line cut short by a crash mid-write
+        return messages
 
+    def _save_to_file(self, filepath: Path, include_messages: bool = True):
+        """Save session data to a specific file."""
         data = {
             "session_id": self.session_id,
             "started_at": self.started_at,
             "last_updated": datetime.now().isoformat(),
-            "messages": self.messages,
+        }
+        if include_messages:
+            data["messages"] = list(self.messages)
+        data.update({
             "topics_explored": self.topics_explored,
             "topics_remaining": self.topics_remaining,
             "insights_gathered": self.insights_gathered,
             "metadata": self.metadata,
-        }
+        })
+
+        try:
+            # Only the history archives are meant to be read by people
+            self._write_json(filepath, data, pretty=filepath.parent == self.history_dir)
+        except Exception as e:
+            print(f"Warning: Could not save session: {e}")
+
+    def _write_json(self, filepath: Path, data: Dict[str, Any], pretty: bool = False):
+        """Atomically replace filepath with data as JSON (indented if pretty)."""
+        payload = _dumps(data, pretty)
 
-        # Try atomic write first, with retries for OneDrive sync issues
         temp_file = filepath.with_suffix('.tmp')
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(temp_file, 'wb') as f:
+            f.write(payload)
+            if not self._is_onedrive:
+                f.flush()
+                os.fsync(f.fileno())
+
+        if not self._is_onedrive:
+            os.replace(temp_file, filepath)
+            _fsync_directory(filepath.parent)
+            return
 
         # Retry the replace operation a few times (OneDrive can lock files during sync)
         for attempt in range(5):
@@ -176,32 +363,66 @@ Topics Remaining:
                     time.sleep(0.2)  # Wait a bit and retry
                 else:
                     # Fallback: just write directly to the file
-                    try:
-                        with open(filepath, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, indent=2, ensure_ascii=False)
-                        if temp_file.exists():
-                            temp_file.unlink()
-                    except Exception as e:
-                        print(f"Warning: Could not save session: {e}")
+                    with open(filepath, 'wb') as f:
+                        f.write(payload)
+                    if temp_file.exists():
+                        temp_file.unlink()
 
     def _get_session_count(self) -> int:
         """Get the total number of archived sessions."""
-        return len(list(self.history_dir.glob("session_*.json")))
+        if self._session_count is None:
+            self._session_count = self._update_session_counter(0)
+        return self._session_count
+
+    def _update_session_counter(self, increment: int) -> int:
+        """Add increment to the counter file and return the new count.
+
+        A missing or unreadable counter is rebuilt by counting the archives
+        (which already include any session just archived).
+        """
+        fd = os.open(self.counter_file, os.O_RDWR | os.O_CREAT)
+        with os.fdopen(fd, 'r+', encoding='utf-8') as f:
+            _lock_file(f)
+            try:
+                f.seek(0)
+                text = f.read().strip()
+                if text.isdigit():
+                    count = int(text) + increment
+                else:
+                    count = sum(
+                        1 for entry in os.scandir(self.history_dir)
+                        if entry.name.startswith("session_") and entry.name.endswith(".json")
+                    )
+                f.seek(0)
+                f.truncate()
+                f.write(str(count))
+                f.flush()
+                os.fsync(f.fileno())
+            finally:
+                _unlock_file(f)
+        return count
 
     def get_all_past_insights(self) -> List[Dict[str, Any]]:
         """Get insights from all past sessions."""
         all_insights = []
+        parse_errors = (ValueError, KeyError)
+        if IJSON_AVAILABLE:
+            parse_errors += (ijson.JSONError,)
 
         for session_file in sorted(self.history_dir.glob("session_*.json")):
+            # Archives are named session_<session_id>.json
+            session_id = session_file.stem[len("session_"):]
             try:
-                with open(session_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    insights = data.get('insights_gathered', [])
-                    for insight in insights:
-                        insight['session_id'] = data.get('session_id')
-                    all_insights.extend(insights)
-            except (json.JSONDecodeError, KeyError):
+                if IJSON_AVAILABLE:
+                    with open(session_file, 'rb') as f:
+                        insights = list(ijson.items(f, 'insights_gathered.item', use_float=True))
+                else:
+                    insights = _loads(session_file.read_bytes()).get('insights_gathered', [])
+            except parse_errors:
                 continue
+            for insight in insights:
+                insight['session_id'] = session_id
+            all_insights.extend(insights)
 
         return all_insights
 
@@ -216,9 +437,8 @@ Topics Remaining:
             return None
 
         try:
-            with open(state_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            return _loads(state_file.read_bytes())
+        except (ValueError, IOError) as e:
             print(f"Error loading GUI state: {e}")
             return None
 
@@ -231,26 +451,7 @@ Topics Remaining:
         state['saved_at'] = datetime.now().isoformat()
 
         try:
-            temp_file = state_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=2, ensure_ascii=False)
-
-            # Try atomic replace with retry for OneDrive
-            import time
-            for attempt in range(5):
-                try:
-                    temp_file.replace(state_file)
-                    return True
-                except PermissionError:
-                    if attempt < 4:
-                        time.sleep(0.2)
-                    else:
-                        # Fallback: direct write
-                        with open(state_file, 'w', encoding='utf-8') as f:
-                            json.dump(state, f, indent=2, ensure_ascii=False)
-                        if temp_file.exists():
-                            temp_file.unlink()
-                        return True
+            self._write_json(state_file, state)
         except Exception as e:
             print(f"Error saving GUI state: {e}")
             return False
@@ -287,7 +488,8 @@ def test_session():
     # Get summary
     print("\n" + session.get_summary())
 
-    # Test loading
+    # Test loading (after writing out the pending save)
+    session._flush()
     session2 = Session()
     if session2.load_previous_session():
         print(f"\nLoaded session: {session2.session_id}")
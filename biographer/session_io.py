@@ -0,0 +1,117 @@
+"""
+Reading Bill's speech out of session log files.
+
+Used by both the multi-pass extractor and the re-extract script, so
+sessions are loaded and de-duplicated the same way everywhere.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Union
+
+# Optional faster JSON parsers. jiter can also salvage truncated documents.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import jiter
+    JITER_AVAILABLE = True
+except ImportError:
+    JITER_AVAILABLE = False
+
+# Optional incremental parser for very large session files
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Session files larger than this are stream-parsed with ijson (when installed)
+# so only one event is held at a time. Smaller ones are faster to load whole.
+STREAM_PARSE_BYTES = 16 * 1024 * 1024
+
+# Speeches whose SimHash fingerprints differ in at most this many of 64 bits
+# (~95% similar) are treated as repeats of one another
+SIMHASH_MAX_DISTANCE = 6
+
+TOKEN_RE = re.compile(r'\w+')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with the fastest parser installed (orjson, jiter, json)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if JITER_AVAILABLE:
+        return jiter.from_json(data if isinstance(data, bytes) else data.encode('utf-8'))
+    return json.loads(data)
+
+
+def loads_partial(data: Union[str, bytes]) -> Any:
+    """Parse a truncated JSON document, keeping every complete value before
+    the cutoff. Returns None without jiter; raises ValueError if unparseable."""
+    if not JITER_AVAILABLE:
+        return None
+    return jiter.from_json(data if isinstance(data, bytes) else data.encode('utf-8'),
+                           partial_mode='on')
+
+
+def load_session(session_path: Path) -> Dict[str, Any]:
+    """Load a session JSON file."""
+    return loads(session_path.read_bytes())
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash over the text's lower-cased word 3-grams.
+
+    Near-identical texts (a word changed, punctuation added) get
+    fingerprints only a few bits apart.
+    """
+    words = TOKEN_RE.findall(text.lower())
+    weights = [0] * 64
+    for i in range(max(1, len(words) - 2)):
+        shingle = " ".join(words[i:i + 3]).encode('utf-8')
+        value = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), 'big')
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def is_near_duplicate(fingerprint: int, seen: List[int]) -> bool:
+    """True if fingerprint is within SIMHASH_MAX_DISTANCE bits of any in seen."""
+    return any(bin(fingerprint ^ other).count('1') <= SIMHASH_MAX_DISTANCE for other in seen)
+
+
+def unique_speeches(events: Iterable[Dict[str, Any]], min_len: int = 50) -> List[str]:
+    """Bill's distinct speeches longer than min_len, from a stream of session events."""
+    # Only BILL_SPEAKS events are opened; exact repeats and short
+    # utterances are dropped in the same pass
+    texts = dict.fromkeys(
+        text for text in (
+            event.get('data', {}).get('text', '')
+            for event in events if event.get('type') == 'BILL_SPEAKS'
+        )
+        if text and len(text) > min_len
+    )
+
+    # Then skip near-duplicates
+    speeches = []
+    seen = []
+    for text in texts:
+        fingerprint = simhash(text)
+        if not is_near_duplicate(fingerprint, seen):
+            speeches.append(text)
+            seen.append(fingerprint)
+    return speeches
+
+
+def load_speeches(session_path: Path, min_len: int = 50) -> List[str]:
+    """Read a session file and return Bill's unique speeches."""
+    if IJSON_AVAILABLE and session_path.stat().st_size > STREAM_PARSE_BYTES:
+        with open(session_path, 'rb') as f:
+            return unique_speeches(ijson.items(f, 'events.item'), min_len)
+    return unique_speeches(load_session(session_path).get('events', ()), min_len)
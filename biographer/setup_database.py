@@ -12,782 +12,857 @@ import sqlite3
 import argparse
 from pathlib import Path
 from datetime import datetime
-
-
-def create_schema(db_path: Path):
-    """Create the complete cognitive architecture database schema."""
-
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    print(f"Creating database: {db_path}")
-    print("=" * 60)
-
+from typing import Any, Dict, List
+
+try:
+    from .db import open_connection
+except ImportError:
+    from db import open_connection  # Run directly as a script
+
+# Page size for new databases (has to be set before the first table)
+PAGE_SIZE = 8192
+
+# Version of the schema below, stored in schema_meta. Bump it whenever
+# TABLES or the indexes/views change so existing databases get the new DDL.
+# Independent of schema_upgrade_v2.UPGRADE_VERSION (PRAGMA user_version),
+# which tracks the v2 upgrade steps applied to older databases.
+BASE_SCHEMA_VERSION = 3
+
+# Bounds for the numeric columns, enforced by CHECK constraints (writers
+# such as the enricher coerce to them first so entries aren't rejected)
+SIGNIFICANCE_RANGE = (1, 10)
+YEAR_RANGE = (1800, 2200)
+
+# column -> CHECK condition, applied to INTEGER columns of that name in any table
+COLUMN_CHECKS = {
+    'significance': f"BETWEEN {SIGNIFICANCE_RANGE[0]} AND {SIGNIFICANCE_RANGE[1]}",
+    'confidence': f"BETWEEN {SIGNIFICANCE_RANGE[0]} AND {SIGNIFICANCE_RANGE[1]}",
+    'approximate_year': f"BETWEEN {YEAR_RANGE[0]} AND {YEAR_RANGE[1]}",
+    'rank': ">= 1",
+}
+
+# Columns every content table ends with: where and when the entry came from
+PROVENANCE_COLUMNS = [
+    ('source_quote', 'TEXT'),
+    ('evidence_type', 'TEXT'),
+    ('life_period', 'TEXT'),
+    ('approximate_year', 'INTEGER'),
+    ('prompt_version', 'TEXT'),
+    ('date_recorded', 'TEXT'),
+]
+
+# The complete schema, one entry per table. 'provenance' tables get
+# PROVENANCE_COLUMNS and the life_period/approximate_year indexes;
+# 'primary_key' tables are stored WITHOUT ROWID instead of having an id.
+# NOT NULL ON CONFLICT REPLACE stores the DEFAULT when NULL is inserted.
+TABLES = {
     # ========================================
     # CORE TABLES
     # ========================================
 
     # Transcriptions - raw session transcripts (ground truth)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS transcriptions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            session_id TEXT,
-            full_text TEXT,
-            word_count INTEGER,
-            duration_seconds REAL,
-            date_recorded TEXT
-        )
-    """)
+    'transcriptions': {
+        'columns': [
+            ('session_id', 'TEXT'),
+            ('full_text', 'TEXT'),
+            ('word_count', 'INTEGER'),
+            ('duration_seconds', 'REAL'),
+            ('date_recorded', 'TEXT'),
+        ],
+    },
 
     # Life Events - specific experiences and happenings
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS life_events (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            event_type TEXT,
-            date_start TEXT,
-            date_end TEXT,
-            location TEXT,
-            description TEXT,
-            participants TEXT,
-            outcome TEXT,
-            significance INTEGER DEFAULT 5,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'life_events': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('event_type', 'TEXT'),
+            ('date_start', 'TEXT'),
+            ('date_end', 'TEXT'),
+            ('location', 'TEXT'),
+            ('description', 'TEXT'),
+            ('participants', 'TEXT'),
+            ('outcome', 'TEXT'),
+            ('significance', 'INTEGER NOT NULL ON CONFLICT REPLACE DEFAULT 5'),
+        ],
+        'provenance': True,
+    },
 
     # Relationships - people in the subject's life
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS relationships (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            relationship_type TEXT,
-            how_met TEXT,
-            time_period TEXT,
-            emotional_tone TEXT,
-            current_status TEXT,
-            key_memories TEXT,
-            impact TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'relationships': {
+        'columns': [
+            ('name', 'TEXT NOT NULL'),
+            ('relationship_type', 'TEXT'),
+            ('how_met', 'TEXT'),
+            ('time_period', 'TEXT'),
+            ('emotional_tone', 'TEXT'),
+            ('current_status', 'TEXT'),
+            ('key_memories', 'TEXT'),
+            ('impact', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Stories - complete narratives with arc
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS stories (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            story_type TEXT,
-            setting TEXT,
-            narrative TEXT,
-            point_or_lesson TEXT,
-            humor_notes TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'stories': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('story_type', 'TEXT'),
+            ('setting', 'TEXT'),
+            ('narrative', 'TEXT'),
+            ('point_or_lesson', 'TEXT'),
+            ('humor_notes', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Self Knowledge - explicit self-assessments
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS self_knowledge (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            category TEXT,
-            insight TEXT,
-            evidence TEXT,
-            date_realized TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'self_knowledge': {
+        'columns': [
+            ('category', 'TEXT'),
+            ('insight', 'TEXT'),
+            ('evidence', 'TEXT'),
+            ('date_realized', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Preferences - likes, dislikes, habits
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS preferences (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            category TEXT,
-            preference TEXT,
-            strength TEXT,
-            origin TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'preferences': {
+        'columns': [
+            ('category', 'TEXT'),
+            ('preference', 'TEXT'),
+            ('strength', 'TEXT'),
+            ('origin', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Philosophies - beliefs about how the world works
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS philosophies (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            category TEXT,
-            belief_statement TEXT,
-            explanation TEXT,
-            origin TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'philosophies': {
+        'columns': [
+            ('category', 'TEXT'),
+            ('belief_statement', 'TEXT'),
+            ('explanation', 'TEXT'),
+            ('origin', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # ========================================
     # COGNITIVE ARCHITECTURE TABLES
     # ========================================
 
     # Decisions - major life choices
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS decisions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            time_period TEXT,
-            context TEXT,
-            options_considered TEXT,
-            what_was_chosen TEXT,
-            reasoning TEXT,
-            what_was_felt TEXT,
-            outcome TEXT,
-            would_change TEXT,
-            what_it_reveals TEXT,
-            evidence TEXT,
-            significance INTEGER DEFAULT 5,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'decisions': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('time_period', 'TEXT'),
+            ('context', 'TEXT'),
+            ('options_considered', 'TEXT'),
+            ('what_was_chosen', 'TEXT'),
+            ('reasoning', 'TEXT'),
+            ('what_was_felt', 'TEXT'),
+            ('outcome', 'TEXT'),
+            ('would_change', 'TEXT'),
+            ('what_it_reveals', 'TEXT'),
+            ('evidence', 'TEXT'),
+            ('significance', 'INTEGER NOT NULL ON CONFLICT REPLACE DEFAULT 5'),
+        ],
+        'provenance': True,
+    },
 
     # Mistakes - errors analyzed for patterns
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS mistakes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            time_period TEXT,
-            what_happened TEXT,
-            why_it_happened TEXT,
-            what_was_believed TEXT,
-            what_was_protected TEXT,
-            pattern_category TEXT,
-            what_it_cost TEXT,
-            what_broke_pattern TEXT,
-            evidence TEXT,
-            significance INTEGER DEFAULT 5,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'mistakes': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('time_period', 'TEXT'),
+            ('what_happened', 'TEXT'),
+            ('why_it_happened', 'TEXT'),
+            ('what_was_believed', 'TEXT'),
+            ('what_was_protected', 'TEXT'),
+            ('pattern_category', 'TEXT'),
+            ('what_it_cost', 'TEXT'),
+            ('what_broke_pattern', 'TEXT'),
+            ('evidence', 'TEXT'),
+            ('significance', 'INTEGER NOT NULL ON CONFLICT REPLACE DEFAULT 5'),
+        ],
+        'provenance': True,
+    },
 
     # Reasoning Patterns - how the subject thinks
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS reasoning_patterns (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            pattern_name TEXT NOT NULL,
-            description TEXT,
-            when_used TEXT,
-            strengths TEXT,
-            weaknesses TEXT,
-            example_decisions TEXT,
-            evidence TEXT,
-            confidence TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'reasoning_patterns': {
+        'columns': [
+            ('pattern_name', 'TEXT NOT NULL'),
+            ('description', 'TEXT'),
+            ('when_used', 'TEXT'),
+            ('strengths', 'TEXT'),
+            ('weaknesses', 'TEXT'),
+            ('example_decisions', 'TEXT'),
+            ('evidence', 'TEXT'),
+            ('confidence', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Value Hierarchies - what's prioritized
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS value_hierarchies (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            value TEXT NOT NULL,
-            rank INTEGER,
-            competes_with TEXT,
-            sacrifice_evidence TEXT,
-            violation_response TEXT,
-            evolution TEXT,
-            evidence TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'value_hierarchies': {
+        'columns': [
+            ('value', 'TEXT NOT NULL'),
+            ('rank', 'INTEGER'),
+            ('competes_with', 'TEXT'),
+            ('sacrifice_evidence', 'TEXT'),
+            ('violation_response', 'TEXT'),
+            ('evolution', 'TEXT'),
+            ('evidence', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Cognitive Biases - known blind spots
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS cognitive_biases (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            bias_name TEXT NOT NULL,
-            description TEXT,
-            how_it_manifests TEXT,
-            examples TEXT,
-            awareness_level TEXT,
-            mitigation TEXT,
-            evidence TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'cognitive_biases': {
+        'columns': [
+            ('bias_name', 'TEXT NOT NULL'),
+            ('description', 'TEXT'),
+            ('how_it_manifests', 'TEXT'),
+            ('examples', 'TEXT'),
+            ('awareness_level', 'TEXT'),
+            ('mitigation', 'TEXT'),
+            ('evidence', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Fears - what threatens
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS fears (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            fear TEXT NOT NULL,
-            root_source TEXT,
-            what_it_protects TEXT,
-            triggers TEXT,
-            physical_response TEXT,
-            behavioral_response TEXT,
-            adaptive_value TEXT,
-            cost TEXT,
-            evidence TEXT,
-            significance INTEGER DEFAULT 5,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'fears': {
+        'columns': [
+            ('fear', 'TEXT NOT NULL'),
+            ('root_source', 'TEXT'),
+            ('what_it_protects', 'TEXT'),
+            ('triggers', 'TEXT'),
+            ('physical_response', 'TEXT'),
+            ('behavioral_response', 'TEXT'),
+            ('adaptive_value', 'TEXT'),
+            ('cost', 'TEXT'),
+            ('evidence', 'TEXT'),
+            ('significance', 'INTEGER NOT NULL ON CONFLICT REPLACE DEFAULT 5'),
+        ],
+        'provenance': True,
+    },
 
     # Joys - what brings fulfillment
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS joys (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            joy TEXT NOT NULL,
-            category TEXT,
-            what_it_feels_like TEXT,
-            conditions TEXT,
-            frequency TEXT,
-            depth TEXT,
-            connection_to_meaning TEXT,
-            evidence TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'joys': {
+        'columns': [
+            ('joy', 'TEXT NOT NULL'),
+            ('category', 'TEXT'),
+            ('what_it_feels_like', 'TEXT'),
+            ('conditions', 'TEXT'),
+            ('frequency', 'TEXT'),
+            ('depth', 'TEXT'),
+            ('connection_to_meaning', 'TEXT'),
+            ('evidence', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Wisdom - hard-won insights
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS wisdom (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            insight TEXT NOT NULL,
-            domain TEXT,
-            how_learned TEXT,
-            cost_of_learning TEXT,
-            when_applicable TEXT,
-            exceptions TEXT,
-            confidence INTEGER DEFAULT 5,
-            evidence TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'wisdom': {
+        'columns': [
+            ('insight', 'TEXT NOT NULL'),
+            ('domain', 'TEXT'),
+            ('how_learned', 'TEXT'),
+            ('cost_of_learning', 'TEXT'),
+            ('when_applicable', 'TEXT'),
+            ('exceptions', 'TEXT'),
+            ('confidence', 'INTEGER NOT NULL ON CONFLICT REPLACE DEFAULT 5'),
+            ('evidence', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Contradictions - unresolved tensions
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS contradictions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            tension TEXT NOT NULL,
-            side_a TEXT,
-            side_b TEXT,
-            how_navigated TEXT,
-            resolution_attempts TEXT,
-            what_it_reveals TEXT,
-            evidence TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'contradictions': {
+        'columns': [
+            ('tension', 'TEXT NOT NULL'),
+            ('side_a', 'TEXT'),
+            ('side_b', 'TEXT'),
+            ('how_navigated', 'TEXT'),
+            ('resolution_attempts', 'TEXT'),
+            ('what_it_reveals', 'TEXT'),
+            ('evidence', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Meaning Structures - what makes life worth living
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS meaning_structures (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            source_of_meaning TEXT NOT NULL,
-            category TEXT,
-            how_discovered TEXT,
-            how_expressed TEXT,
-            threatened_by TEXT,
-            would_fight_for TEXT,
-            evidence TEXT,
-            significance INTEGER DEFAULT 5,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'meaning_structures': {
+        'columns': [
+            ('source_of_meaning', 'TEXT NOT NULL'),
+            ('category', 'TEXT'),
+            ('how_discovered', 'TEXT'),
+            ('how_expressed', 'TEXT'),
+            ('threatened_by', 'TEXT'),
+            ('would_fight_for', 'TEXT'),
+            ('evidence', 'TEXT'),
+            ('significance', 'INTEGER NOT NULL ON CONFLICT REPLACE DEFAULT 5'),
+        ],
+        'provenance': True,
+    },
 
     # Mortality Awareness - how finitude shapes choices
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS mortality_awareness (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            insight TEXT NOT NULL,
-            category TEXT,
-            what_changed TEXT,
-            triggered_by TEXT,
-            impact_on_priorities TEXT,
-            impact_on_relationships TEXT,
-            evidence TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'mortality_awareness': {
+        'columns': [
+            ('insight', 'TEXT NOT NULL'),
+            ('category', 'TEXT'),
+            ('what_changed', 'TEXT'),
+            ('triggered_by', 'TEXT'),
+            ('impact_on_priorities', 'TEXT'),
+            ('impact_on_relationships', 'TEXT'),
+            ('evidence', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Beauties - aesthetic responses
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS beauties (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            what TEXT NOT NULL,
-            category TEXT,
-            response TEXT,
-            why_beautiful TEXT,
-            pattern TEXT,
-            evidence TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'beauties': {
+        'columns': [
+            ('what', 'TEXT NOT NULL'),
+            ('category', 'TEXT'),
+            ('response', 'TEXT'),
+            ('why_beautiful', 'TEXT'),
+            ('pattern', 'TEXT'),
+            ('evidence', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Body Knowledge - what incarnation teaches
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS body_knowledge (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            insight TEXT NOT NULL,
-            category TEXT,
-            how_learned TEXT,
-            mind_body_connection TEXT,
-            what_body_knows TEXT,
-            evidence TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'body_knowledge': {
+        'columns': [
+            ('insight', 'TEXT NOT NULL'),
+            ('category', 'TEXT'),
+            ('how_learned', 'TEXT'),
+            ('mind_body_connection', 'TEXT'),
+            ('what_body_knows', 'TEXT'),
+            ('evidence', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Inferred Patterns - AI meta-analysis
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS inferred_patterns (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            pattern_name TEXT NOT NULL,
-            pattern_type TEXT,
-            description TEXT,
-            supporting_evidence TEXT,
-            confidence TEXT,
-            cross_references TEXT,
-            first_observed TEXT,
-            last_updated TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'inferred_patterns': {
+        'columns': [
+            ('pattern_name', 'TEXT NOT NULL'),
+            ('pattern_type', 'TEXT'),
+            ('description', 'TEXT'),
+            ('supporting_evidence', 'TEXT'),
+            ('confidence', 'TEXT'),
+            ('cross_references', 'TEXT'),
+            ('first_observed', 'TEXT'),
+            ('last_updated', 'TEXT'),
+            ('date_recorded', 'TEXT'),
+        ],
+    },
 
     # ========================================
-    # BALANCED SCHEMA TABLES (light + shadow)
+    # BALANCED SCHEMA TABLES (LIGHT + SHADOW)
     # ========================================
 
     # Sorrows - grief and sadness
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS sorrows (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            description TEXT,
-            cause TEXT,
-            duration TEXT,
-            how_processed TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'sorrows': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('description', 'TEXT'),
+            ('cause', 'TEXT'),
+            ('duration', 'TEXT'),
+            ('how_processed', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Wounds - psychological injuries
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS wounds (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            description TEXT,
-            cause TEXT,
-            age_when_occurred INTEGER,
-            how_it_reshaped TEXT,
-            healing_status TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'wounds': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('description', 'TEXT'),
+            ('cause', 'TEXT'),
+            ('age_when_occurred', 'INTEGER'),
+            ('how_it_reshaped', 'TEXT'),
+            ('healing_status', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Losses - deaths, endings, separations
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS losses (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            what_was_lost TEXT,
-            circumstances TEXT,
-            immediate_impact TEXT,
-            long_term_impact TEXT,
-            how_carried_now TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'losses': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('what_was_lost', 'TEXT'),
+            ('circumstances', 'TEXT'),
+            ('immediate_impact', 'TEXT'),
+            ('long_term_impact', 'TEXT'),
+            ('how_carried_now', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Healings - recoveries and restorations
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS healings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            what_was_broken TEXT,
-            healing_agent TEXT,
-            process TEXT,
-            current_state TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'healings': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('what_was_broken', 'TEXT'),
+            ('healing_agent', 'TEXT'),
+            ('process', 'TEXT'),
+            ('current_state', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Growth - positive changes over time
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS growth (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            what_changed TEXT,
-            catalyst TEXT,
-            before_state TEXT,
-            after_state TEXT,
-            ongoing TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'growth': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('what_changed', 'TEXT'),
+            ('catalyst', 'TEXT'),
+            ('before_state', 'TEXT'),
+            ('after_state', 'TEXT'),
+            ('ongoing', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Loves - deep attachments
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS loves (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            what_is_loved TEXT,
-            how_expressed TEXT,
-            what_makes_distinctive TEXT,
-            what_losing_would_mean TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'loves': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('what_is_loved', 'TEXT'),
+            ('how_expressed', 'TEXT'),
+            ('what_makes_distinctive', 'TEXT'),
+            ('what_losing_would_mean', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Longings - unmet needs and yearnings
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS longings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            what_is_longed_for TEXT,
-            why TEXT,
-            how_felt TEXT,
-            achievability TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'longings': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('what_is_longed_for', 'TEXT'),
+            ('why', 'TEXT'),
+            ('how_felt', 'TEXT'),
+            ('achievability', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Strengths - virtues and capacities
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS strengths (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            strength TEXT,
-            how_demonstrated TEXT,
-            origin TEXT,
-            double_edge TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'strengths': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('strength', 'TEXT'),
+            ('how_demonstrated', 'TEXT'),
+            ('origin', 'TEXT'),
+            ('double_edge', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Vulnerabilities - tender spots
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS vulnerabilities (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            vulnerability TEXT,
-            triggers TEXT,
-            how_manifests TEXT,
-            protective_strategies TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'vulnerabilities': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('vulnerability', 'TEXT'),
+            ('triggers', 'TEXT'),
+            ('how_manifests', 'TEXT'),
+            ('protective_strategies', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Regrets - things wished done differently
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS regrets (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            what_happened TEXT,
-            what_wished_instead TEXT,
-            peace_made TEXT,
-            active_weight TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'regrets': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('what_happened', 'TEXT'),
+            ('what_wished_instead', 'TEXT'),
+            ('peace_made', 'TEXT'),
+            ('active_weight', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Questions - unresolved wonderings
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS questions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            question TEXT,
-            context TEXT,
-            attempts_to_answer TEXT,
-            why_unresolved TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'questions': {
+        'columns': [
+            ('title', 'TEXT NOT NULL'),
+            ('question', 'TEXT'),
+            ('context', 'TEXT'),
+            ('attempts_to_answer', 'TEXT'),
+            ('why_unresolved', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # ========================================
-    # v2.0 NEW TABLES
+    # V2.0 NEW TABLES
     # ========================================
 
     # Sensory Memories - vivid sensory experiences
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS sensory_memories (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            modality TEXT,
-            sensory_content TEXT,
-            associated_memory TEXT,
-            emotional_charge TEXT,
-            triggers_memory INTEGER DEFAULT 0,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'sensory_memories': {
+        'columns': [
+            ('title', 'TEXT'),
+            ('modality', 'TEXT'),
+            ('sensory_content', 'TEXT'),
+            ('associated_memory', 'TEXT'),
+            ('emotional_charge', 'TEXT'),
+            ('triggers_memory', 'INTEGER DEFAULT 0'),
+        ],
+        'provenance': True,
+    },
 
     # Creative Works - things made or built
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS creative_works (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            medium TEXT,
-            description TEXT,
-            date_created TEXT,
-            motivation TEXT,
-            reception TEXT,
-            current_status TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'creative_works': {
+        'columns': [
+            ('title', 'TEXT'),
+            ('medium', 'TEXT'),
+            ('description', 'TEXT'),
+            ('date_created', 'TEXT'),
+            ('motivation', 'TEXT'),
+            ('reception', 'TEXT'),
+            ('current_status', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Skills & Competencies - learned abilities
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS skills_competencies (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            skill_name TEXT,
-            category TEXT,
-            proficiency_level TEXT,
-            how_acquired TEXT,
-            years_practiced INTEGER,
-            last_used TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'skills_competencies': {
+        'columns': [
+            ('skill_name', 'TEXT'),
+            ('category', 'TEXT'),
+            ('proficiency_level', 'TEXT'),
+            ('how_acquired', 'TEXT'),
+            ('years_practiced', 'INTEGER'),
+            ('last_used', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Aspirations - forward-looking goals
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS aspirations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            description TEXT,
-            category TEXT,
-            urgency TEXT,
-            achievability TEXT,
-            time_horizon TEXT,
-            source_quote TEXT,
-            evidence_type TEXT,
-            life_period TEXT,
-            approximate_year INTEGER,
-            prompt_version TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'aspirations': {
+        'columns': [
+            ('title', 'TEXT'),
+            ('description', 'TEXT'),
+            ('category', 'TEXT'),
+            ('urgency', 'TEXT'),
+            ('achievability', 'TEXT'),
+            ('time_horizon', 'TEXT'),
+        ],
+        'provenance': True,
+    },
 
     # Entry Connections - relational graph layer
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS entry_connections (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            entry_1_table TEXT,
-            entry_1_id INTEGER,
-            entry_1_title TEXT,
-            entry_2_table TEXT,
-            entry_2_id INTEGER,
-            entry_2_title TEXT,
-            connection_type TEXT,
-            description TEXT,
-            source_pass TEXT,
-            date_recorded TEXT
-        )
-    """)
+    'entry_connections': {
+        'columns': [
+            ('entry_1_table', 'TEXT NOT NULL'),
+            ('entry_1_id', 'INTEGER'),
+            ('entry_1_title', 'TEXT NOT NULL'),
+            ('entry_2_table', 'TEXT NOT NULL'),
+            ('entry_2_id', 'INTEGER'),
+            ('entry_2_title', 'TEXT NOT NULL'),
+            ('connection_type', 'TEXT NOT NULL'),
+            ('description', 'TEXT'),
+            ('source_pass', 'TEXT'),
+            ('date_recorded', 'TEXT'),
+        ],
+        # Edges are stored clustered by their endpoints (the extractor names
+        # entries by table and title; ids are filled in when known)
+        'primary_key': ('entry_1_table', 'entry_1_title', 'entry_2_table', 'entry_2_title', 'connection_type'),
+    },
 
     # Cross References (legacy)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS cross_references (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            source_table TEXT NOT NULL,
-            source_id INTEGER NOT NULL,
-            target_table TEXT NOT NULL,
-            target_id INTEGER NOT NULL,
-            relationship_type TEXT,
-            notes TEXT,
-            date_created TEXT
-        )
-    """)
+    'cross_references': {
+        'columns': [
+            ('source_table', 'TEXT NOT NULL'),
+            ('source_id', 'INTEGER NOT NULL'),
+            ('target_table', 'TEXT NOT NULL'),
+            ('target_id', 'INTEGER NOT NULL'),
+            ('relationship_type', "TEXT NOT NULL DEFAULT ''"),
+            ('notes', 'TEXT'),
+            ('date_created', 'TEXT'),
+        ],
+        'primary_key': ('source_table', 'source_id', 'target_table', 'target_id', 'relationship_type'),
+    },
 
     # Family table (for structured family data)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS family (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            relationship TEXT,
-            birth_date TEXT,
-            death_date TEXT,
-            notes TEXT,
-            date_recorded TEXT
+    'family': {
+        'columns': [
+            ('name', 'TEXT NOT NULL'),
+            ('relationship', 'TEXT'),
+            ('birth_date', 'TEXT'),
+            ('death_date', 'TEXT'),
+            ('notes', 'TEXT'),
+            ('date_recorded', 'TEXT'),
+        ],
+    },
+
+    # Schema Meta - which BASE_SCHEMA_VERSION created this database
+    'schema_meta': {
+        'columns': [
+            ('version', 'INTEGER'),
+        ],
+        'primary_key': ('version',),
+    },
+}
+
+# Content tables: every one carries life_period and approximate_year
+CONTENT_TABLES = [name for name, spec in TABLES.items() if spec.get('provenance')]
+
+
+def _emit_ddl(name: str, spec: Dict[str, Any]) -> str:
+    """CREATE TABLE for one TABLES entry, plus its period/year indexes."""
+    columns = list(spec['columns'])
+    if spec.get('provenance'):
+        columns += PROVENANCE_COLUMNS
+    lines = [
+        f"{column} {decl} CHECK ({column} {COLUMN_CHECKS[column]})"
+        if column in COLUMN_CHECKS and decl.startswith('INTEGER') else f"{column} {decl}"
+        for column, decl in columns
+    ]
+    if 'primary_key' in spec:
+        lines.append(f"PRIMARY KEY ({', '.join(spec['primary_key'])})")
+        suffix = " WITHOUT ROWID"
+    else:
+        lines.insert(0, "id INTEGER PRIMARY KEY")
+        suffix = ""
+
+    body = ",\n    ".join(lines)
+    ddl = f"CREATE TABLE IF NOT EXISTS {name} (\n    {body}\n){suffix};"
+    if spec.get('provenance'):
+        ddl += (
+            f"\nCREATE INDEX IF NOT EXISTS idx_{name}_period ON {name}(life_period);"
+            f"\nCREATE INDEX IF NOT EXISTS idx_{name}_year ON {name}(approximate_year);"
         )
-    """)
+    return ddl
+
 
-    conn.commit()
+# Graph lookups (names match the ones the upgrade scripts create; the
+# cross_references source end is its primary key)
+GRAPH_INDEX_DDL = """
+CREATE INDEX IF NOT EXISTS idx_entry_conn_1 ON entry_connections(entry_1_table, entry_1_id);
+CREATE INDEX IF NOT EXISTS idx_entry_conn_2 ON entry_connections(entry_2_table, entry_2_id);
+CREATE INDEX IF NOT EXISTS idx_xref_tgt ON cross_references(target_table, target_id);
+"""
+
+# Everything create_schema runs in its one transaction
+SCHEMA_DDL = "\n\n".join(_emit_ddl(name, spec) for name, spec in TABLES.items()) + "\n" + GRAPH_INDEX_DDL
+
+# Full-text search over the prose in each content table:
+# table -> (title column, body columns). Each table's evidence and
+# source_quote are indexed in their own columns (FTS_QUOTE_COLUMNS).
+NARRATIVE_FIELDS = {
+    'life_events': ('title', ['description', 'outcome']),
+    'relationships': ('name', ['how_met', 'key_memories', 'impact']),
+    'stories': ('title', ['narrative', 'point_or_lesson']),
+    'self_knowledge': ('insight', []),
+    'preferences': ('preference', ['origin']),
+    'philosophies': ('belief_statement', ['explanation', 'origin']),
+    'decisions': ('title', ['context', 'reasoning', 'what_it_reveals']),
+    'mistakes': ('title', ['what_happened', 'why_it_happened', 'what_it_cost']),
+    'reasoning_patterns': ('pattern_name', ['description']),
+    'value_hierarchies': ('value', ['sacrifice_evidence']),
+    'cognitive_biases': ('bias_name', ['description', 'how_it_manifests']),
+    'fears': ('fear', ['root_source', 'what_it_protects']),
+    'joys': ('joy', ['what_it_feels_like', 'connection_to_meaning']),
+    'wisdom': ('insight', ['how_learned', 'when_applicable']),
+    'contradictions': ('tension', ['side_a', 'side_b', 'how_navigated']),
+    'meaning_structures': ('source_of_meaning', ['how_discovered', 'how_expressed']),
+    'mortality_awareness': ('insight', ['what_changed', 'impact_on_priorities']),
+    'beauties': ('what', ['response', 'why_beautiful']),
+    'body_knowledge': ('insight', ['what_body_knows']),
+    'inferred_patterns': ('pattern_name', ['description', 'supporting_evidence']),
+    'sorrows': ('title', ['description', 'cause', 'how_processed']),
+    'wounds': ('title', ['description', 'cause', 'how_it_reshaped']),
+    'losses': ('title', ['what_was_lost', 'circumstances', 'long_term_impact']),
+    'healings': ('title', ['what_was_broken', 'process', 'current_state']),
+    'growth': ('title', ['what_changed', 'before_state', 'after_state']),
+    'loves': ('title', ['what_is_loved', 'how_expressed']),
+    'longings': ('title', ['what_is_longed_for', 'why', 'how_felt']),
+    'strengths': ('title', ['strength', 'how_demonstrated']),
+    'vulnerabilities': ('title', ['vulnerability', 'how_manifests']),
+    'regrets': ('title', ['what_happened', 'what_wished_instead']),
+    'questions': ('title', ['question', 'context', 'attempts_to_answer']),
+    'sensory_memories': ('title', ['sensory_content', 'associated_memory']),
+    'creative_works': ('title', ['description', 'motivation']),
+    'skills_competencies': ('skill_name', ['how_acquired']),
+    'aspirations': ('title', ['description']),
+}
+
+# entries_fts columns filled from the same-named column of every table
+FTS_QUOTE_COLUMNS = ('evidence', 'source_quote')
+
+# An entry's entries_fts rowid is id * FTS_STRIDE + its table's position in
+# NARRATIVE_FIELDS, so triggers delete by rowid instead of scanning. Adding
+# a table changes the stride: bump BASE_SCHEMA_VERSION so the index is rebuilt.
+FTS_STRIDE = len(NARRATIVE_FIELDS)
+
+
+def _fts_values(table: str, columns, prefix: str) -> str:
+    """rowid, title, body, evidence, source_quote for one row of table.
+
+    Columns the table doesn't have (databases that predate them) are left
+    out of the body or indexed as NULL.
+    """
+    title_col, body_cols = NARRATIVE_FIELDS[table]
+    position = list(NARRATIVE_FIELDS).index(table)
+    body = " || ' ' || ".join(
+        f"coalesce({prefix}{col}, '')" for col in body_cols if col in columns
+    ) or "''"
+    title = f"{prefix}{title_col}" if title_col in columns else "NULL"
+    quotes = [f"{prefix}{col}" if col in columns else "NULL" for col in FTS_QUOTE_COLUMNS]
+    return ", ".join([f"{prefix}id * {FTS_STRIDE} + {position}", title, body] + quotes)
+
+
+def rebuild_fts(cursor) -> List[str]:
+    """(Re)create entries_fts and its triggers, then index every row.
+
+    Also drops the separate evidence_fts index older upgrades created.
+    Runs in a savepoint, so on failure nothing is changed. Returns the
+    tables indexed; raises sqlite3.OperationalError without FTS5.
+    """
+    cursor.execute("SAVEPOINT rebuild_fts")
+    try:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='trigger' "
+            "AND (sql LIKE '%entries_fts%' OR sql LIKE '%evidence_fts%')"
+        )
+        for (trigger,) in cursor.fetchall():
+            cursor.execute(f"DROP TRIGGER {trigger}")
+        cursor.execute("DROP TABLE IF EXISTS evidence_fts")
+        cursor.execute("DROP TABLE IF EXISTS entries_fts")
+        cursor.execute(f"""
+            CREATE VIRTUAL TABLE entries_fts USING fts5(
+                title, body, {', '.join(FTS_QUOTE_COLUMNS)},
+                tokenize='porter unicode61'
+            )
+        """)
+
+        cursor.execute(
+            "SELECT m.name, p.name FROM sqlite_master m, pragma_table_info(m.name) p "
+            "WHERE m.type='table'"
+        )
+        columns_by_table = {}
+        for table, column in cursor.fetchall():
+            columns_by_table.setdefault(table, set()).add(column)
+
+        insert_into = f"INSERT INTO entries_fts(rowid, title, body, {', '.join(FTS_QUOTE_COLUMNS)})"
+        indexed = []
+        for position, (table, (title_col, body_cols)) in enumerate(NARRATIVE_FIELDS.items()):
+            columns = columns_by_table.get(table)
+            if not columns:
+                continue
+            insert = f"{insert_into} VALUES ({_fts_values(table, columns, 'new.')});"
+            delete = f"DELETE FROM entries_fts WHERE rowid = old.id * {FTS_STRIDE} + {position};"
+            watched = [c for c in [title_col, *body_cols, *FTS_QUOTE_COLUMNS] if c in columns]
+            cursor.execute(f"CREATE TRIGGER {table}_entries_ai AFTER INSERT ON {table} BEGIN {insert} END")
+            cursor.execute(f"CREATE TRIGGER {table}_entries_ad AFTER DELETE ON {table} BEGIN {delete} END")
+            cursor.execute(
+                f"CREATE TRIGGER {table}_entries_au AFTER UPDATE OF {', '.join(watched)} ON {table} "
+                f"BEGIN {delete} {insert} END"
+            )
+            cursor.execute(f"{insert_into} SELECT {_fts_values(table, columns, '')} FROM {table}")
+            indexed.append(table)
+    except sqlite3.OperationalError:
+        cursor.execute("ROLLBACK TO rebuild_fts")
+        cursor.execute("RELEASE rebuild_fts")
+        raise
+    cursor.execute("RELEASE rebuild_fts")
+    return indexed
+
+
+def fts_source(rowid: int):
+    """The (table, id) an entries_fts rowid points back at."""
+    return list(NARRATIVE_FIELDS)[rowid % FTS_STRIDE], rowid // FTS_STRIDE
+
+
+# Every content entry as one row set (table, id, title, period, year), so
+# cross-table listings are one query instead of a UNION written per caller
+ENTRIES_VIEW_DDL = "CREATE VIEW IF NOT EXISTS all_entries AS\n" + "\nUNION ALL\n".join(
+    f"SELECT '{table}' AS source_table, id, {NARRATIVE_FIELDS[table][0]} AS title, "
+    f"life_period, approximate_year, date_recorded FROM {table}"
+    for table in CONTENT_TABLES
+) + ";"
+
+
+def create_schema(db_path: Path):
+    """Create the complete cognitive architecture database schema."""
+    db_path = Path(db_path)
+
+    # A brand-new file has nothing to count afterwards
+    is_new = not db_path.exists()
+    if is_new:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = open_connection(db_path, page_size=PAGE_SIZE)
+    cursor = conn.cursor()
+
+    # Already at this version: one lookup instead of re-running every
+    # CREATE ... IF NOT EXISTS
+    if not is_new:
+        try:
+            cursor.execute("SELECT version FROM schema_meta")
+            row = cursor.fetchone()
+        except sqlite3.OperationalError:
+            row = None  # Created before schema_meta existed
+        if row and row[0] == BASE_SCHEMA_VERSION:
+            conn.close()
+            print(f"Database is up to date (schema version {BASE_SCHEMA_VERSION}): {db_path}")
+            return
+
+    print(f"Creating database: {db_path}")
+    print("=" * 60)
+
+    # All tables in one script and one transaction: parsed and run in a
+    # single call, committed once along with the version stamp
+    try:
+        conn.executescript(
+            f"BEGIN IMMEDIATE;\n{SCHEMA_DDL}\n{ENTRIES_VIEW_DDL}\n"
+            f"DELETE FROM schema_meta;\n"
+            f"INSERT INTO schema_meta(version) VALUES ({BASE_SCHEMA_VERSION});\n"
+            f"COMMIT;"
+        )
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.rollback()
+        conn.close()
+        raise
+
+    # Keyword search index, in its own transaction since some SQLite
+    # builds lack FTS5. Rebuilt whenever BASE_SCHEMA_VERSION changes.
+    try:
+        rebuild_fts(cursor)
+        conn.commit()
+    except sqlite3.OperationalError as e:
+        print(f"[SKIP] entries_fts - FTS5 not available ({e})")
 
     # Verify tables
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
     tables = [row[0] for row in cursor.fetchall()]
+    counted = [
+        t for t in tables
+        if t != 'schema_meta' and not t.startswith('entries_fts_')
+    ]
+
+    # Existing databases are counted in one UNION ALL query rather than
+    # one query per table
+    if is_new:
+        counts = dict.fromkeys(counted, 0)
+    else:
+        cursor.execute(" UNION ALL ".join(
+            f"SELECT '{table}', COUNT(*) FROM {table}" for table in counted
+        ))
+        counts = dict(cursor.fetchall())
 
+    # One write for the whole report rather than a print per table
     print(f"\nCreated {len(tables)} tables:")
-    for table in tables:
-        if table != 'sqlite_sequence':
-            cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            count = cursor.fetchone()[0]
-            print(f"  - {table}: {count} entries")
+    print("\n".join(f"  - {table}: {counts[table]} entries" for table in counted), flush=True)
 
     conn.close()
 
@@ -803,18 +878,12 @@ def create_schema(db_path: Path):
 
 def main():
     parser = argparse.ArgumentParser(description='Create VECTOR Biographer database')
-    parser.add_argument('--path', type=str, help='Path for the database file')
+    parser.add_argument('--path', type=Path, help='Path for the database file',
+                        default=Path(__file__).parent.parent / "knowledge_base.db")
     args = parser.parse_args()
 
-    if args.path:
-        db_path = Path(args.path)
-    else:
-        db_path = Path(__file__).parent.parent / "knowledge_base.db"
-
-    # Ensure parent directory exists
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-
-    create_schema(db_path)
+    # Nothing touches the filesystem until the arguments have parsed
+    create_schema(args.path)
 
 
 if __name__ == '__main__':
@@ -4,13 +4,35 @@ Use this to view/screenshot the constellation and cluster maps.
 """
 
 import sys
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from biographer.embeddings import VectorStore
-from biographer.gui.visualizations import MemoryVisualizer
+
+def load_visualizer(store) -> Future:
+    """Import the plotting stack and build the visualizer in the background.
+
+    plotly/sklearn take seconds to import; this overlaps that (and the
+    embeddings prefetch) with reading the menu, and choosing Exit never
+    waits for it.
+    """
+    future = Future()
+
+    def load():
+        try:
+            from biographer.gui.visualizations import MemoryVisualizer
+            visualizer = MemoryVisualizer(store)
+            visualizer.prefetch()
+            future.set_result(visualizer)
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=load, daemon=True).start()
+    return future
+
 
 def main():
     print("=" * 60)
@@ -19,12 +41,14 @@ def main():
     print()
 
     print("Loading vector store...")
+    from biographer.embeddings import VectorStore
     store = VectorStore()
     entry_count = store.get_entry_count()
     print(f"Vector database has {entry_count} entries")
     print()
 
-    visualizer = MemoryVisualizer(store)
+    # Load the plotting libraries and embeddings while the menu waits for a choice
+    pending_visualizer = load_visualizer(store)
 
     while True:
         print("\nVisualization Options:")
@@ -32,38 +56,53 @@ def main():
         print("  2. Cluster View (sunburst chart)")
         print("  3. Coverage Heatmap (entries by category)")
         print("  4. Gap Radar (coverage vs targets)")
-        print("  5. Exit")
+        print("  5. Generate All (charts 1-4 from one load of the data)")
+        print("  6. Exit")
         print()
 
-        choice = input("Enter choice (1-5): ").strip()
+        choice = input("Enter choice (1-6): ").strip()
 
         if choice == '1':
+            visualizer = pending_visualizer.result()
             print("\nGenerating constellation map...")
             path = visualizer.create_constellation_map(show=True)
             print(f"Saved to: {path}")
             print("(Opened in browser - take your screenshot)")
 
         elif choice == '2':
+            visualizer = pending_visualizer.result()
             print("\nGenerating cluster view...")
             path = visualizer.create_cluster_view(show=True)
             print(f"Saved to: {path}")
             print("(Opened in browser - take your screenshot)")
 
         elif choice == '3':
+            visualizer = pending_visualizer.result()
             print("\nGenerating coverage heatmap...")
             path = visualizer.create_theme_heatmap(show=True)
             print(f"Saved to: {path}")
             print("(Opened in browser - take your screenshot)")
 
         elif choice == '4':
+            visualizer = pending_visualizer.result()
             print("\nGenerating gap radar...")
             path = visualizer.create_gap_radar(show=True)
             print(f"Saved to: {path}")
             print("(Opened in browser - take your screenshot)")
 
         elif choice == '5':
+            visualizer = pending_visualizer.result()
+            print("\nGenerating all visualizations...")
+            for name, path in visualizer.create_all(show=True).items():
+                print(f"  {name}: {path}")
+            print("(Opened in browser - take your screenshots)")
+
+        elif choice == '6':
+            from biographer.db_pool import close_pools
+            close_pools()
             print("\nGoodbye!")
             break
+
         else:
             print("Invalid choice, try again.")
 
@@ -0,0 +1,75 @@
+"""
+Content-addressable cache of synthesized, filtered speech.
+
+Keys are a SHA-256 over (voice, volume, text), so a prompt the biographer
+repeats ("Shall we continue?") plays from disk instead of going back to
+Edge TTS and through the decode/low-pass pipeline. Entries are WAV files;
+the least recently played are evicted once the cache passes MAX_BYTES.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+# One WAV file per key
+CACHE_DIR = Path(__file__).parent / "logs" / "tts_cache"
+
+# Total size kept on disk
+MAX_BYTES = 200 * 1024 * 1024
+
+
+def make_key(*parts: str) -> str:
+    """Hash the parts into a cache key (length-prefixed, as in extraction_cache)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode('utf-8')
+        digest.update(len(data).to_bytes(8, 'big'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def get(key: str) -> Optional[bytes]:
+    """Return the cached WAV bytes for key, or None on a miss."""
+    path = CACHE_DIR / f"{key}.wav"
+    try:
+        data = path.read_bytes()
+        # Mark as recently used for eviction
+        os.utime(path)
+        return data
+    except OSError:
+        return None
+
+
+def put(key: str, wav_data: bytes):
+    """Store wav_data under key, then evict old entries past MAX_BYTES."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Write then rename so a crash never leaves a half-written entry
+    path = CACHE_DIR / f"{key}.wav"
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_bytes(wav_data)
+    tmp_path.replace(path)
+
+    _evict()
+
+
+def _evict():
+    """Delete least recently used entries until the cache fits MAX_BYTES."""
+    entries = []
+    for path in CACHE_DIR.glob("*.wav"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= MAX_BYTES:
+            break
+        try:
+            path.unlink()
+            total -= size
+        except OSError:
+            pass
@@ -2,14 +2,58 @@
 
 import numpy as np
 import sounddevice as sd
-import whisper
 import tempfile
 import wave
 import os
 import time
-import queue
+import threading
 from typing import Optional, Callable
 
+# Prefer faster-whisper (CTranslate2 with int8 weights: ~4x faster on CPU,
+# half the memory), then whisper.cpp (quantized ggml weights, hand-tuned
+# CPU kernels); fall back to openai-whisper
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+try:
+    from pywhispercpp.model import Model as WhisperCppModel
+    WHISPER_CPP_AVAILABLE = True
+except ImportError:
+    WHISPER_CPP_AVAILABLE = False
+
+if not (FASTER_WHISPER_AVAILABLE or WHISPER_CPP_AVAILABLE):
+    import whisper
+
+# Optional: SIMD RMS without a squared copy of the buffer
+try:
+    import numpy_rms
+    NUMPY_RMS_AVAILABLE = True
+except ImportError:
+    NUMPY_RMS_AVAILABLE = False
+
+# Rate Whisper models expect; arrays must already be at it
+WHISPER_SAMPLE_RATE = 16000
+
+# Frames per audio callback: 1024 at 16 kHz is 64 ms, so a stop lands
+# within one short block
+DEFAULT_BLOCKSIZE = 1024
+
+# Longest single recording; audio past this is dropped (matches the
+# default listen timeout)
+MAX_RECORDING_SECONDS = 1800
+
+# While recording, each full window (Whisper's native 30 s) is transcribed
+# in the background, so stopping only leaves the tail. A window ends at
+# the quietest 100 ms in its last CUT_SEARCH_SECONDS so no word is split.
+STREAM_WINDOW_SECONDS = 30
+CUT_SEARCH_SECONDS = 2
+
+# Tail of the text so far passed as each window's prompt (~200 tokens)
+PROMPT_CONTEXT_CHARS = 800
+
 
 class VoiceInput:
     """Handles voice detection and speech-to-text transcription using simple audio levels."""
@@ -22,33 +66,89 @@ class VoiceInput:
         min_speech_duration: float = 0.5,  # minimum speech to be valid
         noise_threshold: float = 0.0002,  # audio level below this is considered silence
         on_transcription: Optional[Callable[[str], None]] = None,
+        blocksize: Optional[int] = DEFAULT_BLOCKSIZE,  # None: the input device's preferred size
     ):
         self.sample_rate = sample_rate
         self.silence_threshold = silence_threshold
         self.min_speech_duration = min_speech_duration
         self.noise_threshold = noise_threshold
         self.on_transcription = on_transcription
+        self.blocksize = blocksize or self._preferred_blocksize()
 
         print(f"Loading Whisper model ({whisper_model})...")
-        # Use in_memory=False for large models (medium, large) to avoid memory read errors
-        self.whisper_model = whisper.load_model(whisper_model, in_memory=False)
-
-        # Audio collection queue
-        self.audio_queue = queue.Queue()
+        if FASTER_WHISPER_AVAILABLE:
+            self.whisper_model = WhisperModel(whisper_model, device="auto", compute_type="int8")
+        elif WHISPER_CPP_AVAILABLE:
+            # Model names may carry a quantization suffix, e.g. "medium.en-q5_0"
+            self.whisper_model = WhisperCppModel(
+                whisper_model,
+                n_threads=os.cpu_count() or 1,
+                print_progress=False,
+                print_realtime=False
+            )
+        else:
+            # Use in_memory=False for large models (medium, large) to avoid memory read errors
+            self.whisper_model = whisper.load_model(whisper_model, in_memory=False)
+
+        # Recording buffer, preallocated for MAX_RECORDING_SECONDS. The audio
+        # callback copies each block in place, so there is no per-block
+        # queue traffic and no concatenate when recording stops
+        self._buf = np.empty(sample_rate * MAX_RECORDING_SECONDS, dtype=np.float32)
+        self._write_idx = 0
+        self._buf_lock = threading.Lock()
+
+        # Background transcription of the recording so far
+        self._stream_parts = []
+        self._stream_offset = 0
+        self._stream_stop = threading.Event()
         self.stop_flag = False
         self.is_recording = False  # Track if we're actively recording
 
+        self._warm_up()
+
         print("Voice input initialized (using simple audio level detection).")
 
+    def _warm_up(self):
+        """Run one second of silence through Whisper.
+
+        The first transcription pays one-off setup costs (lazy imports,
+        kernel selection, allocator growth); paying them here, while the
+        app is loading, keeps them out of the user's first answer.
+        """
+        try:
+            self._run_whisper(np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32))
+            print("Whisper model warmed up")
+        except Exception as e:
+            print(f"Whisper warm-up skipped: {e}")
+
+    def _preferred_blocksize(self) -> int:
+        """The input device's low-latency buffer in frames, as a power of two."""
+        try:
+            latency = sd.query_devices(kind='input')['default_low_input_latency']
+            frames = max(1, int(latency * self.sample_rate))
+            return 1 << round(np.log2(frames))
+        except Exception:
+            return DEFAULT_BLOCKSIZE
+
     def _audio_callback(self, indata, frames, time_info, status):
         """Called for each audio chunk - just collect, don't process."""
         if status and 'overflow' not in str(status).lower():
             print(f"Audio status: {status}")
-        self.audio_queue.put(indata[:, 0].copy())
+        with self._buf_lock:
+            start = self._write_idx
+            end = min(start + frames, len(self._buf))
+            self._buf[start:end] = indata[:end - start, 0]
+            self._write_idx = end
 
     def _get_audio_level(self, audio: np.ndarray) -> float:
         """Get the RMS audio level."""
-        return np.sqrt(np.mean(audio ** 2))
+        if audio.size == 0:
+            return 0.0
+        if NUMPY_RMS_AVAILABLE:
+            # rms() returns one value per row; a 1-D buffer gives a 1-element array
+            return float(numpy_rms.rms(np.ascontiguousarray(audio, dtype=np.float32))[0])
+        # einsum sums the squares in one pass, with no temporary array
+        return float(np.sqrt(np.einsum('i,i->', audio, audio) / audio.size))
 
     def _collect_until_stopped(self, timeout: float = 300.0) -> Optional[np.ndarray]:
         """Collect audio until stop() is called (manual mode - NO silence detection).
@@ -56,7 +156,6 @@ class VoiceInput:
         This is for use with a manual "I'm Done" button - we record everything
         until the user explicitly signals they're finished.
         """
-        all_audio = []
         last_status_time = time.time()
         start_time = time.time()
 
@@ -70,18 +169,16 @@ class VoiceInput:
                 print(f"  [DEBUG] TIMEOUT after {elapsed:.1f}s - this should NOT happen normally!")
                 break
 
-            try:
-                # Get audio chunk (blocks for up to 0.1s)
-                chunk = self.audio_queue.get(timeout=0.1)
-                all_audio.append(chunk)
+            if self._write_idx >= len(self._buf):
+                print(f"  Recording limit reached ({MAX_RECORDING_SECONDS / 60:.0f} minutes)")
+                break
 
-                # Status every 30 seconds to confirm still recording
-                if time.time() - last_status_time >= 30.0:
-                    print(f"  [{elapsed:.0f}s] Still recording... (stop_flag={self.stop_flag})")
-                    last_status_time = time.time()
+            time.sleep(0.1)
 
-            except queue.Empty:
-                continue
+            # Status every 30 seconds to confirm still recording
+            if time.time() - last_status_time >= 30.0:
+                print(f"  [{elapsed:.0f}s] Still recording... (stop_flag={self.stop_flag})")
+                last_status_time = time.time()
 
         # Log WHY we exited
         elapsed = time.time() - start_time
@@ -90,12 +187,14 @@ class VoiceInput:
         else:
             print(f"  [DEBUG] Loop exited: timeout after {elapsed:.1f}s")
 
-        if not all_audio:
+        with self._buf_lock:
+            collected = self._write_idx
+        if not collected:
             print("  [DEBUG] No audio collected!")
             return None
 
-        # Combine all audio
-        full_audio = np.concatenate(all_audio)
+        # A view of the recording buffer; it stays valid until the next listen
+        full_audio = self._buf[:collected]
         duration = len(full_audio) / self.sample_rate
 
         print(f"  Recording stopped - {duration:.1f}s of audio collected")
@@ -107,12 +206,85 @@ class VoiceInput:
 
         return full_audio
 
-    def _transcribe(self, audio: np.ndarray) -> str:
+    def _run_whisper(self, audio, prompt: Optional[str] = None) -> str:
+        """Transcribe a 16 kHz float32 array or an audio file path.
+
+        prompt is earlier text from the same recording, for context.
+        """
+        if FASTER_WHISPER_AVAILABLE:
+            segments, _ = self.whisper_model.transcribe(
+                audio,
+                language='en',
+                vad_filter=False,
+                beam_size=1,
+                initial_prompt=prompt
+            )
+            return "".join(segment.text for segment in segments).strip()
+
+        if WHISPER_CPP_AVAILABLE:
+            params = {'initial_prompt': prompt} if prompt else {}
+            segments = self.whisper_model.transcribe(audio, language='en', **params)
+            return "".join(segment.text for segment in segments).strip()
+
+        result = self.whisper_model.transcribe(
+            audio,
+            language='en',
+            fp16=False,
+            initial_prompt=prompt
+        )
+        return result['text'].strip()
+
+    def _find_cut(self, end: int) -> int:
+        """Buffer index at the quietest 100 ms in the CUT_SEARCH_SECONDS before end."""
+        frame = self.sample_rate // 10
+        start = max(0, end - int(CUT_SEARCH_SECONDS * self.sample_rate))
+        best_cut, best_level = end, None
+        for cut in range(start, end - frame + 1, frame):
+            level = self._get_audio_level(self._buf[cut:cut + frame])
+            if best_level is None or level <= best_level:
+                best_cut, best_level = cut + frame // 2, level
+        return best_cut
+
+    def _prompt(self) -> Optional[str]:
+        """The end of the text transcribed so far, or None before the first window."""
+        if not self._stream_parts:
+            return None
+        return " ".join(self._stream_parts)[-PROMPT_CONTEXT_CHARS:]
+
+    def _stream_transcribe(self):
+        """Transcribe each full window while recording continues (background thread).
+
+        Stops when _stream_stop is set; _stream_offset is then where the
+        untranscribed tail begins.
+        """
+        window = int(STREAM_WINDOW_SECONDS * self.sample_rate)
+        while not self._stream_stop.is_set():
+            if self._write_idx - self._stream_offset < window:
+                self._stream_stop.wait(0.5)
+                continue
+
+            end = self._find_cut(self._stream_offset + window)
+            try:
+                text = self._transcribe(self._buf[self._stream_offset:end], self._prompt())
+            except Exception as e:
+                # Leave the rest to be transcribed after stop()
+                print(f"  [ERROR] Background transcription failed: {e}")
+                return
+            if text:
+                self._stream_parts.append(text)
+            self._stream_offset = end
+
+    def _transcribe(self, audio: np.ndarray, prompt: Optional[str] = None) -> str:
         """Transcribe audio using Whisper."""
         duration = len(audio) / self.sample_rate
         print(f"\nProcessing {duration:.1f}s of audio...")
 
-        # Save to temp file
+        # Whisper works at 16 kHz: at that rate the samples go straight in,
+        # with no WAV encode/decode round trip through a temp file
+        if self.sample_rate == WHISPER_SAMPLE_RATE:
+            return self._run_whisper(np.ascontiguousarray(audio, dtype=np.float32), prompt)
+
+        # Any other rate: save to a temp file so Whisper resamples it on load
         with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
             temp_path = f.name
 
@@ -121,15 +293,12 @@ class VoiceInput:
                 wav_file.setnchannels(1)
                 wav_file.setsampwidth(2)
                 wav_file.setframerate(self.sample_rate)
-                audio_int16 = (audio * 32767).astype(np.int16)
+                # Scale and cast in one pass, straight into the int16 buffer
+                audio_int16 = np.empty(audio.shape, dtype=np.int16)
+                np.multiply(audio, 32767, out=audio_int16, casting='unsafe')
                 wav_file.writeframes(audio_int16.tobytes())
 
-            result = self.whisper_model.transcribe(
-                temp_path,
-                language='en',
-                fp16=False
-            )
-            return result['text'].strip()
+            return self._run_whisper(temp_path, prompt)
 
         finally:
             if os.path.exists(temp_path):
@@ -149,12 +318,12 @@ class VoiceInput:
         print(f"[DEBUG] stop_flag is now: {self.stop_flag}")
         print("="*60)
 
-        # Clear any old audio in queue
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Start writing at the top of the recording buffer
+        with self._buf_lock:
+            self._write_idx = 0
+        self._stream_parts = []
+        self._stream_offset = 0
+        self._stream_stop.clear()
 
         print("="*60)
         print("RECORDING... (waiting for 'I'm Done' button)")
@@ -168,14 +337,27 @@ class VoiceInput:
                 samplerate=self.sample_rate,
                 channels=1,
                 dtype='float32',
-                blocksize=4096,
+                blocksize=self.blocksize,
+                latency='low',
                 callback=self._audio_callback
             ):
                 print(f"[DEBUG] Audio stream started successfully")
-                audio = self._collect_until_stopped(timeout)
+                streamer = threading.Thread(target=self._stream_transcribe, daemon=True)
+                streamer.start()
+                try:
+                    audio = self._collect_until_stopped(timeout)
+                finally:
+                    # Let a window in progress finish
+                    self._stream_stop.set()
+                    streamer.join()
                 print(f"[DEBUG] _collect_until_stopped returned")
                 if audio is not None:
-                    result = self._transcribe(audio)
+                    # Earlier windows are already done; only the tail remains
+                    parts = list(self._stream_parts)
+                    tail = audio[self._stream_offset:]
+                    if len(tail):
+                        parts.append(self._transcribe(tail, self._prompt()))
+                    result = " ".join(part for part in parts if part)
 
         except Exception as e:
             print(f"[ERROR] Error during listening: {e}")
@@ -1,32 +1,57 @@
 """Voice output module using Edge TTS for natural-sounding neural voices."""
 
 import asyncio
-import tempfile
-import os
+import io
+import wave
 import numpy as np
 from typing import Optional
 from pathlib import Path
 import threading
 import queue
+from functools import lru_cache
 
+try:
+    from . import tts_cache
+except ImportError:
+    import tts_cache  # Run directly as a script
 
-def apply_lowpass_filter(audio_data: np.ndarray, sample_rate: int, cutoff_hz: int = 3000) -> np.ndarray:
-    """Apply a low-pass filter to reduce harshness in high frequencies."""
-    try:
-        from scipy.signal import butter, filtfilt
 
-        # Design a butterworth low-pass filter
-        nyquist = sample_rate / 2
-        normalized_cutoff = cutoff_hz / nyquist
+@lru_cache(maxsize=8)
+def _lowpass_sos(sample_rate: int, cutoff_hz: int):
+    """Butterworth low-pass design as second-order sections (None if cutoff >= Nyquist).
 
-        # Ensure cutoff is valid (must be < 1.0)
-        if normalized_cutoff >= 1.0:
-            return audio_data
+    Every utterance at the same rate uses the same filter, so designs are cached.
+    """
+    from scipy.signal import butter
+
+    nyquist = sample_rate / 2
+    normalized_cutoff = cutoff_hz / nyquist
+
+    # Ensure cutoff is valid (must be < 1.0)
+    if normalized_cutoff >= 1.0:
+        return None
+
+    # float32 coefficients keep float32 audio in float32 through the filter
+    return butter(4, normalized_cutoff, btype='low', output='sos').astype(np.float32)
+
+
+def apply_lowpass_filter(audio_data: np.ndarray, sample_rate: int, cutoff_hz: int = 3000,
+                         axis: int = -1) -> np.ndarray:
+    """Apply a low-pass filter to reduce harshness in high frequencies.
+
+    axis is the time axis; for (frames, channels) audio pass axis=0 to
+    filter every channel in one call.
+    """
+    try:
+        from scipy.signal import sosfiltfilt
 
-        b, a = butter(4, normalized_cutoff, btype='low')
+        sos = _lowpass_sos(sample_rate, cutoff_hz)
+        if sos is None:
+            return audio_data
 
-        # Apply filter (filtfilt for zero phase distortion)
-        filtered = filtfilt(b, a, audio_data)
+        # Apply filter (forward-backward for zero phase distortion); cascaded
+        # biquads stay numerically stable where the (b, a) form does not
+        filtered = sosfiltfilt(sos, audio_data, axis=axis)
         return filtered.astype(audio_data.dtype)
 
     except ImportError:
@@ -37,6 +62,63 @@ def apply_lowpass_filter(audio_data: np.ndarray, sample_rate: int, cutoff_hz: in
         return audio_data
 
 
+# Edge TTS always returns 24 kHz mono; a mixer opened in that format takes
+# the decoded samples as a raw buffer (see _make_sound)
+EDGE_TTS_SAMPLE_RATE = 24000
+
+# One event loop, on its own daemon thread, runs every synthesis
+_tts_loop: Optional[asyncio.AbstractEventLoop] = None
+_tts_loop_lock = threading.Lock()
+
+
+def _run_on_tts_loop(coro):
+    """Run coro on the shared TTS event loop and wait for its result."""
+    global _tts_loop
+    with _tts_loop_lock:
+        if _tts_loop is None:
+            _tts_loop = asyncio.new_event_loop()
+            threading.Thread(target=_tts_loop.run_forever, daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _tts_loop).result()
+
+
+async def _edge_tts_mp3(text: str, voice: str, volume_db: int) -> bytes:
+    """Synthesize text with Edge TTS, collecting the MP3 stream in memory."""
+    import edge_tts
+
+    communicate = edge_tts.Communicate(text, voice, volume=f"{volume_db:+d}%")
+    audio = bytearray()
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            audio.extend(chunk["data"])
+    return bytes(audio)
+
+
+def _make_sound(samples: np.ndarray, sample_rate: int, channels: int):
+    """Build a pygame Sound from int16 samples.
+
+    When the mixer already runs at the audio's rate and channel count the
+    samples go in as a raw buffer; otherwise they are wrapped in an
+    in-memory WAV so pygame converts them.
+    """
+    import pygame
+
+    if pygame.mixer.get_init() == (sample_rate, -16, channels):
+        return pygame.mixer.Sound(buffer=samples.tobytes())
+
+    return pygame.mixer.Sound(io.BytesIO(_to_wav(samples, sample_rate, channels)))
+
+
+def _to_wav(samples: np.ndarray, sample_rate: int, channels: int) -> bytes:
+    """Encode int16 samples as an in-memory WAV file."""
+    wav_buffer = io.BytesIO()
+    with wave.open(wav_buffer, 'wb') as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)  # 16-bit
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+    return wav_buffer.getvalue()
+
+
 class VoiceOutput:
     """Handles text-to-speech synthesis using Microsoft Edge TTS (neural voices)."""
 
@@ -48,6 +130,11 @@ class VoiceOutput:
         self.voice = voice
         self.volume = volume
         self.speech_queue = queue.Queue()
+        # Synthesized audio waiting to play; bounded so synthesis stays at
+        # most two sentences ahead of playback
+        self._playback_queue = queue.Queue(maxsize=2)
+        # Bumped by stop() so audio synthesized before it is skipped
+        self._generation = 0
         self.is_speaking = False
         self.stop_speaking = False
 
@@ -55,7 +142,7 @@ class VoiceOutput:
         try:
             import pygame
             # Pre-init with specific settings to avoid device issues
-            pygame.mixer.pre_init(frequency=24000, size=-16, channels=1, buffer=2048)
+            pygame.mixer.pre_init(frequency=EDGE_TTS_SAMPLE_RATE, size=-16, channels=1, buffer=2048)
             pygame.mixer.init()
             self._pygame_available = True
             print("pygame mixer initialized successfully")
@@ -64,57 +151,45 @@ class VoiceOutput:
             print("Will try pyttsx3 as fallback...")
             self._pygame_available = False
 
-        # Start the speech worker thread
+        # Start the speech worker threads: one synthesizes, one plays, so the
+        # next sentence is synthesized while the current one is playing
         self._worker_thread = threading.Thread(target=self._speech_worker, daemon=True)
         self._worker_thread.start()
+        self._playback_thread = threading.Thread(target=self._playback_worker, daemon=True)
+        self._playback_thread.start()
 
         print(f"Voice output initialized with Edge TTS voice: {voice} at {int(volume*100)}% volume")
 
-    async def _synthesize_edge_tts(self, text: str, temp_path: str) -> bool:
-        """Synthesize text to audio using Edge TTS."""
+    async def _synthesize_edge_tts(self, text: str) -> Optional[bytes]:
+        """Synthesize text to MP3 audio using Edge TTS."""
         try:
-            import edge_tts
-
             # Edge TTS volume is in dB, convert from 0-1 scale
             # -100dB is silent, 0dB is full volume
             # For 25% volume, we want significant reduction
             volume_db = int((self.volume - 1.0) * 50)  # 0.25 -> -37.5 dB
 
-            communicate = edge_tts.Communicate(text, self.voice, volume=f"{volume_db:+d}%")
-            await communicate.save(temp_path)
-            return True
+            return await _edge_tts_mp3(text, self.voice, volume_db)
 
         except Exception as e:
             print(f"Edge TTS synthesis error: {e}")
-            return False
-
-    def _synthesize_with_edge_tts(self, text: str) -> Optional[str]:
-        """Synthesize text and return path to audio file."""
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-            temp_path = f.name
+            return None
 
+    def _synthesize_with_edge_tts(self, text: str) -> Optional[bytes]:
+        """Synthesize text and return the MP3 audio (held in memory, no temp file)."""
         try:
-            # Run async synthesis
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            success = loop.run_until_complete(self._synthesize_edge_tts(text, temp_path))
-            loop.close()
-
-            if success and os.path.exists(temp_path) and os.path.getsize(temp_path) > 0:
-                return temp_path
-            else:
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-                return None
+            # Run async synthesis on the shared loop (no loop setup per utterance)
+            audio = _run_on_tts_loop(self._synthesize_edge_tts(text))
+            return audio or None
 
         except Exception as e:
             print(f"Synthesis error: {e}")
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
             return None
 
-    def _play_audio_file(self, audio_path: str):
-        """Play audio file through speakers using pygame, with low-pass filter."""
+    def _play_audio(self, mp3_data: bytes, cache_key: Optional[str] = None):
+        """Play MP3 audio through speakers using pygame, with low-pass filter.
+
+        With cache_key, the filtered audio is also stored in tts_cache.
+        """
         if not self._pygame_available:
             print("Cannot play audio: pygame not available")
             return
@@ -122,50 +197,31 @@ class VoiceOutput:
         try:
             import pygame
             from pydub import AudioSegment
-            import io
 
-            # Load MP3 and convert to raw audio for filtering
-            audio_segment = AudioSegment.from_mp3(audio_path)
+            # Decode MP3 to raw samples for filtering
+            audio_segment = AudioSegment.from_file(io.BytesIO(mp3_data), format='mp3')
             sample_rate = audio_segment.frame_rate
             samples = np.array(audio_segment.get_array_of_samples())
 
-            # Handle stereo
+            # Handle stereo: both channels are filtered in one call
             if audio_segment.channels == 2:
                 samples = samples.reshape((-1, 2))
-                # Apply filter to each channel
-                filtered_left = apply_lowpass_filter(samples[:, 0].astype(np.float64), sample_rate, 4000)
-                filtered_right = apply_lowpass_filter(samples[:, 1].astype(np.float64), sample_rate, 4000)
-                filtered = np.column_stack([filtered_left, filtered_right]).astype(np.int16)
-            else:
-                filtered = apply_lowpass_filter(samples.astype(np.float64), sample_rate, 4000).astype(np.int16)
-
-            # Convert back to AudioSegment
-            filtered_audio = AudioSegment(
-                filtered.tobytes(),
-                frame_rate=sample_rate,
-                sample_width=2,  # 16-bit
-                channels=audio_segment.channels
-            )
-
-            # Export to WAV in memory for pygame
-            wav_buffer = io.BytesIO()
-            filtered_audio.export(wav_buffer, format='wav')
-            wav_buffer.seek(0)
+            filtered = apply_lowpass_filter(samples.astype(np.float32), sample_rate, 4000, axis=0).astype(np.int16)
 
-            # Play with pygame
-            sound = pygame.mixer.Sound(wav_buffer)
-            sound.set_volume(self.volume)
-            channel = sound.play()
+            if cache_key:
+                try:
+                    tts_cache.put(cache_key, _to_wav(filtered, sample_rate, audio_segment.channels))
+                except OSError as e:
+                    print(f"TTS cache write failed: {e}")
 
-            # Wait for playback to complete
-            while channel.get_busy() and not self.stop_speaking:
-                pygame.time.wait(100)
+            # Play with pygame
+            self._play_sound(_make_sound(filtered, sample_rate, audio_segment.channels))
 
         except ImportError as e:
             # Fallback: play without filtering
             print(f"pydub not available, playing without filter: {e}")
             import pygame
-            pygame.mixer.music.load(audio_path)
+            pygame.mixer.music.load(io.BytesIO(mp3_data), 'mp3')
             pygame.mixer.music.set_volume(self.volume)
             pygame.mixer.music.play()
             while pygame.mixer.music.get_busy() and not self.stop_speaking:
@@ -174,35 +230,75 @@ class VoiceOutput:
         except Exception as e:
             print(f"Audio playback error: {e}")
 
-    def _speech_worker(self):
-        """Background worker to process speech queue."""
-        while True:
-            try:
-                text = self.speech_queue.get()
-                if text is None:
-                    break
+    def _play_wav(self, wav_data: bytes):
+        """Play already-filtered WAV audio (a tts_cache hit)."""
+        if not self._pygame_available:
+            print("Cannot play audio: pygame not available")
+            return
 
-                self.is_speaking = True
-                self.stop_speaking = False
+        try:
+            import pygame
+            self._play_sound(pygame.mixer.Sound(io.BytesIO(wav_data)))
+        except Exception as e:
+            print(f"Audio playback error: {e}")
 
-                # Synthesize with Edge TTS
-                audio_path = self._synthesize_with_edge_tts(text)
+    def _play_sound(self, sound):
+        """Play a pygame Sound at our volume and wait for it to finish."""
+        import pygame
 
-                if audio_path and not self.stop_speaking:
-                    self._play_audio_file(audio_path)
+        sound.set_volume(self.volume)
+        channel = sound.play()
 
-                    # Clean up temp file
-                    try:
-                        os.unlink(audio_path)
-                    except:
-                        pass
+        # Wait for playback to complete
+        while channel.get_busy() and not self.stop_speaking:
+            pygame.time.wait(100)
 
-                self.is_speaking = False
-                self.speech_queue.task_done()
+    def _speech_worker(self):
+        """Background worker that synthesizes the speech queue."""
+        while True:
+            text = self.speech_queue.get()
+            if text is None:
+                self._playback_queue.put(None)
+                break
+
+            self.is_speaking = True
+            generation = self._generation
+
+            # Repeated prompts play from the cache; others go to Edge TTS
+            cache_key = tts_cache.make_key(self.voice, str(self.volume), text)
+            cached_wav = tts_cache.get(cache_key)
+            audio = None
+            if cached_wav is None:
+                try:
+                    audio = self._synthesize_with_edge_tts(text)
+                except Exception as e:
+                    print(f"Speech worker error: {e}")
+
+            # Always hand over (even on failure) so the playback worker marks
+            # the item done; blocks while two sentences are already waiting
+            self._playback_queue.put((generation, cache_key, cached_wav, audio))
+
+    def _playback_worker(self):
+        """Background worker that plays synthesized audio in order."""
+        while True:
+            item = self._playback_queue.get()
+            if item is None:
+                break
 
+            generation, cache_key, cached_wav, audio = item
+            try:
+                # Skip audio synthesized before the last stop()
+                if generation == self._generation and (cached_wav or audio):
+                    self.stop_speaking = False
+                    if cached_wav:
+                        self._play_wav(cached_wav)
+                    else:
+                        self._play_audio(audio, cache_key)
             except Exception as e:
-                print(f"Speech worker error: {e}")
+                print(f"Playback worker error: {e}")
+            finally:
                 self.is_speaking = False
+                self.speech_queue.task_done()
 
     def speak(self, text: str, blocking: bool = True):
         """
@@ -226,6 +322,7 @@ class VoiceOutput:
 
     def stop(self):
         """Stop current speech."""
+        self._generation += 1
         self.stop_speaking = True
 
         if self._pygame_available:
@@ -252,6 +349,7 @@ class VoiceOutput:
         self.stop()
         self.speech_queue.put(None)
         self._worker_thread.join(timeout=2)
+        self._playback_thread.join(timeout=2)
 
         if self._pygame_available:
             try:
@@ -268,10 +366,10 @@ class SimpleTTS:
         self.volume = volume
         self.voice = voice
 
-        # Initialize pygame
+        # Initialize pygame in Edge TTS's format so playback skips the WAV wrap
         try:
             import pygame
-            pygame.mixer.init()
+            pygame.mixer.init(frequency=EDGE_TTS_SAMPLE_RATE, size=-16, channels=1)
             self._pygame_available = True
         except Exception as e:
             print(f"Warning: pygame not available: {e}")
@@ -285,65 +383,32 @@ class SimpleTTS:
             return
 
         try:
-            import edge_tts
             import pygame
             from pydub import AudioSegment
-            import io
-
-            # Create temp file for audio
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-                temp_path = f.name
 
             # Synthesize
             volume_db = int((self.volume - 1.0) * 50)
+            mp3_data = _run_on_tts_loop(_edge_tts_mp3(text, self.voice, volume_db))
 
-            async def synthesize():
-                communicate = edge_tts.Communicate(text, self.voice, volume=f"{volume_db:+d}%")
-                await communicate.save(temp_path)
-
-            asyncio.run(synthesize())
-
-            # Load, filter, and play
-            if self._pygame_available and os.path.exists(temp_path):
-                # Load MP3 and apply low-pass filter
-                audio_segment = AudioSegment.from_mp3(temp_path)
+            # Decode, filter, and play
+            if self._pygame_available and mp3_data:
+                audio_segment = AudioSegment.from_file(io.BytesIO(mp3_data), format='mp3')
                 sample_rate = audio_segment.frame_rate
                 samples = np.array(audio_segment.get_array_of_samples())
 
-                # Handle stereo
+                # Handle stereo: both channels are filtered in one call
                 if audio_segment.channels == 2:
                     samples = samples.reshape((-1, 2))
-                    filtered_left = apply_lowpass_filter(samples[:, 0].astype(np.float64), sample_rate, 4000)
-                    filtered_right = apply_lowpass_filter(samples[:, 1].astype(np.float64), sample_rate, 4000)
-                    filtered = np.column_stack([filtered_left, filtered_right]).astype(np.int16)
-                else:
-                    filtered = apply_lowpass_filter(samples.astype(np.float64), sample_rate, 4000).astype(np.int16)
-
-                # Convert back to AudioSegment
-                filtered_audio = AudioSegment(
-                    filtered.tobytes(),
-                    frame_rate=sample_rate,
-                    sample_width=2,
-                    channels=audio_segment.channels
-                )
-
-                # Export to WAV in memory
-                wav_buffer = io.BytesIO()
-                filtered_audio.export(wav_buffer, format='wav')
-                wav_buffer.seek(0)
+                filtered = apply_lowpass_filter(samples.astype(np.float32), sample_rate, 4000, axis=0).astype(np.int16)
 
                 # Play
-                sound = pygame.mixer.Sound(wav_buffer)
+                sound = _make_sound(filtered, sample_rate, audio_segment.channels)
                 sound.set_volume(self.volume)
                 channel = sound.play()
 
                 while channel.get_busy():
                     pygame.time.wait(100)
 
-            # Cleanup
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-
         except ImportError as e:
             print(f"Missing dependency for filtered audio: {e}")
             # Fallback without filter
@@ -354,31 +419,19 @@ class SimpleTTS:
     def _speak_unfiltered(self, text: str):
         """Fallback: speak without low-pass filter."""
         try:
-            import edge_tts
             import pygame
 
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-                temp_path = f.name
-
             volume_db = int((self.volume - 1.0) * 50)
+            mp3_data = _run_on_tts_loop(_edge_tts_mp3(text, self.voice, volume_db))
 
-            async def synthesize():
-                communicate = edge_tts.Communicate(text, self.voice, volume=f"{volume_db:+d}%")
-                await communicate.save(temp_path)
-
-            asyncio.run(synthesize())
-
-            if self._pygame_available and os.path.exists(temp_path):
-                pygame.mixer.music.load(temp_path)
+            if self._pygame_available and mp3_data:
+                pygame.mixer.music.load(io.BytesIO(mp3_data), 'mp3')
                 pygame.mixer.music.set_volume(self.volume)
                 pygame.mixer.music.play()
 
                 while pygame.mixer.music.get_busy():
                     pygame.time.wait(100)
 
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-
         except Exception as e:
             print(f"TTS error: {e}")
 
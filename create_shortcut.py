@@ -1,46 +1,84 @@
 """Create a desktop shortcut for VECTOR Biographer."""
 
 import os
+import struct
 import sys
+import uuid
 from pathlib import Path
 
+DESCRIPTION = "Start VECTOR Biographer - Voice-based life story capture"
+
+# ShellLinkHeader fields (MS-SHLLINK 2.1)
+LINK_CLSID = uuid.UUID("00021401-0000-0000-C000-000000000046")
+HAS_LINK_INFO = 0x02
+HAS_NAME = 0x04
+HAS_WORKING_DIR = 0x10
+IS_UNICODE = 0x80
+SW_SHOWNORMAL = 1
+DRIVE_FIXED = 3
+
+
 def create_shortcut():
-    """Create a desktop shortcut to START_BIOGRAPHER.bat"""
+    """Create a desktop shortcut to START_BIOGRAPHER.bat through IShellLink (pywin32)."""
     try:
-        import winshell
-        from win32com.client import Dispatch
+        import pythoncom
+        from win32com.shell import shell, shellcon
     except ImportError:
-        # Try to install winshell
-        print("Installing shortcut creation tools...")
-        os.system(f"{sys.executable} -m pip install winshell pywin32")
-        try:
-            import winshell
-            from win32com.client import Dispatch
-        except ImportError:
-            print("Could not install shortcut tools. Create shortcut manually.")
-            return False
+        print("pywin32 not available")
+        return False
 
     # Paths
     script_dir = Path(__file__).parent.resolve()
     batch_file = script_dir / "START_BIOGRAPHER.bat"
-    desktop = Path(winshell.desktop())
+    desktop = Path(shell.SHGetFolderPath(0, shellcon.CSIDL_DESKTOPDIRECTORY, None, 0))
     shortcut_path = desktop / "VECTOR Biographer.lnk"
 
     # Create shortcut
-    shell = Dispatch('WScript.Shell')
-    shortcut = shell.CreateShortCut(str(shortcut_path))
-    shortcut.Targetpath = str(batch_file)
-    shortcut.WorkingDirectory = str(script_dir)
-    shortcut.Description = "Start VECTOR Biographer - Voice-based life story capture"
-    shortcut.IconLocation = str(sys.executable)  # Python icon as fallback
-    shortcut.save()
+    link = pythoncom.CoCreateInstance(
+        shell.CLSID_ShellLink, None, pythoncom.CLSCTX_INPROC_SERVER, shell.IID_IShellLink
+    )
+    link.SetPath(str(batch_file))
+    link.SetWorkingDirectory(str(script_dir))
+    link.SetDescription(DESCRIPTION)
+    link.SetIconLocation(str(sys.executable), 0)  # Python icon as fallback
+    link.QueryInterface(pythoncom.IID_IPersistFile).Save(str(shortcut_path), 0)
 
     print(f"Desktop shortcut created: {shortcut_path}")
     return True
 
 
-def create_shortcut_vbs_fallback():
-    """Fallback: create shortcut using VBScript (no extra dependencies)."""
+def _link_info(target: str) -> bytes:
+    """LinkInfo structure pointing at a local path (MS-SHLLINK 2.3)."""
+    header_size = 0x24  # Includes the Unicode path offsets
+    volume_id = struct.pack('<IIII', 0x11, DRIVE_FIXED, 0, 0x10) + b'\0'
+    base_path = target.encode('mbcs' if os.name == 'nt' else 'latin-1', 'replace') + b'\0'
+    suffix = b'\0'
+    base_path_unicode = (target + '\0').encode('utf-16-le')
+    suffix_unicode = '\0'.encode('utf-16-le')
+
+    volume_id_offset = header_size
+    base_path_offset = volume_id_offset + len(volume_id)
+    suffix_offset = base_path_offset + len(base_path)
+    base_path_unicode_offset = suffix_offset + len(suffix)
+    suffix_unicode_offset = base_path_unicode_offset + len(base_path_unicode)
+    size = suffix_unicode_offset + len(suffix_unicode)
+
+    header = struct.pack(
+        '<IIIIIIIII',
+        size, header_size, 0x1,  # VolumeIDAndLocalBasePath
+        volume_id_offset, base_path_offset, 0, suffix_offset,
+        base_path_unicode_offset, suffix_unicode_offset,
+    )
+    return header + volume_id + base_path + suffix + base_path_unicode + suffix_unicode
+
+
+def _string_data(value: str) -> bytes:
+    """Counted UTF-16 StringData entry (MS-SHLLINK 2.4)."""
+    return struct.pack('<H', len(value)) + value.encode('utf-16-le')
+
+
+def create_shortcut_lnk_fallback():
+    """Fallback: write the .lnk file directly (no extra dependencies, no subprocess)."""
     script_dir = Path(__file__).parent.resolve()
     batch_file = script_dir / "START_BIOGRAPHER.bat"
 
@@ -51,32 +89,33 @@ def create_shortcut_vbs_fallback():
 
     shortcut_path = desktop / "VECTOR Biographer.lnk"
 
-    # Create VBScript to make shortcut
-    vbs_content = f'''
-Set oWS = WScript.CreateObject("WScript.Shell")
-sLinkFile = "{shortcut_path}"
-Set oLink = oWS.CreateShortcut(sLinkFile)
-oLink.TargetPath = "{batch_file}"
-oLink.WorkingDirectory = "{script_dir}"
-oLink.Description = "Start VECTOR Biographer"
-oLink.Save
-'''
-
-    vbs_path = script_dir / "make_shortcut.vbs"
-    vbs_path.write_text(vbs_content)
+    header = struct.pack(
+        '<I16sIIQQQIiIHHII',
+        0x4C, LINK_CLSID.bytes_le,
+        HAS_LINK_INFO | HAS_NAME | HAS_WORKING_DIR | IS_UNICODE,
+        0, 0, 0, 0,  # Attributes and times are filled in by the shell on use
+        0, 0, SW_SHOWNORMAL, 0, 0, 0, 0,
+    )
+    data = (
+        header
+        + _link_info(str(batch_file))
+        + _string_data(DESCRIPTION)
+        + _string_data(str(script_dir))
+        + struct.pack('<I', 0)  # TerminalBlock
+    )
 
-    # Run VBScript
-    os.system(f'cscript //nologo "{vbs_path}"')
-    vbs_path.unlink()  # Clean up
+    try:
+        shortcut_path.write_bytes(data)
+    except OSError as e:
+        print(f"Could not write shortcut: {e}")
+        return False
 
-    if shortcut_path.exists():
-        print(f"Desktop shortcut created: {shortcut_path}")
-        return True
-    return False
+    print(f"Desktop shortcut created: {shortcut_path}")
+    return True
 
 
 if __name__ == "__main__":
-    # Try winshell method first, fall back to VBScript
+    # Try IShellLink first, fall back to writing the .lnk directly
     try:
         success = create_shortcut()
     except Exception as e:
@@ -85,7 +124,7 @@ if __name__ == "__main__":
 
     if not success:
         print("Trying fallback method...")
-        success = create_shortcut_vbs_fallback()
+        success = create_shortcut_lnk_fallback()
 
     if not success:
         print("\nCould not create shortcut automatically.")